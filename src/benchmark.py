@@ -0,0 +1,837 @@
+import argparse
+import os
+import random
+import time
+
+from game.board import Board
+from game.alphabetaAI import AlphaBetaAI
+from game.pattern_eval import WEIGHTS_FILE
+from game.probcut import PROBCUT_FILE
+from game.time_manager import TimeManager
+from game.tuning import TUNING_FILE, HISTORY_FILE
+from utils.constants import BOARD_SIZE, DIRECTIONS
+
+# Jalankan dari folder src:  python benchmark.py board
+
+
+# --- BOARD LAMA (list-of-lists) SEBAGAI PEMBANDING ---
+class LegacyBoard:
+    def __init__(self, size=BOARD_SIZE):
+        self.size = size
+        self.board = [[None for _ in range(size)] for _ in range(size)]
+        mid = size // 2
+        self.board[mid-1][mid-1] = 'W'
+        self.board[mid][mid] = 'W'
+        self.board[mid-1][mid] = 'B'
+        self.board[mid][mid-1] = 'B'
+        self.current_player = 'B'
+
+    @classmethod
+    def from_board(cls, board):
+        legacy = cls(board.size)
+        legacy.board = [row[:] for row in board.board]
+        legacy.current_player = board.current_player
+        return legacy
+
+    def copy(self):
+        new_board = LegacyBoard.__new__(LegacyBoard)
+        new_board.size = self.size
+        new_board.board = [row[:] for row in self.board]
+        new_board.current_player = self.current_player
+        return new_board
+
+    def is_valid_move(self, row, col, player):
+        if self.board[row][col] is not None:
+            return False
+        opponent = 'W' if player == 'B' else 'B'
+        for dr, dc in DIRECTIONS:
+            r, c = row + dr, col + dc
+            found_opponent = False
+            while 0 <= r < self.size and 0 <= c < self.size:
+                if self.board[r][c] == opponent:
+                    found_opponent = True
+                elif self.board[r][c] == player:
+                    if found_opponent:
+                        return True
+                    break
+                else:
+                    break
+                r += dr
+                c += dc
+        return False
+
+    def make_move(self, row, col, player):
+        if not self.is_valid_move(row, col, player):
+            return False
+        self.board[row][col] = player
+        opponent = 'W' if player == 'B' else 'B'
+        for dr, dc in DIRECTIONS:
+            r, c = row + dr, col + dc
+            to_flip = []
+            while 0 <= r < self.size and 0 <= c < self.size:
+                if self.board[r][c] == opponent:
+                    to_flip.append((r, c))
+                elif self.board[r][c] == player:
+                    for flip_r, flip_c in to_flip:
+                        self.board[flip_r][flip_c] = player
+                    break
+                else:
+                    break
+                r += dr
+                c += dc
+        return True
+
+    def get_valid_moves(self, player):
+        return [(r, c) for r in range(self.size) for c in range(self.size) if self.is_valid_move(r, c, player)]
+
+    def get_score(self):
+        black = sum(row.count('B') for row in self.board)
+        white = sum(row.count('W') for row in self.board)
+        return black, white
+
+    def is_game_over(self):
+        if not self.get_valid_moves('B') and not self.get_valid_moves('W'):
+            return True
+        return all(cell is not None for row in self.board for cell in row)
+
+
+# --- POSISI UJI (hasil random playout dengan seed tetap) ---
+def make_positions(count=6, plies=(8, 20, 36), seed=2024, size=BOARD_SIZE):
+    rng = random.Random(seed)
+    positions = []
+    # Ply diskalakan ke ukuran papan agar fase permainannya setara
+    plies = [p * size * size // 64 for p in plies]
+    while len(positions) < count:
+        target = plies[len(positions) % len(plies)]
+        board = Board(size)
+        player = 'B'
+        for _ in range(target):
+            moves = board.get_valid_moves(player)
+            if moves:
+                board.make_move(*rng.choice(moves), player)
+            player = 'W' if player == 'B' else 'B'
+        board.current_player = player
+        if not board.is_game_over():
+            positions.append(board)
+    return positions
+
+
+# Alpha-beta sederhana yang hanya memakai API publik lama (copy/get_valid_moves/make_move),
+# sehingga board lama dan bitboard menjalankan pencarian yang persis sama.
+def plain_search(board, depth, alpha, beta, player, root_player, counter):
+    counter[0] += 1
+    if depth == 0 or board.is_game_over():
+        black, white = board.get_score()
+        return black - white if root_player == 'B' else white - black
+    opponent = 'W' if player == 'B' else 'B'
+    moves = board.get_valid_moves(player)
+    if not moves:
+        return plain_search(board, depth - 1, alpha, beta, opponent, root_player, counter)
+    maximizing = player == root_player
+    value = float('-inf') if maximizing else float('inf')
+    for move in moves:
+        child = board.copy()
+        child.make_move(move[0], move[1], player)
+        score = plain_search(child, depth - 1, alpha, beta, opponent, root_player, counter)
+        if maximizing:
+            value = max(value, score)
+            alpha = max(alpha, value)
+        else:
+            value = min(value, score)
+            beta = min(beta, value)
+        if beta <= alpha: break
+    return value
+
+
+def bench_board(args):
+    positions = make_positions(size=args.size)
+    print(f"Plain alpha-beta depth {args.depth} pada {len(positions)} posisi {args.size}x{args.size}")
+    results = {}
+    for name, convert in (("list", LegacyBoard.from_board), ("bitboard", lambda b: b.copy())):
+        counter = [0]
+        start = time.perf_counter()
+        for pos in positions:
+            board = convert(pos)
+            plain_search(board, args.depth, float('-inf'), float('inf'),
+                         board.current_player, board.current_player, counter)
+        elapsed = time.perf_counter() - start
+        results[name] = counter[0] / elapsed
+        print(f"  {name:<9} nodes={counter[0]:>8}  time={elapsed:7.3f}s  nps={results[name]:>10.0f}")
+    print(f"  speedup   x{results['bitboard'] / results['list']:.2f}")
+
+    ai = AlphaBetaAI(depth=args.depth)
+    nodes = 0
+    start = time.perf_counter()
+    for pos in positions:
+        ai.get_move(pos.copy(), pos.current_player)
+        nodes += ai.node_count
+    elapsed = time.perf_counter() - start
+    print(f"AlphaBetaAI depth {args.depth}: nodes={nodes}  time={elapsed:.3f}s  nps={nodes / elapsed:.0f}")
+
+
+def bench_search(args):
+    positions = make_positions(count=args.positions)
+    modes = (("alphabeta", {'pvs': False}), ("pvs", {'pvs': True}))
+    print(f"Fixed depth {args.depth} pada {len(positions)} posisi")
+    for name, kwargs in modes:
+        ai = AlphaBetaAI(depth=args.depth, **kwargs)
+        nodes = 0
+        start = time.perf_counter()
+        for pos in positions:
+            ai.new_game()
+            ai.get_move(pos.copy(), pos.current_player)
+            nodes += ai.node_count
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<10} nodes={nodes:>8}  time={elapsed:7.3f}s")
+
+    print(f"Time limit {args.time}s per langkah")
+    for name, kwargs in modes:
+        ai = AlphaBetaAI(time_limit=args.time, **kwargs)
+        depths = []
+        for pos in positions:
+            ai.new_game()
+            ai.get_move(pos.copy(), pos.current_player)
+            depths.append(ai.last_stats['depth'])
+        print(f"  {name:<10} avg depth={sum(depths) / len(depths):5.2f}  depths={depths}")
+
+
+def bench_parallel(args):
+    positions = make_positions(count=args.positions)
+    print(f"AlphaBetaAI paralel: depth {args.depth} & time limit {args.time}s pada {len(positions)} posisi")
+    base_time = None
+    for workers in args.workers:
+        ai = AlphaBetaAI(depth=args.depth, workers=workers)
+        # Satu langkah pemanasan agar biaya start pool tidak ikut terukur
+        ai.get_move(positions[0].copy(), positions[0].current_player)
+        nodes = 0
+        start = time.perf_counter()
+        for pos in positions:
+            ai.new_game()
+            ai.get_move(pos.copy(), pos.current_player)
+            nodes += ai.node_count
+        elapsed = time.perf_counter() - start
+        base_time = base_time or elapsed
+
+        ai.time_limit = args.time
+        ai.time_manager = TimeManager(move_time=args.time)
+        depths = []
+        for pos in positions:
+            ai.new_game()
+            ai.get_move(pos.copy(), pos.current_player)
+            depths.append(ai.last_stats['depth'])
+        ai.close()
+        print(f"  workers={workers:<3} nodes={nodes:>8}  time={elapsed:7.3f}s  speedup x{base_time / elapsed:.2f}"
+              f"  avg depth={sum(depths) / len(depths):5.2f}")
+
+
+def bench_clock(args):
+    # Satu game AlphaBeta vs AlphaBeta dengan jam per game; cetak log waktu tiap langkah
+    ais = {p: AlphaBetaAI(time_manager=TimeManager(total_time=args.game_time, move_time=args.move_time))
+           for p in ('B', 'W')}
+    board = Board()
+    print(f"Jam {args.game_time}s per pemain")
+    print("  pemain  langkah  kosong  legal  fase   soft    hard    pakai   depth  sisa")
+    while not board.is_game_over():
+        player = board.current_player
+        ai = ais[player]
+        move = ai.get_move(board.copy(), player)
+        if move:
+            board.make_move(move[0], move[1], player)
+            entry = ai.time_manager.log[-1]
+            print(f"  {player:<6}  {entry['move']:>7}  {entry['empties']:>6}  {entry['legal_moves']:>5}  "
+                  f"{entry['phase']:<5} {entry['soft']:6.2f}  {entry['hard']:6.2f}  {entry['used']:6.2f}  "
+                  f"{entry['depth']:>5}  {entry['remaining']:6.2f}")
+        board.pass_turn()
+    black, white = board.get_score()
+    print(f"Skor akhir B={black} W={white}")
+
+
+def bench_probcut_fit(args):
+    from game.probcut import fit_params, save_params
+
+    print(f"Fit ProbCut: {args.games} game self-play acak, depth dalam <= {args.max_depth}")
+    start = time.perf_counter()
+    params = fit_params(games=args.games, max_depth=args.max_depth, seed=args.seed,
+                        progress=lambda done, total: print(f"  game {done}/{total}  {time.perf_counter() - start:7.1f}s"))
+    for key, depths in params.items():
+        print(f"  evaluator {key}")
+        for depth, checks in sorted(depths.items()):
+            for shallow, a, b, sigma in checks:
+                print(f"    depth {depth} <- {shallow}:  a={a:7.4f}  b={b:8.2f}  sigma={sigma:8.2f}")
+    save_params(params, args.output)
+    print(f"Disimpan ke {os.path.normpath(args.output)}")
+
+
+def play_match(black, white, board_size=BOARD_SIZE, board=None):
+    board = board.copy() if board is not None else Board(board_size)
+    ais = {'B': black, 'W': white}
+    for ai in ais.values():
+        ai.new_game()
+    while not board.is_game_over():
+        player = board.current_player
+        move = ais[player].get_move(board.copy(), player)
+        if move:
+            board.make_move(move[0], move[1], player)
+        board.pass_turn()
+    return board.get_score()
+
+
+def bench_selective(args):
+    # Depth yang dicapai (time limit sama) vs kekuatan: match melawan engine full-width
+    positions = make_positions(count=args.positions)
+    modes = (("full", {}), ("probcut", {'probcut': True}), ("lmr", {'lmr': True}),
+             ("probcut+lmr", {'probcut': True, 'lmr': True}))
+    print(f"Time limit {args.time}s per langkah, {len(positions)} posisi, {args.games} game per mode")
+    for name, kwargs in modes:
+        ai = AlphaBetaAI(time_limit=args.time, **kwargs)
+        depths = []
+        for pos in positions:
+            ai.new_game()
+            ai.get_move(pos.copy(), pos.current_player)
+            depths.append(ai.last_stats['depth'])
+        line = f"  {name:<12} avg depth={sum(depths) / len(depths):5.2f}"
+        if kwargs:
+            # Warna bergantian; skor = selisih bidak dari sudut pandang engine selektif
+            wins = draws = disc_diff = 0
+            for game in range(args.games):
+                selective = AlphaBetaAI(time_limit=args.time, **kwargs)
+                full = AlphaBetaAI(time_limit=args.time)
+                if game % 2 == 0:
+                    own, opp = play_match(selective, full)
+                else:
+                    opp, own = play_match(full, selective)
+                wins += own > opp
+                draws += own == opp
+                disc_diff += own - opp
+            line += f"  vs full: W{wins} D{draws} L{args.games - wins - draws}  selisih bidak {disc_diff:+d}"
+            stats = ai.last_stats
+            line += "".join(f"  {key}={stats[key]}" for key in
+                            ('probcut_tries', 'probcut_cuts', 'lmr_reductions', 'lmr_researches') if key in stats)
+        print(line)
+
+
+def bench_pattern_fit(args):
+    from game.pattern_eval import generate_positions, fit_evaluator
+
+    print(f"Self-play {args.games} game (depth {args.depth}, main sempurna dari {args.solve_empties} petak kosong)")
+    start = time.perf_counter()
+
+    def report(done, total):
+        if done % 500 == 0 or done == total:
+            print(f"  game {done}/{total}  {time.perf_counter() - start:7.1f}s")
+
+    positions = generate_positions(games=args.games, depth=args.depth, solve_empties=args.solve_empties,
+                                   seed=args.seed, progress=report)
+    print(f"Fit {len(positions)} posisi (x2 warna ditukar), l2={args.l2}")
+    evaluator, errors = fit_evaluator(positions, l2=args.l2, iterations=args.iterations)
+    for stage, (count, error) in enumerate(errors):
+        print(f"  fase {stage}  posisi={count:>8}  RMS={error:6.2f} bidak  mobility={evaluator.mobility[stage]}")
+    evaluator.save(args.output)
+    print(f"Disimpan ke {os.path.normpath(args.output)}  ({time.perf_counter() - start:.1f}s)")
+
+
+def bench_pattern(args):
+    from game.base_ai import BaseAI
+    from game.pattern_eval import get_evaluator
+
+    if get_evaluator() is None:
+        print("File bobot pola belum ada, jalankan dulu: python benchmark.py pattern-fit")
+        return
+    # Biaya per leaf: cache legal mask & grid dikosongkan seperti setelah make_move di pencarian
+    positions = make_positions(count=200, plies=(10, 20, 30, 40, 50))
+    print(f"Evaluasi per leaf ({len(positions)} posisi x {args.repeat})")
+    for name, flag in (("heuristik", False), ("pola", True)):
+        ai = BaseAI()
+        ai.use_pattern_eval = flag
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for board in positions:
+                board._cache = None
+                board._grid = None
+                ai._evaluate_board_advanced(board, board.current_player)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<10} {elapsed / (args.repeat * len(positions)) * 1e6:7.2f} us/eval")
+
+    # Kekuatan: setiap pembukaan acak dimainkan dua kali dengan warna ditukar
+    openings = make_positions(count=(args.games + 1) // 2, plies=(8,), seed=args.seed)
+    wins = draws = disc_diff = games = 0
+    depths = {True: [], False: []}
+    for opening in openings:
+        for pattern_black in (True, False):
+            ais = {}
+            for flag in (True, False):
+                ais[flag] = AlphaBetaAI(time_limit=args.time)
+                ais[flag].use_pattern_eval = flag
+            if pattern_black:
+                own, opp = play_match(ais[True], ais[False], board=opening)
+            else:
+                opp, own = play_match(ais[False], ais[True], board=opening)
+            for flag, ai in ais.items():
+                depths[flag] += [entry['depth'] for entry in ai.time_manager.log]
+            wins += own > opp
+            draws += own == opp
+            disc_diff += own - opp
+            games += 1
+    print(f"Pola vs heuristik, {args.time}s per langkah, {games} game: "
+          f"W{wins} D{draws} L{games - wins - draws}  selisih bidak {disc_diff:+d}")
+    print(f"  avg depth: pola={sum(depths[True]) / len(depths[True]):5.2f}  "
+          f"heuristik={sum(depths[False]) / len(depths[False]):5.2f}")
+
+
+# Biaya per leaf di pencarian: make_move -> evaluasi -> undo_move untuk setiap langkah legal,
+# dengan suku evaluasi dihitung dari nol (papan biasa) vs dilacak incremental (track_eval)
+def bench_incremental(args):
+    from game.base_ai import BaseAI
+
+    positions = make_positions(count=200, plies=(10, 20, 30, 40, 50))
+    leaves = sum(len(board.generate_moves(board.current_player)) for board in positions)
+    print(f"make + eval + undo ({leaves} leaf x {args.repeat})")
+    for name, flag in (("heuristik", False), ("pola", True)):
+        ai = BaseAI()
+        ai.use_pattern_eval = flag
+        for mode in ("dari nol", "incremental"):
+            boards = [board.copy() if mode == "dari nol" else ai._search_board(board) for board in positions]
+            evaluate = ai._evaluate_board_advanced
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                for board in boards:
+                    player = board.current_player
+                    for (r, c), flips in board.generate_moves(player):
+                        undo = board.make_move(r, c, player, flips)
+                        evaluate(board, player)
+                        board.undo_move(undo)
+            elapsed = time.perf_counter() - start
+            print(f"  {name:<10} {mode:<12} {elapsed / (args.repeat * leaves) * 1e6:7.2f} us/leaf")
+
+
+# Hitungan stabil lama BaseAI (run dari pojok sepanjang dua tepi) sebagai pembanding
+def legacy_stable_count(board, player):
+    stable = 0
+    size = board.size
+    grid = board.board
+    for r, c in board.geometry.corners:
+        if grid[r][c] == player:
+            stable += 1
+            dx = 1 if c == 0 else -1
+            for i in range(1, size - 1):
+                if 0 <= c + i*dx < size and grid[r][c + i*dx] == player: stable += 1
+                else: break
+            dy = 1 if r == 0 else -1
+            for i in range(1, size - 1):
+                if 0 <= r + i*dy < size and grid[r + i*dy][c] == player: stable += 1
+                else: break
+    return stable
+
+
+def bench_stability(args):
+    from game.stability import get_stability, reference_stable
+
+    # 1. Verifikasi vs brute force: posisi acak dengan sedikit petak kosong
+    rng = random.Random(args.seed)
+    table = get_stability(Board(args.size).geometry)
+    edges = table.edges
+    checked = found = exact = legacy_over = 0
+    while checked < args.positions:
+        board = Board(args.size)
+        player = 'B'
+        while board.empty_count > args.empties and not board.is_game_over():
+            moves = board.get_valid_moves(player)
+            if moves:
+                board.make_move(*rng.choice(moves), player)
+            player = 'W' if player == 'B' else 'B'
+        if board.empty_count != args.empties:
+            continue
+        reference = reference_stable(board.geometry, board.black, board.white)
+        for player in ('B', 'W'):
+            own, opp = board.get_discs(player)
+            stable = table.stable_discs(own, opp)
+            truth = reference & own
+            assert not stable & ~truth, f"Bidak tidak stabil dihitung stabil: {board.black:#x} {board.white:#x}"
+            assert stable & edges == truth & edges, f"Tepi tidak eksak: {board.black:#x} {board.white:#x}"
+            found += stable.bit_count()
+            exact += truth.bit_count()
+            legacy_over += max(0, legacy_stable_count(board, player) - truth.bit_count())
+        checked += 1
+    print(f"{checked} posisi {args.size}x{args.size}, {args.empties} petak kosong: tidak ada false positive, tepi eksak")
+    print(f"  stabil ditemukan {found}/{exact} ({found / exact:.1%})  "
+          f"hitungan lama berlebih {legacy_over} bidak")
+
+    # 2. Biaya per panggilan di posisi midgame. Kedua versi diukur bergantian per putaran dan
+    # diambil putaran tercepat, agar gangguan mesin tidak memihak salah satu.
+    positions = make_positions(count=200, plies=(10, 20, 30, 40, 50), size=args.size)
+    versions = (("lama", lambda board, player: legacy_stable_count(board, player)),
+                ("baru", lambda board, player: table.count_stable(*board.get_discs(player))))
+    best = {}
+    for _ in range(args.repeat):
+        for name, count in versions:
+            start = time.perf_counter()
+            for board in positions:
+                board._grid = None
+                count(board, 'B')
+            elapsed = time.perf_counter() - start
+            best[name] = min(best.get(name, elapsed), elapsed)
+    for name, _ in versions:
+        print(f"  {name:<5} {best[name] / len(positions) * 1e6:7.2f} us/panggilan (putaran tercepat dari {args.repeat})")
+
+
+def bench_endgame(args):
+    from game.endgame import EndgameSolver, reference_score
+
+    # Verifikasi solver vs negamax brute force: skor root eksak dan langkah yang dipilih
+    # memang mencapai skor itu. Posisi acak dengan 1..max_empties petak kosong (termasuk pass).
+    rng = random.Random(args.seed)
+    geometry = Board(args.size).geometry
+    checked = passes = nodes = 0
+    start = time.perf_counter()
+    while checked < args.positions:
+        empties = 1 + checked % args.max_empties
+        board = Board(args.size)
+        player = 'B'
+        while board.empty_count > empties and not board.is_game_over():
+            moves = board.get_valid_moves(player)
+            if moves:
+                board.make_move(*rng.choice(moves), player)
+            player = 'W' if player == 'B' else 'B'
+        if board.empty_count != empties or board.is_game_over():
+            continue
+        own, opp = board.get_discs(player)
+        solver = EndgameSolver(geometry)
+        move, score = solver.solve_root(own, opp)
+        nodes += solver.nodes
+        truth = reference_score(geometry, own, opp)
+        assert score == truth, f"Skor solver {score} != brute force {truth}: {board.black:#x} {board.white:#x} {player}"
+        if move is None:
+            assert not geometry.legal_mask(own, opp), f"Solver pass padahal ada langkah: {board.black:#x} {board.white:#x}"
+            passes += 1
+        else:
+            bit = geometry.square_bit(*move)
+            flips = geometry.flip_mask(own, opp, bit)
+            assert flips, f"Langkah solver {move} tidak legal: {board.black:#x} {board.white:#x} {player}"
+            child = -reference_score(geometry, opp ^ flips, own | bit | flips)
+            assert child == truth, f"Langkah solver {move} skor {child} != {truth}: {board.black:#x} {board.white:#x}"
+        checked += 1
+    print(f"{checked} posisi {args.size}x{args.size}, 1..{args.max_empties} petak kosong ({passes} pass di root): "
+          f"skor & langkah solver cocok dengan brute force  ({nodes} node solver, "
+          f"{time.perf_counter() - start:.1f}s)")
+
+
+def bench_pass(args):
+    from game.minmaxAI import MinimaxAI
+    from game.mctsAI import MonteCarloAI
+
+    # Regresi: posisi (dari game acak) di mana pemain yang jalan tidak punya langkah tapi game
+    # belum selesai. Setiap engine harus mengembalikan None (pass) tanpa error.
+    rng = random.Random(args.seed)
+    positions = []
+    while len(positions) < args.positions:
+        board = Board(args.size)
+        player = 'B'
+        while not board.is_game_over():
+            moves = board.get_valid_moves(player)
+            if not moves:
+                passed = board.copy()
+                passed.current_player = player
+                positions.append(passed)
+            else:
+                board.make_move(*rng.choice(moves), player)
+            player = 'W' if player == 'B' else 'B'
+    positions = positions[:args.positions]
+    engines = (
+        ("minimax", lambda: MinimaxAI(depth=2)),
+        ("alphabeta", lambda: AlphaBetaAI(depth=3)),
+        ("mcts (waktu)", lambda: MonteCarloAI(time_limit=0.05)),
+        ("mcts (iterasi)", lambda: MonteCarloAI(time_limit=None, iterations=50)),
+        ("mcts tanpa solver", lambda: MonteCarloAI(time_limit=0.05, endgame_empties=0)),
+    )
+    for name, make in engines:
+        for board in positions:
+            ai = make()
+            move = ai.get_move(board.copy(), board.current_player)
+            assert move is None, f"{name}: {move} padahal harus pass: {board.black:#x} {board.white:#x} {board.current_player}"
+        print(f"  {name:<18} {len(positions)} posisi pass: OK")
+
+
+def bench_tune(args):
+    from game import tuning
+
+    start = time.perf_counter()
+
+    def report(done, total):
+        if done % 500 == 0 or done == total:
+            print(f"  {done}/{total}  {time.perf_counter() - start:7.1f}s")
+
+    if args.load:
+        positions = tuning.load_positions(args.load)
+        print(f"{len(positions)} posisi dari {args.load}")
+    elif args.source == "history":
+        print(f"Game tersimpan {os.path.normpath(args.history)} ({args.size}x{args.size}, "
+              f"eksak dari {args.solve_empties} petak kosong)")
+        positions = tuning.history_positions(args.history, size=args.size, solve_empties=args.solve_empties,
+                                             progress=report)
+    else:
+        print(f"Self-play {args.games} game {args.size}x{args.size} (depth {args.depth}, "
+              f"main sempurna dari {args.solve_empties} petak kosong)")
+        positions = tuning.selfplay_positions(games=args.games, size=args.size, depth=args.depth,
+                                              solve_empties=args.solve_empties, seed=args.seed, progress=report)
+    if args.search_depth:
+        print(f"Label pencarian depth {args.search_depth} untuk posisi > {args.solve_empties} petak kosong")
+        positions = tuning.search_labels(positions, size=args.size, depth=args.search_depth,
+                                         solve_empties=args.solve_empties)
+    if args.save:
+        tuning.save_positions(args.save, positions)
+        print(f"Posisi disimpan ke {args.save}")
+    if not positions:
+        print("Tidak ada posisi untuk di-fit")
+        return
+
+    fit_start = time.perf_counter()
+    weights, errors = tuning.fit_weights(positions, size=args.size, l2=args.l2)
+    print(f"Fit {len(positions)} posisi dalam {time.perf_counter() - fit_start:.1f}s, l2={args.l2}")
+    for phase, (count, error) in zip(tuning.PHASES, errors):
+        squares, mobility, stability = weights.phases[phase]
+        print(f"  {phase:<5}  posisi={count:>8}  RMS={error:6.2f} bidak  mobility={mobility}  stability={stability}")
+        for row in weights.table(phase)[:(args.size + 1) // 2]:
+            print("        " + " ".join(f"{w:5d}" for w in row))
+    tuning.save_weights(weights, args.output)
+    print(f"Disimpan ke {os.path.normpath(args.output)}  ({time.perf_counter() - start:.1f}s)")
+
+
+def bench_tune_match(args):
+    from game import tuning
+
+    if tuning.get_heuristic_weights(args.size) is None:
+        print(f"Belum ada bobot tuning {args.size}x{args.size}, jalankan dulu: python benchmark.py tune")
+        return
+    # Heuristik saja (tanpa evaluasi pola); setiap pembukaan dimainkan dua kali dengan warna ditukar
+    openings = make_positions(count=(args.games + 1) // 2, plies=(8,), seed=args.seed, size=args.size)
+    wins = draws = disc_diff = games = 0
+    for opening in openings:
+        for tuned_black in (True, False):
+            ais = {}
+            for flag in (True, False):
+                ais[flag] = AlphaBetaAI(time_limit=args.time)
+                ais[flag].use_pattern_eval = False
+                ais[flag].use_tuned_weights = flag
+            if tuned_black:
+                own, opp = play_match(ais[True], ais[False], board=opening)
+            else:
+                opp, own = play_match(ais[False], ais[True], board=opening)
+            wins += own > opp
+            draws += own == opp
+            disc_diff += own - opp
+            games += 1
+    print(f"Bobot tuning vs buatan tangan ({args.size}x{args.size}), {args.time}s per langkah, {games} game: "
+          f"W{wins} D{draws} L{games - wins - draws}  selisih bidak {disc_diff:+d}")
+
+
+def bench_batch(args):
+    import numpy as np
+    from game.batch_board import BatchBoard
+
+    # Jalur skalar: setiap papan dijalankan satu panggilan Python per langkah
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    played = 0
+    for _ in range(args.games):
+        board = Board()
+        while not board.is_game_over():
+            player = board.current_player
+            moves = board.get_valid_moves(player)
+            if moves:
+                board.make_move(*rng.choice(moves), player)
+                played += 1
+            board.pass_turn()
+    scalar_time = time.perf_counter() - start
+    scalar_rate = played / scalar_time
+    print(f"Random playout {args.games} game")
+    print(f"  scalar  positions={played:>8}  time={scalar_time:7.3f}s  pos/s={scalar_rate:>10.0f}")
+
+    batch = BatchBoard.initial(args.games)
+    start = time.perf_counter()
+    played = batch.play_random(np.random.default_rng(args.seed))
+    batch_time = time.perf_counter() - start
+    batch_rate = played / batch_time
+    print(f"  batch   positions={played:>8}  time={batch_time:7.3f}s  pos/s={batch_rate:>10.0f}")
+    print(f"  speedup x{batch_rate / scalar_rate:.2f}")
+
+
+def bench_ordering(args):
+    # Biaya ordering per node interior: statis vs evaluasi anak (make/eval/undo vs batch)
+    positions = make_positions(count=200, plies=(10, 20, 30, 40, 50))
+    ai = AlphaBetaAI()
+    ai._reset_ordering(positions[0])
+    boards = [(ai._search_board(board), board.current_player) for board in positions]
+    boards = [(board, player, board.generate_moves(player)) for board, player in boards]
+    children = sum(len(moves) for _, _, moves in boards)
+
+    # Pembanding: evaluasi anak satu per satu lewat make/evaluate/undo
+    def scalar(board, player, moves):
+        scores = []
+        for (r, c), flips in moves:
+            undo = board.make_move(r, c, player, flips)
+            scores.append(ai._evaluate_board_advanced(board, player))
+            board.undo_move(undo)
+        return scores
+
+    print(f"Ordering {len(boards)} node ({children / len(boards):.1f} langkah/node) x {args.repeat}")
+    for name, order in (
+            ("statis", lambda board, player, moves: ai._order_moves(board, moves, player)),
+            ("eval skalar", scalar),
+            ("eval batch", lambda board, player, moves: ai._order_moves(board, moves, player, shallow=True))):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for board, player, moves in boards:
+                order(board, player, moves)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<12} {elapsed / (args.repeat * len(boards)) * 1e6:7.1f} us/node")
+
+    # Pencarian fixed depth: node yang dihemat ordering evaluasi vs biaya tambahannya
+    positions = make_positions(count=args.positions, plies=(12, 24, 36))
+    print(f"Fixed depth {args.depth} pada {len(positions)} posisi")
+    for name, flag in (("statis", False), ("eval", True)):
+        ai = AlphaBetaAI(depth=args.depth, eval_ordering=flag)
+        nodes = 0
+        first = []
+        start = time.perf_counter()
+        for pos in positions:
+            ai.new_game()
+            ai.get_move(pos.copy(), pos.current_player)
+            nodes += ai.node_count
+            first.append(ai.last_stats.get('first_move_cutoff', 0))
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<8} nodes={nodes:>8}  time={elapsed:7.3f}s  us/node={elapsed / nodes * 1e6:6.1f}"
+              f"  first-move cutoff={sum(first) / len(first):.3f}")
+
+    print(f"Time limit {args.time}s per langkah")
+    for name, flag in (("statis", False), ("eval", True)):
+        ai = AlphaBetaAI(time_limit=args.time, eval_ordering=flag)
+        depths = []
+        for pos in positions:
+            ai.new_game()
+            ai.get_move(pos.copy(), pos.current_player)
+            depths.append(ai.last_stats['depth'])
+        print(f"  {name:<8} avg depth={sum(depths) / len(depths):5.2f}  depths={depths}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark engine Othello")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("board", help="Nodes/detik board list vs bitboard")
+    p.add_argument("--depth", type=int, default=4)
+    p.add_argument("--size", type=int, default=BOARD_SIZE)
+    p.set_defaults(func=bench_board)
+
+    p = sub.add_parser("search", help="AlphaBetaAI: alpha-beta jendela penuh vs PVS + aspiration")
+    p.add_argument("--depth", type=int, default=6)
+    p.add_argument("--time", type=float, default=1.0)
+    p.add_argument("--positions", type=int, default=6)
+    p.set_defaults(func=bench_search)
+
+    p = sub.add_parser("parallel", help="AlphaBetaAI: speedup & depth terhadap jumlah worker")
+    p.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    p.add_argument("--depth", type=int, default=6)
+    p.add_argument("--time", type=float, default=1.0)
+    p.add_argument("--positions", type=int, default=6)
+    p.set_defaults(func=bench_parallel)
+
+    p = sub.add_parser("clock", help="Satu game dengan jam per game, log waktu per langkah")
+    p.add_argument("--game-time", type=float, default=30.0)
+    p.add_argument("--move-time", type=float, default=None)
+    p.set_defaults(func=bench_clock)
+
+    p = sub.add_parser("probcut-fit", help="Fit parameter regresi Multi-ProbCut dari self-play")
+    p.add_argument("--games", type=int, default=12)
+    p.add_argument("--max-depth", type=int, default=8)
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--output", default=PROBCUT_FILE)
+    p.set_defaults(func=bench_probcut_fit)
+
+    p = sub.add_parser("selective", help="ProbCut/LMR: depth yang dicapai vs hasil match lawan full-width")
+    p.add_argument("--time", type=float, default=0.5)
+    p.add_argument("--positions", type=int, default=6)
+    p.add_argument("--games", type=int, default=4)
+    p.set_defaults(func=bench_selective)
+
+    p = sub.add_parser("pattern-fit", help="Self-play + fit tabel bobot evaluasi pola")
+    p.add_argument("--games", type=int, default=20000)
+    p.add_argument("--depth", type=int, default=2)
+    p.add_argument("--solve-empties", type=int, default=10)
+    p.add_argument("--l2", type=float, default=100.0)
+    p.add_argument("--iterations", type=int, default=200)
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--output", default=WEIGHTS_FILE)
+    p.set_defaults(func=bench_pattern_fit)
+
+    p = sub.add_parser("pattern", help="Evaluasi pola vs heuristik: biaya per leaf & hasil match")
+    p.add_argument("--time", type=float, default=0.2)
+    p.add_argument("--games", type=int, default=20)
+    p.add_argument("--repeat", type=int, default=10)
+    p.add_argument("--seed", type=int, default=7)
+    p.set_defaults(func=bench_pattern)
+
+    p = sub.add_parser("incremental", help="Biaya per leaf: suku evaluasi dari nol vs incremental")
+    p.add_argument("--repeat", type=int, default=5)
+    p.set_defaults(func=bench_incremental)
+
+    p = sub.add_parser("stability", help="Bidak stabil: verifikasi vs brute force & biaya per panggilan")
+    p.add_argument("--positions", type=int, default=200)
+    p.add_argument("--empties", type=int, default=6)
+    p.add_argument("--size", type=int, default=BOARD_SIZE)
+    p.add_argument("--repeat", type=int, default=10)
+    p.add_argument("--seed", type=int, default=5)
+    p.set_defaults(func=bench_stability)
+
+    p = sub.add_parser("endgame", help="Solver endgame: verifikasi skor & langkah vs negamax brute force")
+    p.add_argument("--positions", type=int, default=60)
+    p.add_argument("--max-empties", type=int, default=9)
+    p.add_argument("--size", type=int, default=BOARD_SIZE)
+    p.add_argument("--seed", type=int, default=3)
+    p.set_defaults(func=bench_endgame)
+
+    p = sub.add_parser("pass", help="Regresi: semua engine mengembalikan pass (None) jika tidak ada langkah")
+    p.add_argument("--positions", type=int, default=20)
+    p.add_argument("--size", type=int, default=6)
+    p.add_argument("--seed", type=int, default=11)
+    p.set_defaults(func=bench_pass)
+
+    p = sub.add_parser("tune", help="Label posisi (self-play / game tersimpan) + fit bobot heuristik per fase")
+    p.add_argument("--source", choices=("selfplay", "history"), default="selfplay")
+    p.add_argument("--history", default=HISTORY_FILE)
+    p.add_argument("--load", help="File .npz posisi berlabel (hasil --save), sumber lain dilewati")
+    p.add_argument("--save", help="Simpan posisi berlabel ke file .npz")
+    p.add_argument("--size", type=int, default=BOARD_SIZE)
+    p.add_argument("--games", type=int, default=2000)
+    p.add_argument("--depth", type=int, default=2)
+    p.add_argument("--solve-empties", type=int, default=10)
+    p.add_argument("--search-depth", type=int, default=0, help="> 0: label posisi awal dengan skor pencarian")
+    p.add_argument("--l2", type=float, default=0.01)
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--output", default=TUNING_FILE)
+    p.set_defaults(func=bench_tune)
+
+    p = sub.add_parser("tune-match", help="Heuristik bobot tuning vs bobot buatan tangan")
+    p.add_argument("--size", type=int, default=BOARD_SIZE)
+    p.add_argument("--time", type=float, default=0.2)
+    p.add_argument("--games", type=int, default=20)
+    p.add_argument("--seed", type=int, default=7)
+    p.set_defaults(func=bench_tune_match)
+
+    p = sub.add_parser("batch", help="Posisi/detik batch engine NumPy vs Board skalar")
+    p.add_argument("--games", type=int, default=2000)
+    p.add_argument("--seed", type=int, default=1)
+    p.set_defaults(func=bench_batch)
+
+    p = sub.add_parser("ordering", help="Move ordering statis vs evaluasi anak: biaya per node & node yang dihemat")
+    p.add_argument("--depth", type=int, default=6)
+    p.add_argument("--time", type=float, default=1.0)
+    p.add_argument("--positions", type=int, default=9)
+    p.add_argument("--repeat", type=int, default=5)
+    p.set_defaults(func=bench_ordering)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
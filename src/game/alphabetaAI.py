@@ -1,130 +1,446 @@
 import random
 import time
-from game.base_ai import BaseAI
+from game.base_ai import BaseAI, CHECK_MASK
+from game.endgame import ENDGAME_EMPTIES
+from game.probcut import PROBCUT_THRESHOLD, PROBCUT_MAX_SCORE, load_params
+from game.time_manager import TimeManager
+from game.transposition import TranspositionTable, EXACT, LOWER, UPPER
+
+# Lebar awal aspiration window (skala _evaluate_board_advanced); dilebarkan x4 tiap gagal,
+# di atas ASPIRATION_MAX sisi yang gagal dibuka penuh
+ASPIRATION_WINDOW = 50
+ASPIRATION_MAX = 5000
+
+# Late move reductions: setelah LMR_FULL_MOVES langkah pertama, langkah yang bukan TT/killer
+# dicari LMR_REDUCTION ply lebih dangkal (zero-window), dicari ulang penuh jika melewati alpha
+LMR_FULL_MOVES = 3
+LMR_MIN_DEPTH = 3
+LMR_REDUCTION = 1
+
+# Ordering dengan evaluasi anak (eval_ordering) hanya di node dengan sisa depth >= ini;
+# di dekat daun biayanya lebih besar dari node yang dihemat
+EVAL_ORDER_MIN_DEPTH = 3
 
 class AlphaBetaAI(BaseAI):
-    def __init__(self, depth=3, time_limit=None):
+    # tt_size_mb: budget memori transposition table (0/None = tanpa TT)
+    # pvs: Principal Variation Search + aspiration window (False = alpha-beta jendela penuh)
+    # endgame_empties: solver eksak aktif jika sisa petak kosong <= nilai ini (0 = nonaktif)
+    # workers: > 1 = langkah root dibagi ke worker pool (lihat game.parallel)
+    # shared_tt: dengan workers > 1, semua proses memakai satu TT di shared memory (game.shared_tt)
+    # time_manager: game.time_manager.TimeManager (jam per game); default dari time_limit.
+    #   Dengan manager: iterative deepening depth 1, 2, 3, ... sampai manager berhenti.
+    #   Tanpa manager (time_limit=None): satu pencarian fixed depth.
+    # probcut: Multi-ProbCut (game.probcut); probcut_params {kunci evaluator: {depth: ...}},
+    #   default DEFAULT_PARAMS + data/probcut.json. Tanpa parameter untuk evaluator aktif
+    #   (BaseAI._evaluator_key) ProbCut dilewati.
+    # lmr: late move reductions untuk langkah yang urutannya buruk
+    # eval_ordering: node interior diurutkan menurut evaluasi dangkal anak (BaseAI._evaluate_children)
+    def __init__(self, depth=3, time_limit=None, tt_size_mb=16, pvs=True, endgame_empties=ENDGAME_EMPTIES,
+                 workers=1, shared_tt=True, time_manager=None, probcut=False, probcut_params=None, lmr=False,
+                 eval_ordering=False):
         self.depth = depth
         self.time_limit = time_limit
+        self.time_manager = time_manager or (TimeManager(move_time=time_limit) if time_limit else None)
+        self.deadline = None
+        self.endgame_empties = endgame_empties
+        self.pvs = pvs
+        self.research_count = 0
+        self.probcut = probcut
+        self.probcut_params = probcut_params if probcut_params is not None else (load_params() if probcut else {})
+        self._probcut_checks = {} # Ukuran papan -> parameter ProbCut evaluator aktif
+        self.lmr = lmr
+        self.eval_ordering = eval_ordering
+        self._reset_selective_stats()
         self.start_time = 0
-        self.node_count = 0 
+        self._reset_counters()
         self.last_stats = {'depth': 0, 'time': 0}
+        # TT dipakai terus antar get_move dalam satu game (dikosongkan di new_game)
+        self.tt = TranspositionTable(tt_size_mb) if tt_size_mb else None
+        self.tt_size_mb = tt_size_mb
+        self.workers = workers
+        self.shared_tt = shared_tt
+        self._parallel = None # Pool dibuat saat get_move pertama, lalu dipakai terus
+        # Hasil pondering terakhir: langkah lawan yang diprediksi & posisi setelahnya
+        self.ponder_move = None
+        self.ponder_position = None
+        self.ponder_depth = 0
+
+    # Hentikan worker pool (jika ada) dan lepas TT shared memory
+    def close(self):
+        if self._parallel is not None:
+            shared = self._parallel.shared_tt is not None
+            self._parallel.close()
+            self._parallel = None
+            if shared:
+                self.tt = TranspositionTable(self.tt_size_mb)
+
+    # Anytime API: worker pool (jika ada) ikut dihentikan
+    def stop(self):
+        if self._parallel is not None:
+            self._parallel.stop()
+        return super().stop()
+
+    def _reset_selective_stats(self):
+        self.probcut_tries = 0
+        self.probcut_cuts = 0
+        self.lmr_reductions = 0
+        self.lmr_researches = 0
+
+    def new_game(self):
+        super().new_game()
+        self._probcut_checks = {}
+        if self.tt is not None:
+            self.tt.clear()
+
+    # --- PONDERING ---
+    # Dijalankan di thread latar selama giliran lawan (start_ponder, hentikan dengan stop()):
+    # iterative deepening pada posisi lawan tanpa batas waktu sampai stop_requested.
+    # Posisi setelah setiap kemungkinan langkah lawan (= posisi root get_move berikutnya)
+    # tersimpan di TT, jadi iterasi awal get_move berikutnya banyak terpotong TT.
+    def start_ponder(self, board, opponent):
+        self._start_thread(self.ponder, board, opponent)
 
-    # --- MOVE ORDERING (Tidak Berubah) ---
-    def _order_moves(self, board, valid_moves):
-        corners = {(0,0), (0,7), (7,0), (7,7)}
-        def score_move_ordering(move):
-            r, c = move
-            if (r, c) in corners: return 1000
-            if r == 0 or r == 7 or c == 0 or c == 7: return 10
-            return 0
-        return sorted(valid_moves, key=score_move_ordering, reverse=True)
+    def ponder(self, board, opponent):
+        self.ponder_move = None
+        self.ponder_position = None
+        self.ponder_depth = 0
+        valid_moves = self._unique_moves(board, board.generate_moves(opponent))
+        if not valid_moves or self.tt is None:
+            return
+
+        self.start_time = time.monotonic()
+        self.deadline = None
+        self._reset_counters()
+        self.research_count = 0
+        self.nodes_per_depth = {}
+        self.tt.new_search()
+        self._reset_ordering(board)
+        search_board = self._search_board(board)
+        search_board.current_player = opponent
+        move, _, depth = self._iterate(board, search_board, valid_moves, opponent, 1, 1,
+                                       board.empty_count, self._search_root, report=False)
+        if depth:
+            self.ponder_move = move
+            self.ponder_depth = depth
+            predicted = board.copy()
+            predicted.make_move(move[0], move[1], opponent)
+            self.ponder_position = (predicted.black, predicted.white)
+
+    # Statistik pondering untuk langkah ini; hit = lawan memainkan langkah yang diprediksi
+    def _ponder_stats(self, board):
+        if self.ponder_position is None:
+            return {}
+        stats = {'ponder_hit': (board.black, board.white) == self.ponder_position,
+                 'ponder_depth': self.ponder_depth}
+        self.ponder_position = None
+        return stats
 
     def get_move(self, board, player):
-        valid_moves = board.get_valid_moves(player)
+        ponder_stats = self._ponder_stats(board)
+        valid_moves = self._unique_moves(board, board.generate_moves(player))
         if not valid_moves:
             return None
             
-        self.start_time = time.time()
-        self.node_count = 0 
+        self._start_clock(board, len(valid_moves))
+        self._reset_counters()
+        self.research_count = 0
+        self._reset_selective_stats()
+        self.nodes_per_depth = {}
+        if self.tt is not None:
+            self.tt.new_search()
+        self._reset_ordering(board)
 
         if len(valid_moves) == 1:
-            self.last_stats = {'depth': 0, 'time': time.time() - self.start_time}
-            return valid_moves[0]
+            self.last_stats = self._search_stats(0)
+            self._stop_clock(0)
+            return valid_moves[0][0]
 
-        best_move_final = valid_moves[0]
-        completed_depth = 0
+        # Sisa petak kosong sedikit: selesaikan eksak (selisih bidak akhir), tanpa heuristik
+        solved_move = self._solve_endgame(board, player)
+        if solved_move is not None:
+            self.last_stats = self._search_stats(board.empty_count)
+            self.last_stats.update(self.endgame_stats)
+            self._stop_clock(board.empty_count)
+            return solved_move
+
+        # Satu salinan untuk seluruh pencarian; anak dibuat dengan make/undo in-place.
+        # Papan asli tetap utuh walau pencarian diputus TimeoutError di tengah jalan.
+        search_board = self._search_board(board)
+        # Giliran ikut masuk hash: selama pencarian current_player selalu = pemain yang jalan
+        search_board.current_player = player
+
+        search_root = self._search_root
+        if self.workers > 1:
+            if self._parallel is None:
+                from game.parallel import ParallelRootSearch
+                table = None
+                if self.shared_tt and self.tt_size_mb:
+                    from game.shared_tt import SharedTranspositionTable
+                    # Proses utama ikut memakai tabel shared (menggantikan TT lokal)
+                    table = self.tt = SharedTranspositionTable(self.tt_size_mb, board.size)
+                    table.new_search()
+                ai_kwargs = {'tt_size_mb': self.tt_size_mb, 'pvs': self.pvs, 'probcut': self.probcut,
+                             'probcut_params': self.probcut_params, 'lmr': self.lmr,
+                             'eval_ordering': self.eval_ordering}
+                self._parallel = ParallelRootSearch(self.workers, ai_kwargs, table)
+            self._parallel.new_search()
+            search_root = lambda *args: self._parallel.search_root(self, *args)
         
-        # --- [UPDATE 1] LOGIKA PAKSA GENAP ---
-        # Jika pakai time_limit, mulai dari depth 2 dan lompat 2 (2, 4, 6, ...)
-        # Jika fixed depth, gunakan depth yang diminta user.
-        if self.time_limit:
-            start_depth = 2 
-            step = 2
+        # Dengan time manager: depth 1, 2, 3, ... sampai sisa petak kosong, manager yang
+        # memutuskan kapan berhenti. Tanpa manager: depth yang diminta user (lewat start()
+        # tetap bertahap dari depth 1 agar best_so_far selalu terisi).
+        manager = self.time_manager
+        if manager is not None:
+            start_depth = 1
+            max_depth_to_search = board.empty_count # Sisa petak kosong
         else:
-            start_depth = self.depth
-            step = 1 # Tidak looping jika fixed, atau loop normal
+            max_depth_to_search = self.depth
+            start_depth = 1 if self.is_thinking() else self.depth
+
+        best_move_final, best_score, completed_depth = self._iterate(
+            board, search_board, valid_moves, player, start_depth, 1, max_depth_to_search, search_root, manager)
 
-        max_depth_to_search = self.depth if not self.time_limit else 64 # Max board size
+        self.last_stats = self._search_stats(completed_depth)
+        self.last_stats['nodes_per_depth'] = self.nodes_per_depth
+        self.last_stats.update(self.endgame_stats)
+        if self.pvs:
+            self.last_stats['researches'] = self.research_count
+        if self.probcut:
+            self.last_stats['probcut_tries'] = self.probcut_tries
+            self.last_stats['probcut_cuts'] = self.probcut_cuts
+        if self.lmr:
+            self.last_stats['lmr_reductions'] = self.lmr_reductions
+            self.last_stats['lmr_researches'] = self.lmr_researches
+        if self.workers > 1:
+            self.last_stats['workers'] = self.workers
+        if self.tt is not None:
+            self.last_stats.update(self.tt.stats())
+        self.last_stats.update(ponder_stats)
+        if self.partial_move:
+            self.last_stats['partial_iteration'] = True
+        self._stop_clock(completed_depth)
+
+        return best_move_final
+
+    # Iterative deepening dari start_depth s/d max_depth (lompat step).
+    # Mengembalikan (langkah terbaik, skor, depth terakhir yang selesai).
+    # manager (TimeManager): setelah tiap iterasi memutuskan apakah iterasi berikutnya dimulai.
+    # Iterasi yang diputus TimeoutError (deadline / stop) tidak dihitung selesai, tapi langkah
+    # root yang sudah terbukti lebih baik dari PV di iterasi itu tetap dipakai (partial_move).
+    # report: kirim hasil tiap iterasi ke anytime API (_report_progress); False saat pondering.
+    def _iterate(self, board, search_board, valid_moves, player, start_depth, step, max_depth, search_root,
+                 manager=None, report=True):
+        best_move_final = valid_moves[0][0]
+        best_score = 0
+        completed_depth = 0
+        stable_iterations = 0
+        self.partial_move = None
 
         try:
-            # Loop dengan step (bisa 1 atau 2)
-            for d in range(start_depth, max_depth_to_search + 1, step):
-                best_score = float('-inf')
-                best_moves = []
-                alpha = float('-inf')
-                beta = float('inf')
-
-                ordered_moves = self._order_moves(board, valid_moves)
-
-                for move in ordered_moves:
-                    self.node_count += 1
-                    if self.time_limit and (self.node_count % 1000 == 0):
-                        if time.time() - self.start_time >= self.time_limit:
-                            raise TimeoutError("Time Limit Exceeded")
-
-                    test_board = self._copy_board(board)
-                    if test_board.make_move(move[0], move[1], player):
-                        # Panggil alphabeta
-                        score = self._alphabeta(test_board, d - 1, alpha, beta, False, player)
-                        
-                        if score > best_score:
-                            best_score = score
-                            best_moves = [move]
-                        elif score == best_score:
-                            best_moves.append(move)
-                        
-                        alpha = max(alpha, best_score)
+            for d in range(start_depth, max_depth + 1, step):
+                # Langkah PV iterasi sebelumnya dicoba paling dulu
+                tt_move = best_move_final if completed_depth else None
+                ordered_moves = self._order_moves(board, valid_moves, player, tt_move)
+                nodes_before = self.node_count
+                iteration_start = time.monotonic()
+                self.root_progress = None
 
+                if self.pvs and completed_depth:
+                    # Aspiration window di sekitar skor iterasi sebelumnya;
+                    # jika gagal (fail-low/high) jendela dilebarkan lalu dicari ulang
+                    window = ASPIRATION_WINDOW
+                    alpha = best_score - window
+                    beta = best_score + window
+                    while True:
+                        score, best_moves = search_root(search_board, ordered_moves, d, alpha, beta, player)
+                        if score <= alpha:
+                            window *= 4
+                            alpha = score - window if window <= ASPIRATION_MAX else float('-inf')
+                        elif score >= beta:
+                            window *= 4
+                            beta = score + window if window <= ASPIRATION_MAX else float('inf')
+                        else:
+                            break
+                        self.research_count += 1
+                else:
+                    score, best_moves = search_root(search_board, ordered_moves, d, float('-inf'), float('inf'), player)
+
+                self.nodes_per_depth[d] = self.node_count - nodes_before
                 if best_moves:
+                    best_score = score
+                    previous_move = best_move_final
                     best_move_final = random.choice(best_moves)
+                    stable_iterations = stable_iterations + 1 if best_move_final == previous_move else 0
                     completed_depth = d 
+                    if report:
+                        self._report_progress(best_move_final, depth=d, score=best_score, nodes=self.node_count)
+
+                if manager is not None:
+                    now = time.monotonic()
+                    previous_nodes = self.nodes_per_depth.get(d - 1)
+                    ebf = self.nodes_per_depth[d] / previous_nodes if previous_nodes else None
+                    if not manager.continue_search(now - self.start_time, now - iteration_start, ebf, stable_iterations):
+                        break
 
         except TimeoutError:
-            pass # Kembalikan hasil dari depth genap terakhir yang selesai
+            # Iterasi terakhir tidak selesai; pakai langkah yang sudah mengalahkan PV (jika ada)
+            partial = self.root_progress
+            if completed_depth and partial is not None and partial[1] != best_move_final:
+                best_move_final = self.partial_move = partial[1]
 
-        elapsed_time = time.time() - self.start_time
-        self.last_stats = {'depth': completed_depth, 'time': elapsed_time}
+        return best_move_final, best_score, completed_depth
 
-        return best_move_final
+    # Cari semua langkah root pada depth d dalam jendela (alpha, beta).
+    # Mengembalikan (skor terbaik, langkah-langkah dengan skor itu).
+    # Mode PVS: hanya langkah pertama dicari dengan jendela penuh, sisanya zero-window
+    # (langkah seri tidak terdeteksi, jadi best_moves berisi satu langkah).
+    # root_progress: (skor, langkah) terbaik sejauh ini yang skornya di dalam jendela (bukan
+    # sekadar batas atas), dipakai _iterate jika iterasi ini diputus di tengah jalan.
+    def _search_root(self, board, ordered_moves, d, alpha, beta, player):
+        opponent = 'W' if player == 'B' else 'B'
+        best_score = float('-inf')
+        best_moves = []
+        alpha_orig = alpha
+        for move, flips in ordered_moves:
+            self.node_count += 1
+            if not self.node_count & CHECK_MASK: self._check_time()
+
+            undo = board.make_move(move[0], move[1], player, flips)
+            if undo:
+                # Panggil alphabeta (negamax: skor anak dari sudut pandang lawan)
+                board.current_player = opponent
+                if self.pvs and best_moves:
+                    score = -self._alphabeta(board, d - 1, -alpha - 1, -alpha, opponent, 1)
+                    if alpha < score < beta:
+                        self.research_count += 1
+                        score = -self._alphabeta(board, d - 1, -beta, -alpha, opponent, 1)
+                else:
+                    score = -self._alphabeta(board, d - 1, -beta, -alpha, opponent, 1)
+                board.undo_move(undo)
+
+                if score > best_score:
+                    best_score = score
+                    best_moves = [move]
+                    if score > alpha_orig:
+                        self.root_progress = (score, move)
+                elif score == best_score and not self.pvs:
+                    best_moves.append(move)
+                
+                alpha = max(alpha, best_score)
+                if self.pvs and alpha >= beta: break
+        return best_score, best_moves
 
-    # ... (Method _alphabeta TIDAK PERLU DIUBAH, biarkan sama seperti file asli) ...
-    def _alphabeta(self, board, depth, alpha, beta, is_maximizing, player):
-        # Gunakan kode _alphabeta yang sama persis dari file Anda sebelumnya
+    # --- NEGAMAX ALPHA-BETA + TRANSPOSITION TABLE ---
+    # Skor selalu dari sudut pandang `player` (pemain yang jalan di node ini).
+    # _evaluate_board_advanced antisimetris (eval(B) == -eval(W)), jadi hasilnya sama
+    # dengan versi max/min, tapi entri TT bisa dipakai dari jalur mana pun.
+    # ply: jarak dari root (indeks tabel killer)
+    def _alphabeta(self, board, depth, alpha, beta, player, ply):
         self.node_count += 1
-        if self.time_limit and (self.node_count % 1000 == 0):
-            if time.time() - self.start_time >= self.time_limit:
-                raise TimeoutError("Time Limit")
+        if not self.node_count & CHECK_MASK: self._check_time()
 
         if depth == 0 or board.is_game_over():
+            if self.collect_stats: self.leaf_evals += 1
             return self._evaluate_board_advanced(board, player)
 
+        tt = self.tt
+        tt_move = None
+        if tt is not None:
+            entry = tt.probe(board.hash)
+            if entry is not None:
+                tt_move = entry[4]
+                if entry[1] >= depth:
+                    flag = entry[2]
+                    score = entry[3]
+                    if flag == EXACT or (flag == LOWER and score >= beta) or (flag == UPPER and score <= alpha):
+                        tt.cutoffs += 1
+                        return score
+
         opponent = 'W' if player == 'B' else 'B'
-        current_player = player if is_maximizing else opponent
-        valid_moves = board.get_valid_moves(current_player)
+        valid_moves = self._unique_moves(board, board.generate_moves(player))
 
         if not valid_moves:
-            return self._alphabeta(board, depth - 1, alpha, beta, not is_maximizing, player)
-
-        ordered_moves = self._order_moves(board, valid_moves)
-
-        if is_maximizing:
-            value = float('-inf')
-            for move in ordered_moves:
-                test_board = self._copy_board(board)
-                test_board.make_move(move[0], move[1], current_player)
-                score = self._alphabeta(test_board, depth - 1, alpha, beta, False, player)
-                value = max(value, score)
-                alpha = max(alpha, value)
-                if beta <= alpha: break 
-            return value
-        else:
-            value = float('inf')
-            for move in ordered_moves:
-                test_board = self._copy_board(board)
-                test_board.make_move(move[0], move[1], current_player)
-                score = self._alphabeta(test_board, depth - 1, alpha, beta, True, player)
-                value = min(value, score)
-                beta = min(beta, value)
-                if beta <= alpha: break 
-            return value
\ No newline at end of file
+            # Pass: giliran pindah (hash ikut berubah), depth tetap berkurang
+            board.pass_turn()
+            score = -self._alphabeta(board, depth - 1, -beta, -alpha, opponent, ply + 1)
+            board.pass_turn()
+            return score
+
+        # --- MULTI-PROBCUT ---
+        if self.probcut and abs(beta) < PROBCUT_MAX_SCORE and abs(alpha) < PROBCUT_MAX_SCORE:
+            checks = self._probcut_params(board).get(depth)
+            if checks:
+                cut = self._probcut(board, depth, alpha, beta, player, ply, checks)
+                if cut is not None:
+                    return cut
+
+        alpha_orig = alpha
+        value = float('-inf')
+        best_move = None
+        if self.collect_stats: self.interior_nodes += 1
+        reduce_from = LMR_FULL_MOVES if self.lmr and depth >= LMR_MIN_DEPTH else len(valid_moves)
+        killers = self.killers[ply]
+        shallow = self.eval_ordering and depth >= EVAL_ORDER_MIN_DEPTH
+        for i, (move, flips) in enumerate(self._order_moves(board, valid_moves, player, tt_move, ply, shallow)):
+            undo = board.make_move(move[0], move[1], player, flips)
+            board.current_player = opponent
+            if i >= reduce_from and move != tt_move and move not in killers:
+                # LMR: langkah urutan belakang dicari lebih dangkal dulu; jika ternyata
+                # melewati alpha, cari ulang dengan depth penuh
+                self.lmr_reductions += 1
+                score = -self._alphabeta(board, depth - 1 - LMR_REDUCTION, -alpha - 1, -alpha, opponent, ply + 1)
+                if score > alpha:
+                    self.lmr_researches += 1
+                    score = -self._alphabeta(board, depth - 1, -beta, -alpha, opponent, ply + 1)
+            elif self.pvs and best_move is not None:
+                # PVS: buktikan langkah ini tidak lebih baik dengan zero-window,
+                # cari ulang dengan jendela penuh hanya jika ternyata lebih baik
+                score = -self._alphabeta(board, depth - 1, -alpha - 1, -alpha, opponent, ply + 1)
+                if alpha < score < beta:
+                    self.research_count += 1
+                    score = -self._alphabeta(board, depth - 1, -beta, -alpha, opponent, ply + 1)
+            else:
+                score = -self._alphabeta(board, depth - 1, -beta, -alpha, opponent, ply + 1)
+            board.undo_move(undo)
+            if score > value:
+                value = score
+                best_move = move
+            if value > alpha: alpha = value
+            if alpha >= beta:
+                self._record_cutoff(move, player, depth, ply, board.size)
+                if self.collect_stats:
+                    self.cutoffs += 1
+                    if not i: self.first_move_cutoffs += 1
+                break
+
+        if tt is not None:
+            if value <= alpha_orig: flag = UPPER
+            elif value >= beta: flag = LOWER
+            else: flag = EXACT
+            tt.store(board.hash, depth, flag, value, best_move)
+        return value
+
+    # Pencarian dangkal zero-window di sekitar batas hasil regresi (lihat game.probcut).
+    # Mengembalikan beta/alpha jika node bisa dipotong, None jika harus dicari penuh.
+    def _probcut(self, board, depth, alpha, beta, player, ply, checks):
+        threshold = PROBCUT_THRESHOLD
+        for shallow, a, b, sigma in checks:
+            if a <= 0:
+                continue
+            self.probcut_tries += 1
+            bound = round((beta + threshold * sigma - b) / a)
+            if self._alphabeta(board, shallow, bound - 1, bound, player, ply) >= bound:
+                self.probcut_cuts += 1
+                return beta
+            bound = round((alpha - threshold * sigma - b) / a)
+            if self._alphabeta(board, shallow, bound, bound + 1, player, ply) <= bound:
+                self.probcut_cuts += 1
+                return alpha
+        return None
+
+    # Parameter ProbCut {depth: checks} untuk evaluator aktif papan ini ({} = tidak ada)
+    def _probcut_params(self, board):
+        checks = self._probcut_checks.get(board.size)
+        if checks is None:
+            checks = self._probcut_checks[board.size] = self.probcut_params.get(self._evaluator_key(board), {})
+        return checks
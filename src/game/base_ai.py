@@ -1,36 +1,319 @@
-from game.board import Board
-from utils.constants import BOARD_WEIGHTS
+import threading
+import time
+from game import symmetry
+from game.pattern_eval import get_evaluator
+from game.stability import get_stability
+from game.tuning import get_heuristic_weights
+from game.endgame import EndgameSolver, ENDGAME_EMPTIES, ENDGAME_TIME_FRACTION
+
+# Posisi simetris praktis hanya muncul di beberapa ply pertama;
+# di atas jumlah bidak ini pengecekan simetri dilewati (nol biaya di midgame).
+SYMMETRY_MAX_DISCS = 8
+
+# Jam dicek setiap CHECK_INTERVAL node (pangkat 2: cukup `node_count & CHECK_MASK`)
+CHECK_INTERVAL = 256
+CHECK_MASK = CHECK_INTERVAL - 1
+
+# Kelas statis per petak untuk fallback move ordering: 2 = pojok, 1 = pinggir, 0 = lainnya
+_STATIC_CLASSES = {}
+
+def _static_classes(geometry):
+    classes = _STATIC_CLASSES.get(geometry.size)
+    if classes is None:
+        size = geometry.size
+        last = size - 1
+        corners = set(geometry.corners)
+        classes = []
+        for r in range(size):
+            for c in range(size):
+                if (r, c) in corners: classes.append(2)
+                elif r == 0 or r == last or c == 0 or c == last: classes.append(1)
+                else: classes.append(0)
+        classes = _STATIC_CLASSES[size] = tuple(classes)
+    return classes
 
 class BaseAI:
+    # State anytime API (default kelas; engine tidak perlu menginisialisasi di __init__)
+    stop_requested = False
+    progress = None # callback(ai, info) tiap iterasi selesai / batch simulasi
+    result = None # Langkah final dari start() terakhir
+    search_error = None # Exception dari thread start() terakhir (None = sukses)
+    _search_thread = None
+    _best_so_far = None
+    # False = counter per node (leaf evals, cutoff) dimatikan; nodes & waktu tetap dicatat
+    collect_stats = True
+    # Papan 8x8 memakai evaluasi pola (game.pattern_eval) jika file bobotnya ada;
+    # False / ukuran lain = heuristik buatan tangan di _evaluate_board_advanced
+    use_pattern_eval = True
+    # Heuristik memakai bobot hasil tuning (game.tuning, data/eval_weights.json) jika ada
+    # untuk ukuran papan ini; False = bobot buatan tangan
+    use_tuned_weights = True
+
+    # Dipanggil GameLogic saat game baru dimulai (kosongkan state yang dipakai antar langkah)
+    def new_game(self):
+        manager = getattr(self, 'time_manager', None)
+        if manager is not None:
+            manager.new_game()
+
+    # --- ANYTIME API ---
+    # start(board, player): get_move di thread latar, langsung kembali (board disalin)
+    # best_so_far(): langkah terbaik dari iterasi / batch simulasi terakhir yang selesai
+    # stop(): putus pencarian sekarang, tunggu thread, kembalikan langkah final
+    # wait(): tunggu pencarian selesai sendiri (deadline / depth), kembalikan langkah final
+    # Semua engine memakai jalur yang sama: stop_requested dicek bersama deadline.
+    def start(self, board, player, progress=None):
+        self._start_thread(self.get_move, board, player, progress)
+
+    def _start_thread(self, target, board, player, progress=None):
+        if self.is_thinking():
+            raise RuntimeError("Pencarian sebelumnya masih berjalan")
+        if progress is not None:
+            self.progress = progress
+        self.stop_requested = False
+        self.result = None
+        self.search_error = None
+        self._best_so_far = None
+        self._search_thread = threading.Thread(target=self._run_search, args=(target, board.copy(), player),
+                                               daemon=True)
+        self._search_thread.start()
+
+    def _run_search(self, target, board, player):
+        try:
+            self.result = target(board, player)
+        except Exception as e:
+            self.search_error = e
+
+    def is_thinking(self):
+        return self._search_thread is not None and self._search_thread.is_alive()
+
+    def best_so_far(self):
+        if self._search_thread is not None and not self._search_thread.is_alive():
+            return self.result
+        return self._best_so_far
+
+    def stop(self):
+        self.stop_requested = True
+        return self.wait()
+
+    def wait(self, timeout=None):
+        thread = self._search_thread
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                return None
+            self._search_thread = None
+        # Reset setelah thread selesai, agar stop yang datang sebelum thread jalan tidak hilang
+        self.stop_requested = False
+        return self.result
+
+    # Dipanggil engine setiap hasil sementara yang valid (iterasi selesai, batch simulasi)
+    def _report_progress(self, move, **info):
+        self._best_so_far = move
+        if self.progress is not None:
+            info['move'] = move
+            info['time'] = time.monotonic() - self.start_time
+            self.progress(self, info)
+
+    # --- INSTRUMENTASI ---
+    # Counter murah yang diisi selama pencarian; diringkas _search_stats ke last_stats.
+    def _reset_counters(self):
+        self.node_count = 0
+        self.leaf_evals = 0
+        self.interior_nodes = 0 # Node yang langkah-langkahnya dicari (bukan daun)
+        self.cutoffs = 0 # Beta cutoff di node interior
+        self.first_move_cutoffs = 0 # ... yang terjadi pada langkah pertama (kualitas ordering)
+
+    # Metrik per langkah dengan skema yang sama untuk semua engine.
+    # Rasio tanpa penyebut (mis. tidak ada cutoff) tidak dicantumkan.
+    def _search_stats(self, depth):
+        elapsed = time.monotonic() - self.start_time
+        nodes = self.node_count
+        stats = {'depth': depth, 'time': elapsed, 'nodes': nodes}
+        if elapsed > 0 and nodes:
+            stats['nps'] = nodes / elapsed
+        # EBF (engine iterative deepening): rasio node dua iterasi terakhir,
+        # atau akar ke-depth dari total node
+        per_depth = getattr(self, 'nodes_per_depth', None)
+        if per_depth is not None:
+            if per_depth.get(depth) and per_depth.get(depth - 1):
+                stats['ebf'] = per_depth[depth] / per_depth[depth - 1]
+            elif depth > 0 and nodes:
+                stats['ebf'] = nodes ** (1 / depth)
+        if self.collect_stats:
+            stats['leaf_evals'] = self.leaf_evals
+            if self.interior_nodes:
+                stats['cutoff_ratio'] = self.cutoffs / self.interior_nodes
+            if self.cutoffs:
+                stats['first_move_cutoff'] = self.first_move_cutoffs / self.cutoffs
+        return stats
+
+    # --- JAM PER LANGKAH ---
+    # Mulai jam langkah: dengan time_manager, deadline = batas keras dari manager;
+    # tanpa manager, deadline = time_limit datar (None = tanpa batas waktu).
+    def _start_clock(self, board, legal_count):
+        self.start_time = time.monotonic()
+        self._best_so_far = None
+        manager = getattr(self, 'time_manager', None)
+        if manager is not None:
+            _, hard = manager.start_move(board, legal_count, self._get_game_phase(board))
+            self.deadline = self.start_time + hard
+        elif self.time_limit:
+            self.deadline = self.start_time + self.time_limit
+        else:
+            self.deadline = None
+
+    # Tutup jam langkah: catat pemakaian waktu di time_manager dan last_stats
+    def _stop_clock(self, depth):
+        manager = getattr(self, 'time_manager', None)
+        if manager is not None:
+            entry = manager.end_move(depth)
+            self.last_stats['time_budget'] = entry['soft']
+            self.last_stats['time_remaining'] = entry['remaining']
+
+    # Dicek tiap CHECK_INTERVAL node: putus pencarian jika deadline lewat atau stop diminta
+    def _check_time(self):
+        if self.stop_requested or (self.deadline is not None and time.monotonic() >= self.deadline):
+            raise TimeoutError("Time Limit")
     
+    # Buang langkah duplikat simetris (mis. 4 langkah pembuka yang ekuivalen)
+    def _unique_moves(self, board, moves):
+        if board.black_count + board.white_count > SYMMETRY_MAX_DISCS:
+            return moves
+        return symmetry.unique_moves(board.black, board.white, moves, board.size)
+
+    # --- MOVE ORDERING BERSAMA (Minimax & AlphaBeta) ---
+    # Urutan: langkah PV/TT -> 2 killer move per ply -> history heuristic -> kelas statis.
+    # Killer & history diisi saat terjadi beta cutoff (lihat _record_cutoff).
+    # shallow=True: sisa langkah diurutkan menurut evaluasi anak (_evaluate_children).
+    def _reset_ordering(self, board):
+        cells = board.geometry.cells
+        history = getattr(self, 'history', None)
+        if history is None or len(history['B']) != cells:
+            self.history = {'B': [0] * cells, 'W': [0] * cells}
+        else:
+            # Nilai history dibawa ke langkah berikutnya tapi di-"tua"-kan
+            for table in history.values():
+                for i in range(cells):
+                    table[i] >>= 1
+        # Ply maksimum: setiap petak kosong + paling banyak satu pass per langkah
+        self.killers = [[None, None] for _ in range(2 * board.empty_count + 2)]
+
+    def _order_moves(self, board, valid_moves, player, tt_move=None, ply=None, shallow=False):
+        if len(valid_moves) < 2:
+            return valid_moves
+        size = board.size
+        static = _static_classes(board.geometry)
+        history = self.history[player]
+        killer_1, killer_2 = self.killers[ply] if ply is not None else (None, None)
+        if shallow:
+            scores = dict(zip((move for move, _ in valid_moves), self._evaluate_children(board, player, valid_moves)))
+        # valid_moves berisi pasangan ((row, col), flips) dari board.generate_moves
+        def score_move_ordering(entry):
+            move = entry[0]
+            if move == tt_move: return 1 << 62
+            if move == killer_1: return 1 << 61
+            if move == killer_2: return 1 << 60
+            if shallow: return scores[move]
+            idx = move[0] * size + move[1]
+            return (history[idx] << 2) | static[idx]
+        return sorted(valid_moves, key=score_move_ordering, reverse=True)
+
+    # Skor _evaluate_board_advanced (sudut pandang player) untuk anak dari setiap langkah
+    # ((row, col), flips), dalam urutan moves. Evaluator pola menghitung semua anak dalam satu
+    # panggilan tanpa make/undo (game over anak tidak dicek, cukup untuk ordering);
+    # heuristik memakai make/evaluate/undo per anak.
+    def _evaluate_children(self, board, player, moves):
+        evaluator = self._pattern_evaluator(board)
+        if evaluator is not None:
+            return evaluator.evaluate_children(board, player, moves)
+        scores = []
+        for (row, col), flips in moves:
+            undo = board.make_move(row, col, player, flips)
+            scores.append(self._evaluate_board_advanced(board, player))
+            board.undo_move(undo)
+        return scores
+
+    def _record_cutoff(self, move, player, depth, ply, size):
+        self.history[player][move[0] * size + move[1]] += depth * depth
+        killers = self.killers[ply]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+
+    # --- ENDGAME SOLVER ---
+    # Jika sisa petak kosong <= self.endgame_empties, langkah dicari dengan perfect play
+    # (game.endgame). Mengembalikan (row, col), atau None jika solver tidak aktif atau
+    # tidak selesai dalam porsi waktunya. Hasil dicatat di self.endgame_stats.
+    def _solve_endgame(self, board, player):
+        self.endgame_stats = {}
+        limit = getattr(self, 'endgame_empties', ENDGAME_EMPTIES)
+        if not limit or board.empty_count > limit:
+            return None
+        deadline = None
+        if self.deadline is not None:
+            deadline = self.start_time + (self.deadline - self.start_time) * ENDGAME_TIME_FRACTION
+        solver = EndgameSolver(board.geometry, deadline, stop=lambda: self.stop_requested)
+        own, opp = board.get_discs(player)
+        try:
+            move, score = solver.solve_root(own, opp)
+        except TimeoutError:
+            self.endgame_stats = {'solved': False, 'endgame_nodes': solver.nodes}
+            self.node_count += solver.nodes
+            return None
+        self.node_count += solver.nodes
+        self.endgame_stats = {'solved': True, 'endgame_nodes': solver.nodes, 'endgame_score': score}
+        self._report_progress(move, depth=board.empty_count, score=score, nodes=solver.nodes, solved=True)
+        return move
+
     def _copy_board(self, board):
-        # Optimasi copy board
-        new_board = Board.__new__(Board)
-        new_board.board = [row[:] for row in board.board]
-        new_board.current_player = board.current_player
-        return new_board
+        # Copy bitboard (dua integer), jauh lebih murah dari copy list-of-lists
+        return board.copy()
+
+    # Salinan papan untuk pencarian make/undo: suku evaluasi yang dipakai
+    # _evaluate_board_advanced di-update incremental (lihat Board.track_eval)
+    def _search_board(self, board):
+        search_board = board.copy()
+        pattern = self._pattern_evaluator(board) is not None
+        # Bobot tuning memakai hitungan per kelas petak, bukan jumlah BOARD_WEIGHTS
+        position = not pattern and self._heuristic_weights(board) is None
+        search_board.track_eval(position=position, patterns=pattern)
+        return search_board
+
+    # Evaluator pola untuk papan ini, atau None (pakai heuristik)
+    def _pattern_evaluator(self, board):
+        if self.use_pattern_eval and board.size == 8:
+            return get_evaluator()
+        return None
+
+    # Bobot heuristik hasil tuning untuk papan ini, atau None (pakai bobot buatan tangan)
+    def _heuristic_weights(self, board):
+        if self.use_tuned_weights:
+            return get_heuristic_weights(board.size)
+        return None
+
+    # Identitas evaluator aktif untuk papan ini: jenis + checksum bobotnya. Parameter yang
+    # difit pada skala skor evaluator (ProbCut) disimpan per kunci ini.
+    def _evaluator_key(self, board):
+        evaluator = self._pattern_evaluator(board)
+        if evaluator is not None:
+            return evaluator.key
+        weights = self._heuristic_weights(board)
+        if weights is not None:
+            return weights.key
+        return f'heuristic{board.size}'
 
     def _get_game_phase(self, board):
-        total_pieces = sum(1 for row in board.board for cell in row if cell is not None)
-        if total_pieces < 20: return 'early'
-        elif total_pieces < 45: return 'mid'
+        # Batas fase 20/45 bidak untuk 8x8, diskalakan ke jumlah petak papan
+        total_pieces = board.black_count + board.white_count
+        cells = board.geometry.cells
+        if total_pieces < cells * 20 // 64: return 'early'
+        elif total_pieces < cells * 45 // 64: return 'mid'
         else: return 'late'
 
+    # Jumlah bidak stabil player (tepi eksak + propagasi garis penuh, lihat game.stability)
     def _count_stable_pieces(self, board, player):
-        stable = 0
-        corners = [(0, 0), (0, 7), (7, 0), (7, 7)]
-        for r, c in corners:
-            if board.board[r][c] == player:
-                stable += 1
-                dx = 1 if c == 0 else -1
-                for i in range(1, 7):
-                    if 0 <= c + i*dx < 8 and board.board[r][c + i*dx] == player: stable += 1
-                    else: break 
-                dy = 1 if r == 0 else -1
-                for i in range(1, 7):
-                    if 0 <= r + i*dy < 8 and board.board[r + i*dy][c] == player: stable += 1
-                    else: break
-        return stable
+        own, opp = board.get_discs(player)
+        return get_stability(board.geometry).count_stable(own, opp)
 
     def _evaluate_board_advanced(self, board, player):
         # 1. CEK GAME OVER (Sudah Benar)
@@ -46,23 +329,33 @@ class BaseAI:
             else:
                 return -1000000 - diff
 
-        # 2. Heuristik Normal
+        # 2. Evaluasi pola (skala 100 per bidak)
+        evaluator = self._pattern_evaluator(board)
+        if evaluator is not None:
+            return evaluator.evaluate(board, player)
+
+        # 3. Heuristik dengan bobot hasil tuning (skala 100 per bidak)
+        game_phase = self._get_game_phase(board)
+        tuned = self._heuristic_weights(board)
+        if tuned is not None:
+            return tuned.evaluate(board, player, game_phase)
+
+        # 4. Heuristik Normal
         black_len, white_len = board.get_score()
-        game_phase = self._get_game_phase(board) 
         
         # --- [TWEAK 1] POSITION SCORE (Tetap) ---
-        position_score = 0
-        for r in range(8):
-            for c in range(8):
-                if board.board[r][c] == player:
-                    position_score += BOARD_WEIGHTS[r][c]
-                elif board.board[r][c] is not None:
-                    position_score -= BOARD_WEIGHTS[r][c]
+        # Papan pencarian melacak jumlah bobot secara incremental (sudut pandang hitam)
+        position_score = board.position_sum
+        if position_score is None:
+            position_score = board.geometry.position_sum(board.black, board.white)
+        if player == 'W':
+            position_score = -position_score
 
         # --- [TWEAK 2] MOBILITY (Dinamis) ---
-        my_moves = len(board.get_valid_moves(player))
+        # Legal mask sudah di-memo oleh is_game_over di atas, jadi ini tidak generate ulang
+        my_moves = board.count_moves(player)
         opponent = 'W' if player == 'B' else 'B'
-        op_moves = len(board.get_valid_moves(opponent))
+        op_moves = board.count_moves(opponent)
         
         # PERUBAHAN: Di Late Game, jangan terlalu peduli mobilitas
         if game_phase == 'late':
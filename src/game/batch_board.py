@@ -0,0 +1,149 @@
+import numpy as np
+
+from game.board import Board, CELLS, FULL_MASK, SHIFTS_LEFT, SHIFTS_RIGHT
+
+# --- BATCH ENGINE (NumPy) ---
+# Menyimpan N papan sekaligus dalam array uint64 dan menjalankan generate langkah,
+# apply langkah dan scoring untuk semua papan dalam satu langkah vektor.
+# Hanya untuk papan <= 64 petak (satu uint64 per warna).
+
+PASS = -1
+
+_U64 = np.uint64
+_FULL = _U64(FULL_MASK) if CELLS <= 64 else None
+# (shift, kiri?, mask anti-wrap, mask lawan) per arah
+_DIRS = tuple((_U64(s), True, _U64(wrap), _U64(inner)) for s, wrap, inner in SHIFTS_LEFT) + \
+        tuple((_U64(s), False, _U64(wrap), _U64(inner)) for s, wrap, inner in SHIFTS_RIGHT)
+_SQUARES = np.arange(CELLS, dtype=np.uint64)
+_ONE = _U64(1)
+
+
+def _shift(x, s, left):
+    return np.left_shift(x, s) & _FULL if left else np.right_shift(x, s)
+
+
+def popcount(x):
+    return np.bitwise_count(x).astype(np.int16)
+
+
+def legal_masks(own, opp):
+    empty = ~(own | opp) & _FULL
+    moves = np.zeros_like(own)
+    for s, left, _, inner in _DIRS:
+        om = opp & inner
+        t = om & _shift(own, s, left)
+        # Jumlah iterasi tetap (maks. panjang deret lawan), tanpa cabang per papan
+        for _ in range(int(CELLS ** 0.5) - 3):
+            t |= om & _shift(t, s, left)
+        moves |= _shift(t, s, left)
+    return moves & empty
+
+
+def flip_masks(own, opp, move_bits):
+    flips = np.zeros_like(own)
+    for s, left, _, inner in _DIRS:
+        om = opp & inner
+        t = om & _shift(move_bits, s, left)
+        for _ in range(int(CELLS ** 0.5) - 3):
+            t |= om & _shift(t, s, left)
+        closed = (_shift(t, s, left) & own) != 0
+        flips |= np.where(closed, t, _U64(0))
+    return flips
+
+
+class BatchBoard:
+    def __init__(self, black, white, to_move):
+        if CELLS > 64:
+            raise ValueError("BatchBoard hanya mendukung papan sampai 8x8")
+        self.black = np.asarray(black, dtype=np.uint64)
+        self.white = np.asarray(white, dtype=np.uint64)
+        # 0 = giliran 'B', 1 = giliran 'W'
+        self.to_move = np.asarray(to_move, dtype=np.int8)
+
+    @classmethod
+    def initial(cls, n):
+        start = Board()
+        return cls(np.full(n, start.black, dtype=np.uint64),
+                   np.full(n, start.white, dtype=np.uint64),
+                   np.zeros(n, dtype=np.int8))
+
+    # --- KONVERSI DARI/KE game.board.Board ---
+    @classmethod
+    def from_boards(cls, boards):
+        if any(b.size * b.size != CELLS for b in boards):
+            raise ValueError("BatchBoard hanya untuk papan berukuran default")
+        return cls(np.array([b.black for b in boards], dtype=np.uint64),
+                   np.array([b.white for b in boards], dtype=np.uint64),
+                   np.array([0 if b.current_player == 'B' else 1 for b in boards], dtype=np.int8))
+
+    def to_boards(self):
+        return [Board.from_bitboards(int(b), int(w), 'B' if t == 0 else 'W')
+                for b, w, t in zip(self.black, self.white, self.to_move)]
+
+    def __len__(self):
+        return len(self.black)
+
+    def own_opp(self):
+        white_turn = self.to_move == 1
+        own = np.where(white_turn, self.white, self.black)
+        opp = np.where(white_turn, self.black, self.white)
+        return own, opp
+
+    # Legal mask untuk pemain yang sedang giliran di setiap papan
+    def legal_moves(self):
+        own, opp = self.own_opp()
+        return legal_masks(own, opp)
+
+    def mobility(self):
+        return popcount(self.legal_moves())
+
+    # squares: indeks petak (row * size + col) per papan, PASS (-1) untuk pass.
+    # Langkah diasumsikan legal (ambil dari legal_moves). Giliran selalu berganti.
+    def apply_moves(self, squares):
+        squares = np.asarray(squares, dtype=np.int64)
+        playing = squares >= 0
+        own, opp = self.own_opp()
+        move_bits = np.where(playing, np.left_shift(_ONE, np.maximum(squares, 0).astype(np.uint64)), _U64(0))
+        flips = flip_masks(own, opp, move_bits)
+        own = own | move_bits | flips
+        opp = opp ^ flips
+        white_turn = self.to_move == 1
+        self.black = np.where(white_turn, opp, own)
+        self.white = np.where(white_turn, own, opp)
+        self.to_move = 1 - self.to_move
+        return flips
+
+    def scores(self):
+        return popcount(self.black), popcount(self.white)
+
+    def is_game_over(self):
+        own, opp = self.own_opp()
+        return (legal_masks(own, opp) == 0) & (legal_masks(opp, own) == 0)
+
+    # Pilih satu langkah legal acak per papan (PASS jika tidak ada langkah)
+    def random_moves(self, rng, legal=None):
+        if legal is None:
+            legal = self.legal_moves()
+        bits = (np.right_shift(legal[:, None], _SQUARES[None, :]) & _ONE).astype(bool)
+        noise = rng.random(bits.shape)
+        noise[~bits] = -1.0
+        choice = noise.argmax(axis=1)
+        return np.where(legal != 0, choice, PASS)
+
+    # Mainkan semua papan sampai selesai dengan langkah acak; kembalikan jumlah langkah yang dimainkan
+    def play_random(self, rng):
+        played = 0
+        passes = np.zeros(len(self), dtype=np.int8)
+        while True:
+            legal = self.legal_moves()
+            active = passes < 2
+            if not active.any():
+                return played
+            moves = self.random_moves(rng, legal)
+            moves = np.where(active, moves, PASS)
+            passes = np.where(moves == PASS, np.minimum(passes + 1, 2), 0)
+            played += int((moves != PASS).sum())
+            to_move = self.to_move
+            self.apply_moves(moves)
+            # Papan yang sudah selesai tidak berganti giliran lagi
+            self.to_move = np.where(active, self.to_move, to_move).astype(np.int8)
@@ -1,125 +1,508 @@
-import pygame
+import copy
+import random
 from utils.constants import *
+from game import symmetry
+from game.pattern_eval import pattern_indices, SQUARE_UPDATES
+
+# --- GEOMETRI BITBOARD ---
+# Petak (row, col) disimpan sebagai bit ke-(row * size + col) dari integer Python
+# (64 bit untuk 8x8, 256 bit untuk 16x16). Semua operasi shift-and-mask bekerja
+# pada seluruh papan sekaligus, jadi biayanya tidak bergantung pada loop per petak.
+class BoardGeometry:
+    def __init__(self, size):
+        if size % 2 or size < 4:
+            raise ValueError(f"Ukuran papan harus genap dan >= 4: {size}")
+        self.size = size
+        self.cells = size * size
+        self.full_mask = (1 << self.cells) - 1
+        self.weights = generate_board_weights(size)
+        self.flat_weights = tuple(w for row in self.weights for w in row) # Indeks = row * size + col
+        self.corners = ((0, 0), (0, size - 1), (size - 1, 0), (size - 1, size - 1))
+
+        col_first = sum(1 << (r * size) for r in range(size))
+        col_last = col_first << (size - 1)
+        not_col_first = self.full_mask ^ col_first
+        not_col_last = self.full_mask ^ col_last
+        inner_cols = not_col_first & not_col_last
+
+        # Tiap arah: (jumlah shift, mask anti-wrap, mask bidak lawan yang boleh dilewati)
+        shifts_left = []
+        shifts_right = []
+        for dr, dc in DIRECTIONS:
+            shift = dr * size + dc
+            wrap = not_col_first if dc == 1 else (not_col_last if dc == -1 else self.full_mask)
+            inner = inner_cols if dc != 0 else self.full_mask
+            if shift > 0:
+                shifts_left.append((shift, wrap, inner))
+            else:
+                shifts_right.append((-shift, wrap, inner))
+        self.shifts_left = tuple(shifts_left)
+        self.shifts_right = tuple(shifts_right)
+
+        # --- ZOBRIST HASHING ---
+        # Kunci acak 64-bit per petak per warna + kunci giliran (seed tetap agar hash stabil antar proses).
+        rng = random.Random(f"zobrist-{size}")
+        self.zobrist_black = tuple(rng.getrandbits(64) for _ in range(self.cells))
+        self.zobrist_white = tuple(rng.getrandbits(64) for _ in range(self.cells))
+        self.zobrist_side = rng.getrandbits(64) # Di-XOR saat giliran 'W'
+        # Bidak yang dibalik berpindah warna: XOR kedua kunci sekaligus
+        self.zobrist_flip = tuple(b ^ w for b, w in zip(self.zobrist_black, self.zobrist_white))
+
+        # Lebar lajur untuk packed(): papan + celah >= shift terbesar (size + 1)
+        self.lane_bits = self.cells + size + 1
+        self._packed = {}
+
+    # --- BANYAK PAPAN DALAM SATU INTEGER ---
+    # Geometri untuk `count` papan yang dikemas berurutan (papan ke-i digeser i * lane_bits).
+    # Semua mask diulang per lajur, jadi legal_mask geometri ini menghitung langkah semua papan
+    # dalam satu panggilan: bit yang tergeser keluar papan jatuh di celah lalu ikut di-mask.
+    def packed(self, count):
+        lanes = self._packed.get(count)
+        if lanes is None:
+            repeat = sum(1 << (i * self.lane_bits) for i in range(count))
+            lanes = copy.copy(self)
+            lanes._packed = None
+            lanes.full_mask = self.full_mask * repeat
+            lanes.shifts_left = tuple((s, wrap * repeat, inner * repeat) for s, wrap, inner in self.shifts_left)
+            lanes.shifts_right = tuple((s, wrap * repeat, inner * repeat) for s, wrap, inner in self.shifts_right)
+            self._packed[count] = lanes
+        return lanes
+
+    def compute_hash(self, black, white, player):
+        zb = self.zobrist_black
+        zw = self.zobrist_white
+        h = self.zobrist_side if player == 'W' else 0
+        while black:
+            low = black & -black
+            h ^= zb[low.bit_length() - 1]
+            black ^= low
+        while white:
+            low = white & -white
+            h ^= zw[low.bit_length() - 1]
+            white ^= low
+        return h
+
+    # Jumlah bobot posisi bidak hitam dikurangi bidak putih (sudut pandang hitam)
+    def position_sum(self, black, white):
+        weights = self.flat_weights
+        total = 0
+        while black:
+            low = black & -black
+            total += weights[low.bit_length() - 1]
+            black ^= low
+        while white:
+            low = white & -white
+            total -= weights[low.bit_length() - 1]
+            white ^= low
+        return total
+
+    def square_bit(self, row, col):
+        return 1 << (row * self.size + col)
+
+    def iter_squares(self, mask):
+        # Iterasi (row, col) dari bit yang menyala, urut baris lalu kolom
+        size = self.size
+        while mask:
+            low = mask & -mask
+            idx = low.bit_length() - 1
+            yield divmod(idx, size)
+            mask ^= low
+
+    def legal_mask(self, own, opp):
+        # Generate semua langkah legal sekaligus (shift-and-mask per arah)
+        empty = self.full_mask ^ (own | opp)
+        moves = 0
+        for s, wrap, inner in self.shifts_left:
+            om = opp & inner
+            t = om & (own << s)
+            while True:
+                nt = t | (om & (t << s))
+                if nt == t: break
+                t = nt
+            moves |= t << s
+        for s, wrap, inner in self.shifts_right:
+            om = opp & inner
+            t = om & (own >> s)
+            while True:
+                nt = t | (om & (t >> s))
+                if nt == t: break
+                t = nt
+            moves |= t >> s
+        return moves & empty
+
+    def flip_mask(self, own, opp, move_bit):
+        # Semua bidak lawan yang terbalik jika own menaruh bidak di move_bit
+        flips = 0
+        for s, wrap, _ in self.shifts_left:
+            f = 0
+            x = (move_bit << s) & wrap
+            while x & opp:
+                f |= x
+                x = (x << s) & wrap
+            if x & own:
+                flips |= f
+        for s, wrap, _ in self.shifts_right:
+            f = 0
+            x = (move_bit >> s) & wrap
+            while x & opp:
+                f |= x
+                x = (x >> s) & wrap
+            if x & own:
+                flips |= f
+        return flips
+
+
+_GEOMETRIES = {}
+
+def get_geometry(size=BOARD_SIZE):
+    geometry = _GEOMETRIES.get(size)
+    if geometry is None:
+        geometry = _GEOMETRIES[size] = BoardGeometry(size)
+    return geometry
+
+
+# Alias modul untuk ukuran default (BOARD_SIZE), dipakai batch engine, codec, dll.
+DEFAULT_GEOMETRY = get_geometry(BOARD_SIZE)
+CELLS = DEFAULT_GEOMETRY.cells
+FULL_MASK = DEFAULT_GEOMETRY.full_mask
+SHIFTS_LEFT = DEFAULT_GEOMETRY.shifts_left
+SHIFTS_RIGHT = DEFAULT_GEOMETRY.shifts_right
+compute_hash = DEFAULT_GEOMETRY.compute_hash
+square_bit = DEFAULT_GEOMETRY.square_bit
+iter_squares = DEFAULT_GEOMETRY.iter_squares
+legal_mask = DEFAULT_GEOMETRY.legal_mask
+flip_mask = DEFAULT_GEOMETRY.flip_mask
+
+# Mode verifikasi: hitung ulang hash dari nol setiap mutasi dan assert sama (lambat, untuk debug)
+VERIFY_HASH = False
+# Sama untuk suku evaluasi incremental (position_sum & patterns, lihat Board.track_eval)
+VERIFY_EVAL = False
+
 
 class Board:
-    def __init__(self):
+    # Suku evaluasi incremental; None = tidak dilacak (default, lihat track_eval)
+    position_sum = None
+    patterns = None
+
+    def __init__(self, size=BOARD_SIZE):
+        self.geometry = get_geometry(size)
+        self.size = size
         self.reset()
-    
+
     # Reset papan ke kondisi awal
     def reset(self):
-        self.board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
-        
-        # Posisi awal
-        mid = BOARD_SIZE // 2
-        self.board[mid-1][mid-1] = 'W'
-        self.board[mid][mid] = 'W'
-        self.board[mid-1][mid] = 'B'
-        self.board[mid][mid-1] = 'B'
-        
-        self.current_player = 'B'  # Black starts
-    
+        geo = self.geometry
+        mid = self.size // 2
+        self.white = geo.square_bit(mid-1, mid-1) | geo.square_bit(mid, mid)
+        self.black = geo.square_bit(mid-1, mid) | geo.square_bit(mid, mid-1)
+        self._current_player = 'B'  # Black starts
+        self._sync_state()
+
+    # Bobot posisi untuk ukuran papan ini (BOARD_WEIGHTS untuk 8x8)
+    @property
+    def weights(self):
+        return self.geometry.weights
+
+    # Hitung ulang semua state turunan (hash, jumlah bidak, cache) dari bitboard
+    def _sync_state(self):
+        self.hash = self.geometry.compute_hash(self.black, self.white, self._current_player)
+        self.black_count = self.black.bit_count()
+        self.white_count = self.white.bit_count()
+        self.empty_count = self.geometry.cells - self.black_count - self.white_count
+        self._cache = None
+        self._grid = None
+        if self.position_sum is not None or self.patterns is not None:
+            self.track_eval(self.position_sum is not None, self.patterns is not None)
+
+    # --- EVALUASI INCREMENTAL ---
+    # Papan pencarian melacak suku evaluasi yang hanya berubah di petak yang ditaruh/dibalik:
+    #   position_sum: jumlah bobot posisi hitam - putih (heuristik _evaluate_board_advanced)
+    #   patterns: indeks semua instance pola (game.pattern_eval, hanya 8x8)
+    # make_move meng-update keduanya per petak yang berubah, undo_move memulihkan nilai lama.
+    # Jumlah bidak (black_count / white_count) selalu incremental.
+    def track_eval(self, position=True, patterns=False):
+        self.position_sum = self.geometry.position_sum(self.black, self.white) if position else None
+        self.patterns = pattern_indices(self.black, self.white) if patterns and self.size == 8 else None
+
+    def verify_eval(self):
+        if self.position_sum is not None:
+            expected = self.geometry.position_sum(self.black, self.white)
+            assert self.position_sum == expected, f"position_sum mismatch: {self.position_sum} != {expected}"
+        if self.patterns is not None:
+            assert self.patterns == pattern_indices(self.black, self.white), "Indeks pola tidak cocok"
+
+    # Giliran ikut masuk hash: setiap assignment current_player meng-update hash
+    @property
+    def current_player(self):
+        return self._current_player
+
+    @current_player.setter
+    def current_player(self, player):
+        if player != self._current_player:
+            self.hash ^= self.geometry.zobrist_side
+            self._current_player = player
+            if VERIFY_HASH: self.verify_hash()
+
+    # Pass giliran (tidak ada langkah valid)
+    def pass_turn(self):
+        self.current_player = 'W' if self._current_player == 'B' else 'B'
+
+    def verify_hash(self):
+        expected = self.geometry.compute_hash(self.black, self.white, self._current_player)
+        assert self.hash == expected, f"Zobrist hash mismatch: {self.hash:#x} != {expected:#x}"
+
+    # --- KOMPATIBILITAS: akses list-of-lists untuk GUI & kode lama ---
+    # Grid dibangun ulang dari bitboard dan di-cache sampai papan berubah.
+    # Perlakukan sebagai read-only; untuk mengubah papan, assign grid baru.
+    @property
+    def board(self):
+        if self._grid is None:
+            size = self.size
+            grid = [[None] * size for _ in range(size)]
+            for r, c in self.geometry.iter_squares(self.black):
+                grid[r][c] = 'B'
+            for r, c in self.geometry.iter_squares(self.white):
+                grid[r][c] = 'W'
+            self._grid = grid
+        return self._grid
+
+    @board.setter
+    def board(self, grid):
+        # Ukuran papan mengikuti grid yang di-assign
+        if len(grid) != self.size:
+            self.size = len(grid)
+            self.geometry = get_geometry(self.size)
+        black = white = 0
+        for r in range(self.size):
+            for c in range(self.size):
+                if grid[r][c] == 'B':
+                    black |= self.geometry.square_bit(r, c)
+                elif grid[r][c] == 'W':
+                    white |= self.geometry.square_bit(r, c)
+        self.black = black
+        self.white = white
+        self._sync_state()
+
+    # Bangun papan langsung dari bitboard (dipakai batch engine, codec, dll.)
+    @classmethod
+    def from_bitboards(cls, black, white, current_player='B', size=BOARD_SIZE):
+        board = cls.__new__(cls)
+        board.geometry = get_geometry(size)
+        board.size = size
+        board.black = black
+        board.white = white
+        board._current_player = current_player
+        board._sync_state()
+        return board
+
+    def copy(self):
+        new_board = Board.__new__(Board)
+        new_board.geometry = self.geometry
+        new_board.size = self.size
+        new_board.black = self.black
+        new_board.white = self.white
+        new_board._current_player = self._current_player
+        new_board.hash = self.hash
+        new_board.black_count = self.black_count
+        new_board.white_count = self.white_count
+        new_board.empty_count = self.empty_count
+        new_board._cache = self._cache # Dipakai bersama: cache tidak pernah diubah setelah mutasi
+        new_board._grid = None
+        new_board.position_sum = self.position_sum
+        new_board.patterns = self.patterns # List baru dibuat tiap make_move, jadi aman dipakai bersama
+        return new_board
+
+    def get_discs(self, player):
+        if player == 'B':
+            return self.black, self.white
+        return self.white, self.black
+
+    # --- CACHE PER POSISI ---
+    # Legal mask, daftar langkah dan status game over di-memo sampai mutasi berikutnya.
+    # make_move menyimpan cache lama di undo record, jadi undo_move memulihkannya.
+    def _get_cache(self):
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = {}
+        return cache
+
+    def legal_moves_mask(self, player):
+        cache = self._get_cache()
+        mask = cache.get(player)
+        if mask is None:
+            own, opp = self.get_discs(player)
+            mask = cache[player] = self.geometry.legal_mask(own, opp)
+        return mask
+
+    # Jumlah langkah legal (mobility) tanpa membangun list
+    def count_moves(self, player):
+        return self.legal_moves_mask(player).bit_count()
+
+    # --- SIMETRI ---
+    # Bentuk kanonik ((black, white), transform) dari 8 posisi simetris (D4).
+    # Langkah dipetakan dengan symmetry.transform_square / inverse_transform_square.
+    def canonical(self):
+        return symmetry.canonical(self.black, self.white, self.size)
+
+    # Kunci posisi yang sama untuk semua posisi simetris (untuk cache, book, dedup riwayat)
+    def canonical_key(self):
+        (black, white), _ = self.canonical()
+        return black, white, self._current_player
+
     # Cek apakah gerakan valid
     def is_valid_move(self, row, col, player):
-        # Cek jika posisi sudah terisi
-        if self.board[row][col] is not None:
-            return False
-        
-        opponent = 'W' if player == 'B' else 'B'
-        valid = False
-        
-        for dr, dc in DIRECTIONS:
-            r, c = row + dr, col + dc
-            found_opponent = False
-            
-            while 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE:
-                if self.board[r][c] == opponent:
-                    found_opponent = True
-                elif self.board[r][c] == player:
-                    if found_opponent:
-                        valid = True
-                    break
-                else:  # Kosong atau None
-                    break
-                r += dr
-                c += dc
-        
-        return valid
-    
-    # Lakukan gerakan jika valid
-    def make_move(self, row, col, player):
-        if not self.is_valid_move(row, col, player):
-            return False
-        
-        self.board[row][col] = player
-        opponent = 'W' if player == 'B' else 'B'
-        pieces_flipped = 0
-        
-        # Balikkan bidak lawan
-        for dr, dc in DIRECTIONS:
-            r, c = row + dr, col + dc
-            to_flip = []
-            
-            while 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE:
-                if self.board[r][c] == opponent:
-                    to_flip.append((r, c))
-                elif self.board[r][c] == player:
-                    # Balikkan semua bidak di antara
-                    for flip_r, flip_c in to_flip:
-                        self.board[flip_r][flip_c] = player
-                        pieces_flipped += 1
-                    break
-                else:  # Kosong
-                    break
-                r += dr
-                c += dc
-        
-        return True
-    
+        return bool(self.legal_moves_mask(player) & self.geometry.square_bit(row, col))
+
+    # Lakukan gerakan jika valid (in-place).
+    # Mengembalikan undo record (truthy) untuk undo_move, atau False jika tidak valid.
+    # Jika `flips` dari generate_moves diberikan, validasi dan scan ulang dilewati.
+    def make_move(self, row, col, player, flips=None):
+        geo = self.geometry
+        bit = 1 << (row * self.size + col)
+        own, opp = self.get_discs(player)
+        if flips is None:
+            if (own | opp) & bit:
+                return False
+            flips = geo.flip_mask(own, opp, bit)
+            if not flips:
+                return False
+
+        undo = (player, bit, flips, self._current_player, self.hash, self._cache, self.position_sum, self.patterns)
+
+        # Taruh bidak dan balikkan bidak lawan sekaligus
+        idx = bit.bit_length() - 1
+        flipped = flips.bit_count()
+        if player == 'B':
+            self.black = own | bit | flips
+            self.white = opp ^ flips
+            self.black_count += flipped + 1
+            self.white_count -= flipped
+            h = self.hash ^ geo.zobrist_black[idx]
+        else:
+            self.white = own | bit | flips
+            self.black = opp ^ flips
+            self.white_count += flipped + 1
+            self.black_count -= flipped
+            h = self.hash ^ geo.zobrist_white[idx]
+        self.empty_count -= 1
+
+        # Update hash incremental untuk tiap bidak yang dibalik
+        zobrist_flip = geo.zobrist_flip
+        if self.position_sum is None and self.patterns is None:
+            while flips:
+                low = flips & -flips
+                h ^= zobrist_flip[low.bit_length() - 1]
+                flips ^= low
+        else:
+            h = self._update_eval(player, idx, flips, h)
+        self.hash = h
+        self._cache = None
+        self._grid = None
+        if VERIFY_HASH: self.verify_hash()
+        if VERIFY_EVAL: self.verify_eval()
+        return undo
+
+    # make_move dengan pelacakan evaluasi: hash, position_sum dan indeks pola di-update dalam
+    # satu lintasan atas petak yang berubah. Mengembalikan hash baru.
+    def _update_eval(self, player, idx, flips, h):
+        zobrist_flip = self.geometry.zobrist_flip
+        weights = self.geometry.flat_weights
+        position_sum = self.position_sum
+        patterns = self.patterns
+        # Bobot sudut pandang hitam: bidak dibalik pindah dari -w ke +w (atau sebaliknya)
+        sign = 1 if player == 'B' else -1
+        if patterns is not None:
+            # List baru: list lama tetap utuh di undo record dan di salinan papan
+            patterns = patterns[:]
+            place, flip = SQUARE_UPDATES[player]
+            for inst, delta in place[idx]:
+                patterns[inst] += delta
+        if position_sum is not None:
+            position_sum += sign * weights[idx]
+        while flips:
+            low = flips & -flips
+            i = low.bit_length() - 1
+            h ^= zobrist_flip[i]
+            if position_sum is not None:
+                position_sum += 2 * sign * weights[i]
+            if patterns is not None:
+                for inst, delta in flip[i]:
+                    patterns[inst] += delta
+            flips ^= low
+        self.position_sum = position_sum
+        self.patterns = patterns
+        return h
+
+    # Kembalikan posisi persis seperti sebelum make_move yang menghasilkan undo
+    def undo_move(self, undo):
+        player, bit, flips, prev_player, prev_hash, prev_cache, prev_position_sum, prev_patterns = undo
+        flipped = flips.bit_count()
+        if player == 'B':
+            self.black ^= bit | flips
+            self.white |= flips
+            self.black_count -= flipped + 1
+            self.white_count += flipped
+        else:
+            self.white ^= bit | flips
+            self.black |= flips
+            self.white_count -= flipped + 1
+            self.black_count += flipped
+        self.empty_count += 1
+        self._current_player = prev_player
+        self.hash = prev_hash
+        self._cache = prev_cache
+        self._grid = None
+        self.position_sum = prev_position_sum
+        self.patterns = prev_patterns
+        if VERIFY_HASH: self.verify_hash()
+        if VERIFY_EVAL: self.verify_eval()
+
+    # Generate semua langkah legal beserta flip mask-nya dalam satu lintasan:
+    # hanya petak dari legal_mask yang dikunjungi. Hasil: (((row, col), flips), ...)
+    # Di-memo per posisi, karena itu dikembalikan sebagai tuple (jangan diubah).
+    def generate_moves(self, player):
+        cache = self._get_cache()
+        key = 'moves_' + player
+        moves = cache.get(key)
+        if moves is None:
+            own, opp = self.get_discs(player)
+            mask = self.legal_moves_mask(player)
+            flip = self.geometry.flip_mask
+            size = self.size
+            moves = []
+            while mask:
+                low = mask & -mask
+                moves.append((divmod(low.bit_length() - 1, size), flip(own, opp, low)))
+                mask ^= low
+            moves = cache[key] = tuple(moves)
+        return moves
+
     # Dapatkan semua gerakan valid untuk pemain
     def get_valid_moves(self, player):
-        moves = []
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                if self.is_valid_move(row, col, player):
-                    moves.append((row, col))
-        return moves
-    
+        return list(self.geometry.iter_squares(self.legal_moves_mask(player)))
+
     # Hitung skor untuk kedua pemain
     def get_score(self):
-        black_count = 0
-        white_count = 0
-        
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                if self.board[row][col] == 'B':
-                    black_count += 1
-                elif self.board[row][col] == 'W':
-                    white_count += 1
-        
-        return black_count, white_count
-    
+        return self.black_count, self.white_count
+
     # Cek apakah permainan sudah selesai
     def is_game_over(self):
-        # Jika tidak ada gerakan valid untuk kedua pemain
-        if not self.get_valid_moves('B') and not self.get_valid_moves('W'):
-            return True
-        
         # Jika papan penuh
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                if self.board[row][col] is None:
-                    return False
-        return True
-    
+        if not self.empty_count:
+            return True
+
+        # Jika tidak ada gerakan valid untuk kedua pemain
+        return not self.legal_moves_mask('B') and not self.legal_moves_mask('W')
+
     # Tentukan pemenang permainan
     def get_winner(self):
         if not self.is_game_over():
             return None
-        
+
         black, white = self.get_score()
         if black > white:
             return 'B'
         elif white > black:
             return 'W'
         else:
-            return 'D'  # Draw
\ No newline at end of file
+            return 'D'  # Draw
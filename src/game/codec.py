@@ -0,0 +1,117 @@
+import struct
+
+try:
+    import numpy as np
+except ImportError: # Hanya fungsi bulk yang butuh NumPy; codec posisi tunggal & game tidak
+    np = None
+
+from game.board import Board, BOARD_SIZE
+
+# --- CODEC BINER POSISI & GAME ---
+# Posisi: bitboard black + white (little-endian) + bit giliran (0 = 'B', 1 = 'W').
+#   - satu posisi 8x8: 8 + 8 + 1 = 17 byte (bit giliran disimpan dalam 1 byte)
+#   - bulk (8x8): N x 16 byte bidak + bit giliran di-pack 8 per byte
+#   - ukuran lain: ceil(size*size / 8) byte per warna
+# Game: satu byte per langkah = indeks petak (row * size + col), sampai 16x16.
+#   Pass dikodekan sebagai indeks petak tengah kiri-atas, yang terisi sejak awal
+#   sehingga tidak pernah menjadi langkah (lihat pass_code).
+
+POSITION_BYTES = 17
+POSITIONS_MAGIC = b'OTHP'
+_HEADER = struct.Struct('<4sI') # magic, jumlah posisi
+
+
+def pass_code(size=BOARD_SIZE):
+    mid = size // 2
+    return (mid - 1) * size + (mid - 1)
+
+
+PASS_CODE = pass_code(BOARD_SIZE)
+
+
+def _disc_bytes(size):
+    return (size * size + 7) // 8
+
+
+def encode_position(board):
+    n = _disc_bytes(board.size)
+    return (board.black.to_bytes(n, 'little') + board.white.to_bytes(n, 'little')
+            + bytes((0 if board.current_player == 'B' else 1,)))
+
+
+def decode_position(data, size=BOARD_SIZE):
+    n = _disc_bytes(size)
+    black = int.from_bytes(data[:n], 'little')
+    white = int.from_bytes(data[n:2 * n], 'little')
+    return Board.from_bitboards(black, white, 'W' if data[2 * n] else 'B', size)
+
+
+# --- BULK (NumPy, papan 8x8) ---
+# discs: array (N, 2) uint64 [black, white]; sides: array (N,) uint8 0/1
+def boards_to_arrays(boards):
+    discs = np.array([(b.black, b.white) for b in boards], dtype=np.uint64).reshape(-1, 2)
+    sides = np.array([0 if b.current_player == 'B' else 1 for b in boards], dtype=np.uint8)
+    return discs, sides
+
+
+def arrays_to_boards(discs, sides):
+    return [Board.from_bitboards(int(b), int(w), 'W' if s else 'B')
+            for (b, w), s in zip(discs, sides)]
+
+
+def encode_positions(discs, sides):
+    discs = np.ascontiguousarray(discs, dtype='<u8')
+    return discs.tobytes() + np.packbits(np.asarray(sides, dtype=np.uint8)).tobytes()
+
+
+def decode_positions(data, count):
+    discs = np.frombuffer(data, dtype='<u8', count=count * 2).reshape(count, 2)
+    packed = np.frombuffer(data, dtype=np.uint8, offset=count * 16)
+    sides = np.unpackbits(packed, count=count)
+    return discs, sides
+
+
+def save_positions(path, discs, sides):
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(POSITIONS_MAGIC, len(discs)))
+        f.write(encode_positions(discs, sides))
+
+
+# mmap=True: bidak dibaca lewat np.memmap tanpa memuat seluruh file ke memori
+def load_positions(path, mmap=True):
+    with open(path, 'rb') as f:
+        magic, count = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != POSITIONS_MAGIC:
+            raise ValueError(f"Bukan file posisi Othello: {path}")
+        if not mmap:
+            return decode_positions(f.read(), count)
+    discs = np.memmap(path, dtype='<u8', mode='r', offset=_HEADER.size, shape=(count, 2))
+    packed = np.memmap(path, dtype=np.uint8, mode='r', offset=_HEADER.size + count * 16)
+    return discs, np.unpackbits(packed, count=count)
+
+
+# --- GAME ---
+# moves: list (row, col) atau None untuk pass
+def encode_game(moves, size=BOARD_SIZE):
+    if size > 16:
+        raise ValueError("Encoding game 1 byte/langkah hanya sampai papan 16x16")
+    code = pass_code(size)
+    return bytes(code if m is None else m[0] * size + m[1] for m in moves)
+
+
+def decode_game(data, size=BOARD_SIZE):
+    code = pass_code(size)
+    return [None if c == code else divmod(c, size) for c in data]
+
+
+# Mainkan ulang game dari posisi awal; kembalikan list posisi (termasuk awal & akhir)
+def replay_game(data, size=BOARD_SIZE):
+    board = Board(size)
+    positions = [board.copy()]
+    for move in decode_game(data, size):
+        if move is not None:
+            if not board.make_move(move[0], move[1], board.current_player):
+                raise ValueError(f"Langkah tidak valid saat replay: {move}")
+        board.pass_turn()
+        positions.append(board.copy())
+    return positions
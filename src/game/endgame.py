@@ -0,0 +1,180 @@
+import time
+
+# --- SOLVER ENDGAME EKSAK ---
+# Perfect play untuk N petak kosong terakhir: negamax alpha-beta langsung di atas
+# bitboard (int own/opp), skor = selisih bidak akhir (petak kosong untuk pemenang).
+# Urutan langkah:
+#   - empties > FASTEST_FIRST_EMPTIES: fastest-first (mobilitas lawan paling kecil dulu)
+#   - sisanya: parity, petak di region (kuadran) dengan jumlah kosong ganjil dulu,
+#     tanpa list/sort, cukup iterasi bit
+# Parity region di-update incremental (XOR mask kuadran petak yang diisi).
+
+ENDGAME_EMPTIES = 12 # Default batas aktif solver untuk semua engine (0 = nonaktif)
+FASTEST_FIRST_EMPTIES = 6
+# Porsi time_limit untuk solver; jika tidak selesai, sisa waktu untuk pencarian biasa
+ENDGAME_TIME_FRACTION = 0.5
+
+
+class EndgameSolver:
+    # stop: callable tanpa argumen, True = putus sekarang (dicek bersama deadline)
+    def __init__(self, geometry, deadline=None, stop=None):
+        self.geometry = geometry
+        self.deadline = deadline
+        self.stop = stop
+        self.nodes = 0
+        self.cells = geometry.cells
+        self.full_mask = geometry.full_mask
+        self.legal_mask = geometry.legal_mask
+        self.flip_mask = geometry.flip_mask
+
+        # Mask kuadran per petak (region untuk parity)
+        size = geometry.size
+        half = size // 2
+        quadrants = [0, 0, 0, 0]
+        for r in range(size):
+            for c in range(size):
+                quadrants[(r >= half) * 2 + (c >= half)] |= geometry.square_bit(r, c)
+        self.regions = tuple(quadrants)
+        self.region_of = tuple(quadrants[(idx // size >= half) * 2 + (idx % size >= half)]
+                               for idx in range(self.cells))
+
+    def parity_mask(self, empty):
+        odd = 0
+        for region in self.regions:
+            if (empty & region).bit_count() & 1:
+                odd |= region
+        return odd
+
+    # Skor akhir dari sudut pandang own; petak kosong dihitung untuk pemenang
+    def final_score(self, own, opp):
+        own_count = own.bit_count()
+        opp_count = opp.bit_count()
+        diff = own_count - opp_count
+        if diff > 0: return diff + self.cells - own_count - opp_count
+        if diff < 0: return diff - self.cells + own_count + opp_count
+        return 0
+
+    # Cari langkah terbaik root. Mengembalikan ((row, col), skor) atau (None, skor) jika harus pass.
+    def solve_root(self, own, opp):
+        empty = self.full_mask ^ (own | opp)
+        odd = self.parity_mask(empty)
+        moves = self.legal_mask(own, opp)
+        if not moves:
+            return None, -self.solve(opp, own, -self.cells - 1, self.cells + 1, odd, True)
+        alpha = -self.cells - 1
+        best_bit = 0
+        for _, bit, new_own, new_opp in self._sorted_children(own, opp, moves, odd):
+            self.nodes += 1
+            child_odd = odd ^ self.region_of[bit.bit_length() - 1]
+            if best_bit:
+                # Zero-window: cukup buktikan langkah ini tidak lebih baik
+                score = -self.solve(new_opp, new_own, -alpha - 1, -alpha, child_odd)
+                if score <= alpha: continue
+            score = -self.solve(new_opp, new_own, -self.cells - 1, -alpha, child_odd)
+            if score > alpha or not best_bit:
+                alpha = score
+                best_bit = bit
+        return divmod(best_bit.bit_length() - 1, self.geometry.size), alpha
+
+    # Urutan fastest-first; pada mobilitas seri, petak region ganjil didahulukan
+    def _sorted_children(self, own, opp, moves, odd):
+        legal_mask = self.legal_mask
+        flip_mask = self.flip_mask
+        children = []
+        while moves:
+            bit = moves & -moves
+            moves ^= bit
+            flips = flip_mask(own, opp, bit)
+            new_own = own | bit | flips
+            new_opp = opp ^ flips
+            mobility = legal_mask(new_opp, new_own).bit_count()
+            children.append((mobility * 2 - (1 if bit & odd else 0), bit, new_own, new_opp))
+        children.sort()
+        return children
+
+    def solve(self, own, opp, alpha, beta, odd, passed=False):
+        self.nodes += 1
+        if not self.nodes & 1023:
+            if (self.deadline is not None and time.monotonic() >= self.deadline) or (self.stop is not None and self.stop()):
+                raise TimeoutError("Endgame solver time limit")
+
+        empty = self.full_mask ^ (own | opp)
+        if not empty:
+            return own.bit_count() - opp.bit_count()
+        if not empty & (empty - 1):
+            return self._solve_last(own, opp, empty)
+
+        moves = self.legal_mask(own, opp)
+        if not moves:
+            if passed:
+                return self.final_score(own, opp)
+            return -self.solve(opp, own, -beta, -alpha, odd, True)
+
+        best = -self.cells - 1
+        region_of = self.region_of
+        if empty.bit_count() > FASTEST_FIRST_EMPTIES:
+            for _, bit, new_own, new_opp in self._sorted_children(own, opp, moves, odd):
+                child_odd = odd ^ region_of[bit.bit_length() - 1]
+                if best > -self.cells - 1 and beta - alpha > 1:
+                    # PVS: anak selain yang pertama dicek dulu dengan zero-window
+                    score = -self.solve(new_opp, new_own, -alpha - 1, -alpha, child_odd)
+                    if alpha < score < beta:
+                        score = -self.solve(new_opp, new_own, -beta, -score, child_odd)
+                else:
+                    score = -self.solve(new_opp, new_own, -beta, -alpha, child_odd)
+                if score > best:
+                    best = score
+                    if score > alpha:
+                        alpha = score
+                        if alpha >= beta: return best
+            return best
+
+        # Sedikit petak kosong: parity order, langsung iterasi bit tanpa membangun list
+        flip_mask = self.flip_mask
+        for group in (moves & odd, moves & ~odd):
+            while group:
+                bit = group & -group
+                group ^= bit
+                flips = flip_mask(own, opp, bit)
+                score = -self.solve(opp ^ flips, own | bit | flips, -beta, -alpha,
+                                    odd ^ region_of[bit.bit_length() - 1])
+                if score > best:
+                    best = score
+                    if score > alpha:
+                        alpha = score
+                        if alpha >= beta: return best
+        return best
+
+    # Satu petak kosong terakhir: hitung langsung tanpa rekursi
+    def _solve_last(self, own, opp, bit):
+        diff = own.bit_count() - opp.bit_count()
+        flips = self.flip_mask(own, opp, bit)
+        if flips:
+            return diff + 2 * flips.bit_count() + 1
+        flips = self.flip_mask(opp, own, bit)
+        if flips:
+            return diff - 2 * flips.bit_count() - 1
+        return self.final_score(own, opp)
+
+
+# --- REFERENSI BRUTE FORCE (untuk verifikasi, eksponensial terhadap petak kosong) ---
+# Negamax polos tanpa pruning maupun ordering; skor dengan aturan yang sama dengan
+# EndgameSolver (petak kosong untuk pemenang jika kedua pemain harus pass).
+def reference_score(geometry, own, opp, passed=False):
+    moves = geometry.legal_mask(own, opp)
+    if not moves:
+        if passed or own | opp == geometry.full_mask:
+            own_count = own.bit_count()
+            opp_count = opp.bit_count()
+            diff = own_count - opp_count
+            empties = geometry.cells - own_count - opp_count
+            return diff + empties if diff > 0 else diff - empties if diff < 0 else 0
+        return -reference_score(geometry, opp, own, True)
+    best = -geometry.cells - 1
+    flip_mask = geometry.flip_mask
+    while moves:
+        bit = moves & -moves
+        moves ^= bit
+        flips = flip_mask(own, opp, bit)
+        best = max(best, -reference_score(geometry, opp ^ flips, own | bit | flips))
+    return best
@@ -2,13 +2,22 @@ import random
 import time
 from game.board import Board
 from utils.helpers import save_game_history
+from game.codec import encode_game
+from utils.constants import BOARD_SIZE
 from game.minmaxAI import MinimaxAI
 from game.alphabetaAI import AlphaBetaAI
 from game.mctsAI import MonteCarloAI  # <--- TAMBAHAN BARU
+from game.stability import get_stability
+from game.time_manager import TimeManager
+
+# Metrik per langkah (last_stats) yang dirata-rata di get_match_stats jika diisi engine
+AVERAGED_STATS = ('leaf_evals', 'ebf', 'cutoff_ratio', 'first_move_cutoff', 'tt_hit_rate',
+                  'simulations', 'tree_size')
 
 class GameLogic:
-    def __init__(self, game_mode='pvp', ai_difficulty='alphabeta', num_games=1, ai_depth=3, ai_time_limit=None, bot_config=None , mcts_iterations=1000):
-        self.board = Board()
+    def __init__(self, game_mode='pvp', ai_difficulty='alphabeta', num_games=1, ai_depth=3, ai_time_limit=None, bot_config=None , mcts_iterations=1000, board_size=BOARD_SIZE, ponder=True, game_time=None, collect_stats=True):
+        self.board_size = board_size
+        self.board = Board(board_size)
         self.game_mode = game_mode
         self.ai_difficulty = ai_difficulty
         self.num_games = num_games
@@ -18,9 +27,18 @@ class GameLogic:
         
         self.ai_depth = ai_depth
         self.ai_time_limit = ai_time_limit
+        # Jam per game (detik per pemain) untuk Minimax/AlphaBeta; None = budget datar ai_time_limit
+        self.game_time = game_time
         self.mcts_iterations = mcts_iterations
         self.stats_history = {'B': [], 'W': []}
+        self.move_history = [] # Langkah game berjalan: (row, col) atau None untuk pass
         self.bot_config = bot_config 
+        # Pondering (mode pvb): bot berpikir di thread latar selama giliran manusia
+        self.ponder = ponder
+        self._pondering = False
+        # Bot yang sedang mencari di thread latar (start_ai_move / poll_ai_move)
+        self._thinking_ai = None
+        self._thinking_player = None
         
         self.black_algo_name = "Player"
         self.white_algo_name = "Player"
@@ -89,6 +107,19 @@ class GameLogic:
                 self.black_algo_name = name
                 self.white_algo_name = name
 
+            # Counter instrumentasi per node (lihat BaseAI._search_stats)
+            for ai in (self.ai_black, self.ai_white):
+                if ai: ai.collect_stats = collect_stats
+
+            # Tabel stabilitas tepi (10x10: ~0.5s) dibuat sekarang, bukan di jam langkah pertama bot
+            get_stability(self.board.geometry)
+
+            # Jam per game: setiap bot iterative deepening dapat TimeManager sendiri
+            if self.game_time:
+                for ai in (self.ai_black, self.ai_white):
+                    if hasattr(ai, 'time_manager'):
+                        ai.time_manager = TimeManager(total_time=self.game_time, move_time=self.ai_time_limit)
+
     def record_game_result(self):
         stats = self.get_match_stats()
         winner = self.board.get_winner()
@@ -102,44 +133,106 @@ class GameLogic:
             'b_stats': stats['B'],
             'w_stats': stats['W'],
             'b_name': self.black_algo_name, 
-            'w_name': self.white_algo_name
+            'w_name': self.white_algo_name,
+            'moves': encode_game(self.move_history, self.board_size).hex() # 1 byte per langkah (lihat game.codec)
         }
         self.game_results.append(result_data)
 
-    def ai_move(self):
-        if self.board.is_game_over(): return False
+    # --- PONDERING (pvb) ---
+    # Bot (putih) mencari posisi manusia di thread latar; hasilnya tersimpan di TT bot.
+    # Hanya engine yang punya start_ponder (AlphaBetaAI) yang ikut.
+    def start_pondering(self):
+        if not self.ponder or self.game_mode != 'pvb' or self._pondering:
+            return
+        ai = self.ai_white
+        if not hasattr(ai, 'start_ponder') or self.board.current_player != 'B' or self.board.is_game_over():
+            return
+        ai.start_ponder(self.board, 'B')
+        self._pondering = True
 
-        current_player = self.board.current_player
-        move = None
-        active_ai = None 
+    # Hentikan pondering dan tunggu thread selesai (wajib sebelum bot dipakai lagi)
+    def stop_pondering(self):
+        if not self._pondering:
+            return
+        self.ai_white.stop()
+        self._pondering = False
+
+    # --- LANGKAH AI (anytime API) ---
+    # start_ai_move memulai pencarian di thread latar; poll_ai_move menerapkan langkahnya
+    # setelah pencarian selesai (dipanggil tiap frame oleh GUI, tidak pernah blocking).
+    def _current_ai(self):
+        if self.game_mode not in ['pvb', 'bvb', 'bvb_compare']:
+            return None
+        return self.ai_black if self.board.current_player == 'B' else self.ai_white
+
+    def is_ai_thinking(self):
+        return self._thinking_ai is not None
+
+    def start_ai_move(self):
+        self.stop_pondering()
+        if self.board.is_game_over() or self._thinking_ai is not None: return False
+        ai = self._current_ai()
+        if ai is None:
+            return False
+        self._thinking_player = self.board.current_player
+        self._thinking_ai = ai
+        ai.start(self.board, self._thinking_player)
+        return True
 
+    # True jika langkah AI (atau pass) sudah diterapkan ke papan
+    def poll_ai_move(self):
+        ai = self._thinking_ai
+        if ai is None or ai.is_thinking():
+            return False
+        move = ai.wait()
+        self._thinking_ai = None
+        return self._apply_ai_move(ai, self._thinking_player, move)
+
+    # Putus pencarian sekarang; langkah terbaik sementaranya diterapkan oleh poll_ai_move berikutnya
+    def force_ai_move(self):
+        if self._thinking_ai is None:
+            return False
+        self._thinking_ai.stop()
+        return True
+
+    # Buang pencarian yang sedang berjalan (keluar dari game / game baru)
+    def cancel_ai_move(self):
+        if self._thinking_ai is not None:
+            self._thinking_ai.stop()
+            self._thinking_ai = None
+
+    # Versi blocking: cari dan langsung terapkan langkah AI
+    def ai_move(self):
+        if not self.start_ai_move():
+            return False
+        self._thinking_ai.wait()
+        return self.poll_ai_move()
+
+    def _apply_ai_move(self, active_ai, current_player, move):
         try:
-            if current_player == 'B' and self.game_mode in ['pvb', 'bvb', 'bvb_compare']:
-                move = self.ai_black.get_move(self.board, 'B')
-                active_ai = self.ai_black
-            elif current_player == 'W' and self.game_mode in ['pvb', 'bvb', 'bvb_compare']:
-                move = self.ai_white.get_move(self.board, 'W')
-                active_ai = self.ai_white
-            else:
-                return False
+            if active_ai.search_error is not None:
+                raise active_ai.search_error
 
             if move:
                 # Simpan statistik langkah (Depth/Simulations & Time)
-                if active_ai and hasattr(active_ai, 'last_stats'):
+                if hasattr(active_ai, 'last_stats'):
                     self.stats_history[current_player].append(active_ai.last_stats)
                 
                 if self.board.make_move(move[0], move[1], current_player):
+                    self.move_history.append(tuple(move))
                     self.board.current_player = 'W' if current_player == 'B' else 'B'
+                    self.start_pondering()
                     return True
 
             if not move:
                 # Pass giliran
-                self.board.current_player = 'W' if current_player == 'B' else 'B'
+                self.pass_turn()
+                self.start_pondering()
                 return True
 
         except Exception as e:
             print(f"Error AI: {e}")
-            self.board.current_player = 'W' if current_player == 'B' else 'B'
+            self.pass_turn()
             return True
 
         return False
@@ -150,19 +243,34 @@ class GameLogic:
         
         if self.game_mode == 'pvp':
             if self.board.make_move(row, col, current_player):
+                self.move_history.append((row, col))
                 self.board.current_player = 'W' if current_player == 'B' else 'B'
                 return True
         elif self.game_mode == 'pvb':
+            if current_player == 'B' and self.board.is_valid_move(row, col, 'B'):
+                self.stop_pondering()
             if current_player == 'B' and self.board.make_move(row, col, 'B'):
+                self.move_history.append((row, col))
                 self.board.current_player = 'W'
                 return True
         return False
+
+    # Pass giliran (tidak ada langkah valid), dicatat di move_history
+    def pass_turn(self):
+        self.stop_pondering()
+        self.move_history.append(None)
+        self.board.pass_turn()
     
     def next_game(self):
+        self.stop_pondering()
+        self.cancel_ai_move()
         if self.current_game < self.num_games:
             self.current_game += 1
             self.board.reset()
             self.stats_history = {'B': [], 'W': []}
+            self.move_history = []
+            for ai in (self.ai_black, self.ai_white):
+                if ai: ai.new_game()
             return True
         return False
     
@@ -187,4 +295,18 @@ class GameLogic:
                 'avg_time': avg_time,
                 'max_depth': max_depth
             }
+
+            # Metrik pencarian: NPS dari total node / total waktu, sisanya rata-rata per langkah
+            total_nodes = sum(m.get('nodes', 0) for m in moves)
+            total_time = sum(m['time'] for m in moves)
+            if total_nodes:
+                summary[p]['total_nodes'] = total_nodes
+                summary[p]['nps'] = total_nodes / total_time if total_time else 0
+            for key in AVERAGED_STATS:
+                values = [m[key] for m in moves if key in m]
+                if values:
+                    summary[p]['avg_' + key] = sum(values) / len(values)
+            tree_depths = [m['max_tree_depth'] for m in moves if 'max_tree_depth' in m]
+            if tree_depths:
+                summary[p]['max_tree_depth'] = max(tree_depths)
         return summary
\ No newline at end of file
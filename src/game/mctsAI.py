@@ -2,35 +2,44 @@ import time
 import math
 import random
 from game.base_ai import BaseAI
-from utils.constants import BOARD_WEIGHTS
+from game.endgame import ENDGAME_EMPTIES
+
+# Langkah terbaik sementara dilaporkan ke anytime API setiap sekian simulasi
+PROGRESS_BATCH = 100
 
 class MCTSNode:
-    def __init__(self, board, parent=None, move=None):
-        self.board = board
+    # Node tidak menyimpan salinan papan: `board` adalah papan kerja pada posisi node ini,
+    # yang dibawa turun-naik pohon lewat make_move/undo_move.
+    def __init__(self, board, parent=None, move=None, flips=None):
         self.parent = parent
         self.move = move
+        self.flips = flips
         self.children = []
         self.visits = 0
         self.wins = 0
-        self.untried_moves = board.get_valid_moves(board.current_player)
-        self.player_just_moved = parent.board.current_player if parent else None
+        self.untried_moves = list(board.generate_moves(board.current_player)) # [((row, col), flips), ...]
+        self.player_to_move = board.current_player
+        self.player_just_moved = parent.player_to_move if parent else None
+        # Fraksi papan terisi (0..1), agar batas fase berlaku untuk semua ukuran papan
+        self.fill_ratio = (board.black_count + board.white_count) / board.geometry.cells
         
         # --- [MODIFIKASI 1] Hitung Heuristic Score saat Node dibuat ---
         self.heuristic_val = 0
         if move:
             r, c = move
             # Ambil bobot dari konstanta (misal range -50 s.d 100)
-            weight = BOARD_WEIGHTS[r][c]
+            weight = board.weights[r][c]
             
             # Normalisasi sederhana agar nilainya tidak terlalu ekstrem dibanding Win Rate (0-1)
             # Kita bagi 100 agar range-nya sekitar -0.5 sampai 1.0
             self.heuristic_val = weight / 100.0
 
-    def get_bias_weight(board):
-        total = sum(1 for r in board.board for c in r if c is not None)
-        if total < 20:
+    @staticmethod
+    def get_bias_weight(fill_ratio):
+        # Batas 20/45 bidak dari papan 8x8
+        if fill_ratio < 20 / 64:
             return 3.0   # early
-        elif total < 45:
+        elif fill_ratio < 45 / 64:
             return 1.5   # mid
         else:
             return 0.5   # late
@@ -49,7 +58,7 @@ class MCTSNode:
         exploration = 1.41 * math.sqrt(math.log(parent_visits) / self.visits)
         
         # 3. Progressive Bias (Memanfaatkan Heuristic Value) dan adaptive weight implementasi dari adaptive bias pada mcts
-        adaptive_weight = MCTSNode.get_bias_weight(self.board)
+        adaptive_weight = MCTSNode.get_bias_weight(self.fill_ratio)
         bias = (self.heuristic_val * adaptive_weight) / (self.visits + 1)
         
         return exploitation + exploration + bias
@@ -59,50 +68,83 @@ class MCTSNode:
         return max(self.children, key=lambda c: c.uct_score(self.visits))
 
 class MonteCarloAI(BaseAI):
-    def __init__(self, time_limit=2.0, iterations=1000):
+    # endgame_empties: solver eksak aktif jika sisa petak kosong <= nilai ini (0 = nonaktif)
+    def __init__(self, time_limit=2.0, iterations=1000, endgame_empties=ENDGAME_EMPTIES):
         self.time_limit = time_limit
+        self.endgame_empties = endgame_empties
         self.iterations = iterations
         self.start_time = 0
+        self.deadline = None
         self.last_stats = {'depth': 0, 'time': 0}
 
+    def _play(self, board, move, flips):
+        undo = board.make_move(move[0], move[1], board.current_player, flips)
+        # Manual swap turn karena make_move tidak auto-swap giliran (undo_move mengembalikannya)
+        board.current_player = 'W' if board.current_player == 'B' else 'B'
+        return undo
+
     def get_move(self, board, player):
-        self.start_time = time.time()
+        self._start_clock(board, len(board.generate_moves(player)))
+        self._reset_counters()
+
+        # Sisa petak kosong sedikit: perfect play lebih baik dari rollout acak
+        solved_move = self._solve_endgame(board, player)
+        if solved_move is not None:
+            self.last_stats = self._search_stats(board.empty_count)
+            self.last_stats.update(self.endgame_stats)
+            return solved_move
         
-        # Menggunakan _copy_board yang sudah dioptimasi di BaseAI
-        root = MCTSNode(self._copy_board(board))
+        # Satu papan kerja untuk seluruh pohon (make/undo), papan asli tidak disentuh
+        tree_board = self._copy_board(board)
+        weights = board.weights
+        root = MCTSNode(tree_board)
+        root.untried_moves = self._unique_moves(tree_board, root.untried_moves)
         
         simulations = 0
+        tree_size = 1 # Jumlah node pohon (termasuk root)
+        max_tree_depth = 0
+        plies = 0 # Langkah yang dimainkan di pohon + rollout (= "nodes" untuk NPS)
         
         while True:
-            # Cek Time Limit
-            if self.time_limit and (time.time() - self.start_time >= self.time_limit):
+            # Cek Time Limit & permintaan stop (anytime API)
+            if self.stop_requested or (self.deadline is not None and time.monotonic() >= self.deadline):
                 break
             
             node = root
+            path = [] # Undo record sepanjang jalur root -> node
             
             # 1. SELECTION
             while not node.untried_moves and node.children:
                 node = node.best_child()
+                path.append(self._play(tree_board, node.move, node.flips))
             
             # 2. EXPANSION
             if node.untried_moves:
-                move = random.choice(node.untried_moves)
-                temp_board = self._copy_board(node.board) # Fast copy
-                temp_board.make_move(move[0], move[1], temp_board.current_player)
-                
-                # Manual swap turn karena make_move di copy object tidak auto-swap logika game logic utama
-                temp_board.current_player = 'W' if temp_board.current_player == 'B' else 'B'
+                entry = random.choice(node.untried_moves)
+                move, flips = entry
+                path.append(self._play(tree_board, move, flips))
                 
-                child = MCTSNode(temp_board, parent=node, move=move)
-                node.untried_moves.remove(move)
+                child = MCTSNode(tree_board, parent=node, move=move, flips=flips)
+                node.untried_moves.remove(entry)
                 node.children.append(child)
                 node = child
+                tree_size += 1
+
+            if len(path) > max_tree_depth:
+                max_tree_depth = len(path)
+            plies += len(path)
             
             # 3. SIMULATION (HEURISTIC ROLLOUT)
-            # Menggunakan BOARD_WEIGHTS dari constants.py untuk arah yang lebih pintar
-            rollout_board = self._copy_board(node.board)
+            # Menggunakan bobot posisi papan (BOARD_WEIGHTS untuk 8x8) untuk arah yang lebih pintar
+            rollout_board = self._copy_board(tree_board)
+            
+            # Kembalikan papan kerja ke posisi root
+            for undo in reversed(path):
+                tree_board.undo_move(undo)
+
             while not rollout_board.is_game_over():
                 p = rollout_board.current_player
+                # Rollout hanya memainkan satu langkah: cukup legal mask (di-memo), flip dihitung di make_move
                 moves = rollout_board.get_valid_moves(p)
                 
                 if not moves:
@@ -113,10 +155,11 @@ class MonteCarloAI(BaseAI):
                         m = random.choice(moves)
                     else:
                         # Lookup nilai bobot langsung (sangat cepat O(1))
-                        m = max(moves, key=lambda mv: BOARD_WEIGHTS[mv[0]][mv[1]])
+                        m = max(moves, key=lambda mv: weights[mv[0]][mv[1]])
                         
                     rollout_board.make_move(m[0], m[1], p)
                     rollout_board.current_player = 'W' if p == 'B' else 'B'
+                    plies += 1
             
             # 4. BACKPROPAGATION
             winner = rollout_board.get_winner()
@@ -130,15 +173,29 @@ class MonteCarloAI(BaseAI):
                 node = node.parent
             
             simulations += 1
+            # Lapor setelah simulasi pertama agar best_so_far langsung terisi
+            # (root tanpa anak = player harus pass, tidak ada langkah untuk dilaporkan)
+            if root.children and (simulations == 1 or not simulations % PROGRESS_BATCH):
+                leader = max(root.children, key=lambda c: c.visits)
+                self._report_progress(leader.move, simulations=simulations, visits=leader.visits,
+                                      win_rate=leader.wins / leader.visits)
             # Cek Iteration Limit jika Time Limit tidak aktif
             if not self.time_limit and simulations >= self.iterations:
                 break
         
-        elapsed_time = time.time() - self.start_time
-        self.last_stats = {'depth': simulations, 'time': elapsed_time}
+        # depth = kedalaman pohon terdalam (sebanding dengan depth engine lain);
+        # jumlah simulasi dicatat terpisah
+        self.node_count += plies
+        self.leaf_evals = simulations # Satu evaluasi hasil akhir per rollout
+        self.last_stats = self._search_stats(max_tree_depth)
+        self.last_stats.update(simulations=simulations, tree_size=tree_size, max_tree_depth=max_tree_depth)
+        self.last_stats.update(self.endgame_stats)
         
         if not root.children:
-            return None
+            # stop() sebelum simulasi pertama selesai: tetap kembalikan langkah legal
+            # (None berarti pass bagi GameLogic)
+            moves = board.get_valid_moves(player)
+            return moves[0] if moves else None
             
         # Pilih langkah yang paling robust (paling banyak dikunjungi)
         best_child = max(root.children, key=lambda c: c.visits)
@@ -1,74 +1,87 @@
 import random
 import time
-from game.base_ai import BaseAI
+from game.base_ai import BaseAI, CHECK_MASK
+from game.endgame import ENDGAME_EMPTIES
+from game.time_manager import TimeManager
 
 class MinimaxAI(BaseAI):
-    def __init__(self, depth=3, time_limit=None):
+    # endgame_empties: solver eksak aktif jika sisa petak kosong <= nilai ini (0 = nonaktif)
+    # time_manager: game.time_manager.TimeManager (jam per game); default dari time_limit
+    def __init__(self, depth=3, time_limit=None, endgame_empties=ENDGAME_EMPTIES, time_manager=None):
         self.depth = depth
         self.time_limit = time_limit
+        self.time_manager = time_manager or (TimeManager(move_time=time_limit) if time_limit else None)
+        self.endgame_empties = endgame_empties
         self.start_time = 0
-        self.node_count = 0 
+        self.deadline = None
+        self._reset_counters()
         self.last_stats = {'depth': 0, 'time': 0}
 
-    def _order_moves(self, board, valid_moves):
-        # Move ordering sederhana: Prioritaskan pojok
-        corners = {(0,0), (0,7), (7,0), (7,7)}
-        def score_move_ordering(move):
-            r, c = move
-            if (r, c) in corners: return 1000
-            if r == 0 or r == 7 or c == 0 or c == 7: return 10
-            return 0
-        return sorted(valid_moves, key=score_move_ordering, reverse=True)
-
     def get_move(self, board, player):
-        valid_moves = board.get_valid_moves(player)
+        valid_moves = self._unique_moves(board, board.generate_moves(player))
         if not valid_moves:
             return None
         
-        self.start_time = time.time()
-        self.node_count = 0 
+        self._start_clock(board, len(valid_moves))
+        self._reset_counters()
+        self.nodes_per_depth = {}
+        self._reset_ordering(board)
         
         # Jika hanya ada 1 langkah, langsung ambil (hemat waktu)
         if len(valid_moves) == 1:
-            self.last_stats = {'depth': 0, 'time': time.time() - self.start_time}
-            return valid_moves[0]
-
-        best_move_final = valid_moves[0]
+            self.last_stats = self._search_stats(0)
+            self._stop_clock(0)
+            return valid_moves[0][0]
+
+        # Sisa petak kosong sedikit: selesaikan eksak (selisih bidak akhir), tanpa heuristik
+        solved_move = self._solve_endgame(board, player)
+        if solved_move is not None:
+            self.last_stats = self._search_stats(board.empty_count)
+            self.last_stats.update(self.endgame_stats)
+            self._stop_clock(board.empty_count)
+            return solved_move
+
+        best_move_final = valid_moves[0][0]
         completed_depth = 0
+        stable_iterations = 0
+
+        # Satu salinan untuk seluruh pencarian; anak dibuat dengan make/undo in-place
+        search_board = self._search_board(board)
         
-        # --- LOGIKA ITERATIVE DEEPENING (GENAP) ---
-        # Jika pakai time_limit, kita mulai dari depth 2 dan lompat 2 (2, 4, 6...)
-        # Agar evaluasi selalu berakhir di giliran Bot (Genap)
-        if self.time_limit:
-            start_depth = 2
-            step = 2
-            max_depth_to_search = 64 # Angka besar karena dibatasi waktu
+        # --- LOGIKA ITERATIVE DEEPENING ---
+        # Dengan time manager: depth 1, 2, 3, ... sampai sisa petak kosong, manager yang
+        # memutuskan kapan berhenti (lihat game.time_manager)
+        manager = self.time_manager
+        if manager is not None:
+            start_depth = 1
+            max_depth_to_search = board.empty_count # Sisa petak kosong, dibatasi waktu
         else:
-            # Jika fixed depth, gunakan settingan user
-            start_depth = self.depth
-            step = 1 
+            # Jika fixed depth, gunakan settingan user (lewat start() tetap bertahap dari depth 1)
             max_depth_to_search = self.depth
+            start_depth = 1 if self.is_thinking() else self.depth
 
         try:
-            for d in range(start_depth, max_depth_to_search + 1, step):
+            for d in range(start_depth, max_depth_to_search + 1):
                 best_score = float('-inf')
                 best_moves = []
                 
-                # Urutkan langkah agar kemungkinan menemukan yang terbaik lebih cepat (meski Minimax tetap cek semua)
-                ordered_moves = self._order_moves(board, valid_moves)
-
-                for move in ordered_moves:
-                    # Cek waktu setiap 1000 node
+                # Urutkan langkah agar kemungkinan menemukan yang terbaik lebih cepat (meski Minimax tetap cek semua).
+                # Langkah terbaik iterasi sebelumnya dicoba paling dulu.
+                tt_move = best_move_final if completed_depth else None
+                ordered_moves = self._order_moves(board, valid_moves, player, tt_move)
+                nodes_before = self.node_count
+                iteration_start = time.monotonic()
+
+                for move, flips in ordered_moves:
                     self.node_count += 1
-                    if self.time_limit and (self.node_count % 1000 == 0):
-                        if time.time() - self.start_time >= self.time_limit:
-                            raise TimeoutError("Time Limit Exceeded")
+                    if not self.node_count & CHECK_MASK: self._check_time()
 
-                    test_board = self._copy_board(board)
-                    if test_board.make_move(move[0], move[1], player):
+                    undo = search_board.make_move(move[0], move[1], player, flips)
+                    if undo:
                         # Panggil rekursi Minimax
-                        score = self._minimax(test_board, d - 1, False, player)
-                        
+                        score = self._minimax(search_board, d - 1, False, player)
+                        search_board.undo_move(undo)
+
                         if score > best_score:
                             best_score = score
                             best_moves = [move]
@@ -76,51 +89,64 @@ class MinimaxAI(BaseAI):
                             best_moves.append(move)
 
                 # UPDATE SAFE: Hanya update best_move_final jika loop kedalaman ini SELESAI
+                self.nodes_per_depth[d] = self.node_count - nodes_before
                 if best_moves:
+                    previous_move = best_move_final
                     best_move_final = random.choice(best_moves)
+                    stable_iterations = stable_iterations + 1 if best_move_final == previous_move else 0
                     completed_depth = d
+                    self._report_progress(best_move_final, depth=d, score=best_score, nodes=self.node_count)
+
+                if manager is not None:
+                    now = time.monotonic()
+                    previous_nodes = self.nodes_per_depth.get(d - 1)
+                    ebf = self.nodes_per_depth[d] / previous_nodes if previous_nodes else None
+                    if not manager.continue_search(now - self.start_time, now - iteration_start, ebf, stable_iterations):
+                        break
 
         except TimeoutError:
             pass # Waktu habis, abaikan hasil depth ini, pakai hasil depth sebelumnya
         
-        elapsed_time = time.time() - self.start_time
-        self.last_stats = {'depth': completed_depth, 'time': elapsed_time}
+        self.last_stats = self._search_stats(completed_depth)
+        self.last_stats['nodes_per_depth'] = self.nodes_per_depth
+        self.last_stats.update(self.endgame_stats)
+        self._stop_clock(completed_depth)
 
         return best_move_final
 
     def _minimax(self, board, depth, is_maximizing, player):
         # Cek waktu di dalam rekursi juga
         self.node_count += 1
-        if self.time_limit and (self.node_count % 1000 == 0):
-            if time.time() - self.start_time >= self.time_limit:
-                raise TimeoutError("Time Limit")
+        if not self.node_count & CHECK_MASK: self._check_time()
 
         if depth == 0 or board.is_game_over():
+            if self.collect_stats: self.leaf_evals += 1
             return self._evaluate_board_advanced(board, player)
 
         opponent = 'W' if player == 'B' else 'B'
         current_player = player if is_maximizing else opponent
-        valid_moves = board.get_valid_moves(current_player)
+        valid_moves = self._unique_moves(board, board.generate_moves(current_player))
 
         # Jika tidak ada langkah, pass giliran (depth dikurangi tapi maximizing di-flip)
         if not valid_moves:
             return self._minimax(board, depth - 1, not is_maximizing, player)
 
-        ordered_moves = self._order_moves(board, valid_moves)
+        ordered_moves = self._order_moves(board, valid_moves, current_player)
+        if self.collect_stats: self.interior_nodes += 1
 
         if is_maximizing:
             best_score = float('-inf')
-            for move in ordered_moves:
-                test_board = self._copy_board(board)
-                test_board.make_move(move[0], move[1], current_player)
-                score = self._minimax(test_board, depth - 1, False, player)
+            for move, flips in ordered_moves:
+                undo = board.make_move(move[0], move[1], current_player, flips)
+                score = self._minimax(board, depth - 1, False, player)
+                board.undo_move(undo)
                 best_score = max(best_score, score)
             return best_score
         else:
             best_score = float('inf')
-            for move in ordered_moves:
-                test_board = self._copy_board(board)
-                test_board.make_move(move[0], move[1], current_player)
-                score = self._minimax(test_board, depth - 1, True, player)
+            for move, flips in ordered_moves:
+                undo = board.make_move(move[0], move[1], current_player, flips)
+                score = self._minimax(board, depth - 1, True, player)
+                board.undo_move(undo)
                 best_score = min(best_score, score)
             return best_score
\ No newline at end of file
@@ -0,0 +1,190 @@
+import multiprocessing
+
+from game.alphabetaAI import AlphaBetaAI
+from game.board import Board
+
+# --- PENCARIAN PARALEL DI ROOT (Young Brothers Wait) ---
+# Langkah root pertama (eldest brother) dicari dulu di proses utama untuk menetapkan alpha.
+# Sisa langkah root dibagi ke worker pool yang tetap hidup antar get_move.
+# Alpha global disimpan di multiprocessing.Value: setiap worker membaca alpha terbaru
+# saat mulai menyelidiki langkah (zero-window) dan menaikkannya jika menemukan skor lebih
+# baik. Worker juga mengecek alpha global selama mencari (_WorkerAI._check_time): jika sudah
+# naik di atas alpha jendelanya, pencarian diputus dan langkah dicari ulang dengan alpha baru,
+# jadi cutoff dari satu worker langsung mempersempit pencarian worker lain yang sedang jalan.
+
+_worker_ai = None
+_shared_alpha = None
+_shared_stop = None
+_worker_search_id = None
+
+
+# Alpha global naik di atas alpha jendela tugas yang sedang dicari
+class _AlphaRaised(Exception):
+    pass
+
+
+# AlphaBetaAI di worker: selain deadline, ikut berhenti saat proses utama memanggil stop(),
+# dan memutus tugas saat alpha global melewati window_alpha (alpha root tugas berjalan)
+class _WorkerAI(AlphaBetaAI):
+    window_alpha = float('inf')
+
+    def _check_time(self):
+        if _shared_stop.value:
+            raise TimeoutError("Stop")
+        if _shared_alpha.value > self.window_alpha:
+            raise _AlphaRaised()
+        super()._check_time()
+
+
+def _init_worker(shared_alpha, shared_stop, ai_kwargs, shared_tt):
+    global _worker_ai, _shared_alpha, _shared_stop
+    # Worker memakai AlphaBetaAI biasa (history sendiri, tetap hidup antar langkah).
+    # TT: tabel shared memory bersama jika ada, selain itu TT lokal per worker.
+    if shared_tt is not None:
+        _worker_ai = _WorkerAI(workers=1, **dict(ai_kwargs, tt_size_mb=0))
+        _worker_ai.tt = shared_tt
+    else:
+        _worker_ai = _WorkerAI(workers=1, **ai_kwargs)
+    _shared_alpha = shared_alpha
+    _shared_stop = shared_stop
+
+
+def _raise_shared_alpha(score):
+    with _shared_alpha.get_lock():
+        if score > _shared_alpha.value:
+            _shared_alpha.value = score
+
+
+# Counter TT & counter pencarian (BaseAI._reset_counters) yang dikirim balik ke proses utama per tugas
+_TT_COUNTERS = ('probes', 'hits', 'cutoffs', 'stores', 'overwrites', 'collisions')
+_SEARCH_COUNTERS = ('node_count', 'leaf_evals', 'interior_nodes', 'cutoffs', 'first_move_cutoffs')
+
+
+def _search_counters(ai):
+    return tuple(getattr(ai, name) for name in _SEARCH_COUNTERS)
+
+
+def _tt_counters(tt):
+    if tt is None:
+        return ()
+    return tuple(getattr(tt, name, 0) for name in _TT_COUNTERS)
+
+
+# Satu tugas = satu langkah root.
+# Mengembalikan (move, skor atau None jika waktu habis, improved, counter pencarian, counter TT
+# tugas ini). improved = skor melewati alpha jendela terakhir (eksak, atau batas bawah jika
+# >= beta); selain itu skor hanya batas atas (fail-low) dan bukan kandidat langkah terbaik.
+def _search_root_move(task):
+    global _worker_search_id
+    search_id, generation, black, white, size, player, move, flips, depth, beta, start_time, deadline = task
+    ai = _worker_ai
+    board = ai._search_board(Board.from_bitboards(black, white, player, size))
+    if search_id != _worker_search_id:
+        # get_move baru: entri TT lama tetap dipakai, killer di-reset
+        _worker_search_id = search_id
+        if ai.tt is not None:
+            ai.tt.new_search()
+            ai.tt.generation = generation
+        ai._reset_ordering(board)
+    if ai.tt is not None:
+        ai.tt.reset_stats()
+    ai.start_time = start_time
+    ai.deadline = deadline
+    ai._reset_counters()
+
+    opponent = 'W' if player == 'B' else 'B'
+    alpha = _shared_alpha.value
+    try:
+        while True:
+            ai.window_alpha = alpha
+            # Papan anak baru tiap percobaan: pencarian yang diputus tidak sempat undo_move
+            child = board.copy()
+            child.make_move(move[0], move[1], player, flips)
+            child.current_player = opponent
+            try:
+                # Zero-window: cukup buktikan langkah ini tidak lebih baik dari alpha global
+                score = -ai._alphabeta(child, depth - 1, -alpha - 1, -alpha, opponent, 1)
+                if alpha < score < beta:
+                    alpha = ai.window_alpha = max(alpha, _shared_alpha.value)
+                    score = -ai._alphabeta(child, depth - 1, -beta, -alpha, opponent, 1)
+                break
+            except _AlphaRaised:
+                # Worker lain menaikkan alpha: cari ulang dengan batas baru (entri TT tetap terpakai)
+                alpha = _shared_alpha.value
+                if alpha >= beta:
+                    return move, alpha, False, _search_counters(ai), _tt_counters(ai.tt)
+    except TimeoutError:
+        return move, None, False, _search_counters(ai), _tt_counters(ai.tt)
+    finally:
+        ai.window_alpha = float('inf')
+    improved = score > alpha
+    if improved:
+        _raise_shared_alpha(score)
+    return move, score, improved, _search_counters(ai), _tt_counters(ai.tt)
+
+
+class ParallelRootSearch:
+    # shared_tt: SharedTranspositionTable yang dipakai semua worker (None = TT lokal per worker)
+    def __init__(self, workers, ai_kwargs, shared_tt=None):
+        self.workers = workers
+        self.shared_tt = shared_tt
+        self.shared_alpha = multiprocessing.Value('d', float('-inf'))
+        self.shared_stop = multiprocessing.Value('b', 0, lock=False)
+        self.pool = multiprocessing.Pool(workers, initializer=_init_worker,
+                                         initargs=(self.shared_alpha, self.shared_stop, ai_kwargs, shared_tt))
+        self.search_id = 0
+
+    def new_search(self):
+        self.search_id += 1
+        self.shared_stop.value = 0
+
+    # Minta semua worker memutus tugasnya (dipanggil dari AlphaBetaAI.stop)
+    def stop(self):
+        self.shared_stop.value = 1
+
+    # Kontrak sama dengan AlphaBetaAI._search_root: (skor terbaik, [langkah terbaik]).
+    # Counter pencarian worker (node, leaf evals, cutoff) ditambahkan ke ai. Raise TimeoutError jika iterasi tidak selesai.
+    def search_root(self, ai, board, ordered_moves, d, alpha, beta, player):
+        opponent = 'W' if player == 'B' else 'B'
+        (first, first_flips), rest = ordered_moves[0], ordered_moves[1:]
+
+        # Eldest brother: dicari penuh di proses utama
+        ai.node_count += 1
+        undo = board.make_move(first[0], first[1], player, first_flips)
+        board.current_player = opponent
+        best_score = -ai._alphabeta(board, d - 1, -beta, -alpha, opponent, 1)
+        board.undo_move(undo)
+        best_move = first
+        if best_score >= beta or not rest:
+            return best_score, [best_move]
+
+        # stop() yang datang sebelum new_search tidak sampai ke worker; cek sebelum membagi tugas
+        ai._check_time()
+        self.shared_alpha.value = max(alpha, best_score)
+        generation = ai.tt.generation if ai.tt is not None else 0
+        tasks = [(self.search_id, generation, board.black, board.white, board.size, player, move, flips,
+                  d, beta, ai.start_time, ai.deadline) for move, flips in rest]
+        timed_out = False
+        for move, score, improved, search_counters, counters in self.pool.imap_unordered(_search_root_move, tasks):
+            for name, value in zip(_SEARCH_COUNTERS, search_counters):
+                setattr(ai, name, getattr(ai, name) + value)
+            # Statistik TT shared: gabungkan counter worker ke tabel proses utama
+            if self.shared_tt is not None:
+                for name, value in zip(_TT_COUNTERS, counters):
+                    setattr(self.shared_tt, name, getattr(self.shared_tt, name) + value)
+            if score is None:
+                timed_out = True
+            elif improved and score > best_score:
+                # Hanya skor yang melewati alpha jendela worker; fail-low zero-window hanyalah
+                # batas atas (bisa di (best_score, alpha] saat aspiration fail-low di root)
+                best_score = score
+                best_move = move
+        if timed_out:
+            raise TimeoutError("Time Limit Exceeded")
+        return best_score, [best_move]
+
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
+        if self.shared_tt is not None:
+            self.shared_tt.close()
@@ -0,0 +1,397 @@
+import os
+import struct
+import zlib
+from array import array
+from operator import getitem
+
+try:
+    import numpy as np
+except ImportError: # Hanya fit bobot yang butuh NumPy; evaluasi tidak
+    np = None
+
+from game.symmetry import transpose
+
+# --- EVALUASI POLA (gaya Logistello) ---
+# Skor = jumlah bobot tabel untuk setiap instance pola + bobot mobility, per fase game.
+# Pola (8x8), semua simetri D4 berbagi satu tabel per jenis pola (skor invarian D4):
+#   edge2x  : baris tepi + 2 petak X                      (10 petak, 4 instance)
+#   corner3 : kotak 3x3 di pojok, dibaca dari kedua arah  ( 9 petak, 8 instance)
+#   corner25: persegi 2x5 di pojok (dua arah)             (10 petak, 8 instance)
+#   hor2/3/4: baris/kolom ke-2, 3, 4 dari tepi             ( 8 petak, 4 instance)
+#   diag8..4: diagonal sepanjang 8..4 petak                (2 instance diag8, 4 lainnya)
+# Indeks pola = bilangan basis 3 (0 = kosong, 1 = hitam, 2 = putih) atas petak-petaknya.
+# Tabel menyimpan nilai dari sudut pandang hitam (x EVAL_SCALE per bidak);
+# untuk putih skornya dinegasikan (evaluasi antisimetris, sama seperti evaluasi lama).
+#
+# Setiap instance memakai urutan petak hasil simetri dari instance kanonik (pojok/tepi
+# kiri-atas): baris dibaca dari papan asli & papan transpos, dari kiri (PAIR) atau dari
+# kanan (PAIR_REV, instance cermin), jadi satu tabel berlaku untuk semua instance.
+# Tepi, baris dan diagonal juga dipetakan ke dirinya sendiri oleh cermin (dibaca terbalik),
+# jadi bobot indeks dan cerminnya diikat saat fit (PATTERN_MIRRORS); corner3 dan corner25
+# tidak perlu karena setiap orientasinya sudah instance tersendiri.
+
+PATTERNS = (
+    ('edge2x', 10), ('corner3', 9), ('corner25', 10),
+    ('hor2', 8), ('hor3', 8), ('hor4', 8),
+    ('diag8', 8), ('diag7', 7), ('diag6', 6), ('diag5', 5), ('diag4', 4),
+)
+PATTERN_SIZES = tuple(3 ** cells for _, cells in PATTERNS)
+# Posisi awal tabel tiap jenis pola dalam vektor bobot flat (dipakai saat fit)
+PATTERN_OFFSETS = tuple(sum(PATTERN_SIZES[:p]) for p in range(len(PATTERNS) + 1))
+N_PATTERNS = len(PATTERNS)
+
+# Permutasi digit cermin per jenis pola (digit ke-k indeks cermin = digit mirror[k] indeks asli)
+def _mirror_digits(name, cells):
+    if name == 'edge2x':
+        return tuple(range(7, -1, -1)) + (9, 8) # Baris tepi terbalik, kedua petak X bertukar
+    if name.startswith(('hor', 'diag')):
+        return tuple(range(cells - 1, -1, -1))
+    return None
+
+PATTERN_MIRRORS = tuple(_mirror_digits(name, cells) for name, cells in PATTERNS)
+# Fase = (jumlah bidak - 4) // STAGE_DISCS -> 0..5 (posisi 64 bidak selalu game over)
+STAGE_DISCS = 10
+N_STAGES = 6
+EVAL_SCALE = 100 # Skor 100 = unggul satu bidak di akhir game
+
+WEIGHTS_MAGIC = b'OTHW'
+_HEADER = struct.Struct('<4sHHH') # magic, versi, jumlah fase, jumlah pola
+WEIGHTS_VERSION = 2 # 2: tabel simetris terhadap cermin (PATTERN_MIRRORS)
+# Folder data/ di root repo (sama dengan riwayat game & parameter ProbCut)
+WEIGHTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data', 'pattern_weights.bin')
+
+
+# --- TABEL BANTU INDEKS ---
+# PAIR[(own << 8) | opp] = indeks basis 3 dari 8 bit (digit 1 untuk own, 2 untuk opp)
+def _base3(bits):
+    value = 0
+    power = 1
+    while bits:
+        if bits & 1:
+            value += power
+        bits >>= 1
+        power *= 3
+    return value
+
+_B3 = [_base3(b) for b in range(256)]
+_REV = [int(f'{b:08b}'[::-1], 2) for b in range(256)]
+PAIR = [_B3[own] + 2 * _B3[opp] if not own & opp else 0 for own in range(256) for opp in range(256)]
+# Sama, tapi urutan bit dibalik (kolom 7 = digit pertama): instance hasil cermin horizontal
+PAIR_REV = [PAIR[_REV[own] << 8 | _REV[opp]] for own in range(256) for opp in range(256)]
+# Petak X (kolom 1 dan 6 baris kedua) dari indeks baris -> digit ke-9 dan ke-10 pola edge2x
+X_ROW = [6561 * (row // 3 % 3) + 19683 * (row // 729 % 3) for row in range(6561)]
+
+# Diagonal: bit tiap baris dikumpulkan ke byte teratas (posisi = kolom) dengan satu perkalian
+_GATHER = 0x0101010101010101
+
+def _diag_mask(cells):
+    return sum(1 << (r * 8 + c) for r, c in cells)
+
+# (mask, shift): digit ke-i = petak ke-i diagonal setelah byte kolom digeser shift ke kanan.
+# Per panjang 8 - s: (i, i + s), (7 - i, i + s), (i + s, i); diagonal utama hanya dua instance.
+_DIAGS = []
+for _s in range(5):
+    _DIAGS.append((_diag_mask((i, i + _s) for i in range(8 - _s)), _s))
+    _DIAGS.append((_diag_mask((7 - i, i + _s) for i in range(8 - _s)), _s))
+    if _s:
+        _DIAGS.append((_diag_mask((i + _s, i) for i in range(8 - _s)), 0))
+# Instance cermin (i, 7 - s - i): kolom dibaca terbalik, byte digeser shift ke kiri
+_DIAGS_REV = tuple((_diag_mask((i, 7 - _s - i) for i in range(8 - _s)), _s) for _s in range(1, 5))
+_DIAGS = tuple(_DIAGS)
+
+# Jenis pola (indeks di PATTERNS) untuk setiap posisi di hasil pattern_indices
+_SIDE_INSTANCES = (0, 0, 3, 3, 4, 4, 5, 5, 2, 2, 2, 2, 1, 1, 1, 1)
+INSTANCE_PATTERNS = _SIDE_INSTANCES * 2 \
+    + tuple(6 + _s for _s in range(5) for _ in range(3 if _s else 2)) + (7, 8, 9, 10)
+N_INSTANCES = len(INSTANCE_PATTERNS)
+
+
+# Indeks semua instance pola (urutan INSTANCE_PATTERNS). Hanya papan 8x8.
+def pattern_indices(black, white):
+    pair = PAIR
+    rev = PAIR_REV
+    x_row = X_ROW
+    indices = []
+    # Papan asli (atas/bawah) lalu papan transpos (kiri/kanan). Indeks baris dihitung sekali;
+    # pola yang hanya memakai sebagian baris cukup mengambil digit bawahnya (modulo 3^n).
+    for own, opp in ((black, white), (transpose(black), transpose(white))):
+        b0, b1, b2, b3, b4, b5, b6, b7 = own.to_bytes(8, 'little')
+        w0, w1, w2, w3, w4, w5, w6, w7 = opp.to_bytes(8, 'little')
+        r0 = pair[b0 << 8 | w0]
+        r1 = pair[b1 << 8 | w1]
+        r2 = pair[b2 << 8 | w2]
+        r5 = pair[b5 << 8 | w5]
+        r6 = pair[b6 << 8 | w6]
+        r7 = pair[b7 << 8 | w7]
+        # Baris yang sama dibaca dari kanan (instance cermin horizontal)
+        q0 = rev[b0 << 8 | w0]
+        q1 = rev[b1 << 8 | w1]
+        q2 = rev[b2 << 8 | w2]
+        q5 = rev[b5 << 8 | w5]
+        q6 = rev[b6 << 8 | w6]
+        q7 = rev[b7 << 8 | w7]
+        indices += (
+            r0 + x_row[r1], r7 + x_row[r6],
+            r1, r6, r2, r5, pair[b3 << 8 | w3], pair[b4 << 8 | w4],
+            r0 % 243 + 243 * (r1 % 243), r7 % 243 + 243 * (r6 % 243),
+            q0 % 243 + 243 * (q1 % 243), q7 % 243 + 243 * (q6 % 243),
+            r0 % 27 + 27 * (r1 % 27) + 729 * (r2 % 27), r7 % 27 + 27 * (r6 % 27) + 729 * (r5 % 27),
+            q0 % 27 + 27 * (q1 % 27) + 729 * (q2 % 27), q7 % 27 + 27 * (q6 % 27) + 729 * (q5 % 27),
+        )
+    for mask, shift in _DIAGS:
+        indices.append(pair[((black & mask) * _GATHER >> 56 & 255) >> shift << 8
+                            | ((white & mask) * _GATHER >> 56 & 255) >> shift])
+    for mask, shift in _DIAGS_REV:
+        indices.append(rev[((black & mask) * _GATHER >> 56 & 255) << shift << 8
+                           | ((white & mask) * _GATHER >> 56 & 255) << shift])
+    return indices
+
+
+# --- UPDATE INCREMENTAL (Board.track_eval) ---
+# Digit pola per petak: petak idx muncul di instance inst dengan bobot digit power
+# (= pattern_indices papan yang hanya berisi satu bidak hitam di idx).
+# SQUARE_UPDATES[player] = (place, flip): per petak, pasangan (instance, delta indeks) saat
+# player menaruh bidak di petak itu (digit 0 -> 1/2) atau saat petak itu dibalik ke player
+# (digit 2 -> 1 untuk hitam, 1 -> 2 untuk putih).
+def _square_updates(place_digit, flip_delta):
+    place = []
+    flip = []
+    for idx in range(64):
+        powers = [(inst, power) for inst, power in enumerate(pattern_indices(1 << idx, 0)) if power]
+        place.append(tuple((inst, place_digit * power) for inst, power in powers))
+        flip.append(tuple((inst, flip_delta * power) for inst, power in powers))
+    return tuple(place), tuple(flip)
+
+SQUARE_UPDATES = {'B': _square_updates(1, -1), 'W': _square_updates(2, 1)}
+
+class PatternEvaluator:
+    # tables[stage][pattern] = array bobot (int16, x EVAL_SCALE); mobility[stage] = bobot per langkah
+    def __init__(self, tables, mobility):
+        self.tables = tables
+        self.mobility = mobility
+        # Tabel per instance (urutan pattern_indices) agar evaluasi cukup satu map()
+        self.instance_tables = [[stage[p] for p in INSTANCE_PATTERNS] for stage in tables]
+        # Identitas bobot (lihat BaseAI._evaluator_key)
+        self.key = f'pattern-{zlib.crc32(self._payload()):08x}'
+
+    @classmethod
+    def zeros(cls):
+        tables = [[array('h', bytes(2 * size)) for size in PATTERN_SIZES] for _ in range(N_STAGES)]
+        return cls(tables, [0] * N_STAGES)
+
+    # --- FILE BOBOT ---
+    # Header, lalu payload zlib: per fase bobot mobility (int16) + semua tabel pola (int16 LE)
+    @classmethod
+    def load(cls, path=WEIGHTS_FILE):
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, version, stages, patterns = _HEADER.unpack_from(data)
+        if magic != WEIGHTS_MAGIC or version != WEIGHTS_VERSION or stages != N_STAGES or patterns != N_PATTERNS:
+            raise ValueError(f"File bobot pola tidak cocok: {path}")
+        payload = zlib.decompress(data[_HEADER.size:])
+        tables = []
+        mobility = []
+        offset = 0
+        for _ in range(N_STAGES):
+            mobility.append(struct.unpack_from('<h', payload, offset)[0])
+            offset += 2
+            stage = []
+            for size in PATTERN_SIZES:
+                table = array('h')
+                table.frombytes(payload[offset:offset + 2 * size])
+                offset += 2 * size
+                stage.append(table)
+            tables.append(stage)
+        return cls(tables, mobility)
+
+    def _payload(self):
+        payload = bytearray()
+        for stage in range(N_STAGES):
+            payload += struct.pack('<h', self.mobility[stage])
+            for table in self.tables[stage]:
+                payload += table.tobytes()
+        return bytes(payload)
+
+    def save(self, path=WEIGHTS_FILE):
+        payload = self._payload()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(WEIGHTS_MAGIC, WEIGHTS_VERSION, N_STAGES, N_PATTERNS))
+            f.write(zlib.compress(payload, 9))
+
+    # Skor dari sudut pandang player (posisi belum game over).
+    # Indeks pola diambil dari board.patterns jika papan melacaknya (Board.track_eval).
+    def evaluate(self, board, player):
+        stage = (board.black_count + board.white_count - 4) // STAGE_DISCS
+        indices = board.patterns
+        if indices is None:
+            indices = pattern_indices(board.black, board.white)
+        score = self.mobility[stage] * (board.count_moves('B') - board.count_moves('W'))
+        score += sum(map(getitem, self.instance_tables[stage], indices))
+        return score if player == 'B' else -score
+
+    # Skor semua anak (setelah player memainkan tiap langkah ((row, col), flips)) dari sudut
+    # pandang player, dalam satu panggilan, tanpa make/undo. Game over anak tidak dicek.
+    # Indeks pola anak = indeks induk + delta petak yang ditaruh/dibalik (SQUARE_UPDATES);
+    # mobility semua anak dihitung sekaligus dengan papan dikemas per lajur (geometry.packed).
+    def evaluate_children(self, board, player, moves):
+        stage = min((board.black_count + board.white_count - 3) // STAGE_DISCS, N_STAGES - 1)
+        tables = self.instance_tables[stage]
+        parent = board.patterns
+        if parent is None:
+            parent = pattern_indices(board.black, board.white)
+        place, flip = SQUARE_UPDATES[player]
+        own, opp = board.get_discs(player)
+        geometry = board.geometry
+        width = geometry.lane_bits
+        sign = 1 if player == 'B' else -1
+        scores = []
+        packed_own = packed_opp = 0
+        shift = 0
+        for (row, col), flips in moves:
+            idx = row * 8 + col
+            indices = parent[:]
+            for inst, delta in place[idx]:
+                indices[inst] += delta
+            f = flips
+            while f:
+                low = f & -f
+                for inst, delta in flip[low.bit_length() - 1]:
+                    indices[inst] += delta
+                f ^= low
+            scores.append(sign * sum(map(getitem, tables, indices)))
+            packed_own |= (own | 1 << idx | flips) << shift
+            packed_opp |= (opp ^ flips) << shift
+            shift += width
+
+        lanes = geometry.packed(len(moves))
+        own_moves = lanes.legal_mask(packed_own, packed_opp)
+        opp_moves = lanes.legal_mask(packed_opp, packed_own)
+        full = geometry.full_mask
+        mobility = self.mobility[stage]
+        shift = 0
+        for i in range(len(scores)):
+            scores[i] += mobility * ((own_moves >> shift & full).bit_count() - (opp_moves >> shift & full).bit_count())
+            shift += width
+        return scores
+
+
+_EVALUATOR = None
+_LOADED = False
+
+# Evaluator bersama (lazy, sekali per proses); None jika file bobot tidak ada
+def get_evaluator():
+    global _EVALUATOR, _LOADED
+    if not _LOADED:
+        _LOADED = True
+        if os.path.exists(WEIGHTS_FILE):
+            _EVALUATOR = PatternEvaluator.load(WEIGHTS_FILE)
+    return _EVALUATOR
+
+
+# --- DATA LATIH & FIT BOBOT ---
+# Posisi dari self-play 8x8 (game.tuning.selfplay_positions): (black, white, score), label =
+# selisih bidak akhir (sudut pandang hitam) dengan main sempurna mulai solve_empties petak kosong.
+def generate_positions(games=1000, depth=2, random_plies=8, epsilon=0.0, solve_empties=10, seed=1, progress=None):
+    from game.tuning import selfplay_positions
+
+    positions = selfplay_positions(games=games, depth=depth, random_plies=random_plies, epsilon=epsilon,
+                                   solve_empties=solve_empties, seed=seed, progress=progress)
+    return [(black, white, score) for black, white, _, score in positions]
+
+
+# Indeks flat kanonik: min(indeks, indeks cermin) per jenis pola, agar keduanya satu bobot
+def _canonical_indices():
+    canonical = []
+    for (_, cells), mirror, offset in zip(PATTERNS, PATTERN_MIRRORS, PATTERN_OFFSETS):
+        index = np.arange(3 ** cells, dtype=np.int64)
+        if mirror is not None:
+            digits = [index // 3 ** k % 3 for k in range(cells)]
+            mirrored = sum(digits[m] * 3 ** k for k, m in enumerate(mirror))
+            index = np.minimum(index, mirrored)
+        canonical.append(index + offset)
+    return np.concatenate(canonical)
+
+
+# Fitur per posisi: indeks flat (offset jenis pola + indeks pola) semua instance, selisih
+# mobility dan fase. Tiap posisi juga dimasukkan versi warna ditukar (label dinegasikan).
+def _features(positions):
+    from game.board import get_geometry
+
+    geometry = get_geometry(8)
+    instance_offsets = np.array([PATTERN_OFFSETS[p] for p in INSTANCE_PATTERNS], dtype=np.int64)
+    rows = []
+    mobility = []
+    discs = []
+    targets = []
+    for black, white, score in positions:
+        mob = geometry.legal_mask(black, white).bit_count() - geometry.legal_mask(white, black).bit_count()
+        count = (black | white).bit_count()
+        rows.append(pattern_indices(black, white))
+        rows.append(pattern_indices(white, black))
+        mobility += (mob, -mob)
+        discs += (count, count)
+        targets += (score, -score)
+    features = _canonical_indices()[np.array(rows, dtype=np.int64) + instance_offsets]
+    return features, np.array(mobility, dtype=np.float64), np.array(discs), np.array(targets, dtype=np.float64), PATTERN_OFFSETS[-1]
+
+
+# Ridge regression satu fase: minimalkan |A w - y|^2 + l2 |w|^2 dengan conjugate gradient.
+# A jarang (satu angka 1 per instance pola + kolom mobility), jadi A w = jumlah w[fitur]
+# dan A^T r = bincount; matriks A tidak pernah dibentuk.
+def _fit_stage(features, mobility, targets, n_weights, l2, iterations):
+    n = len(features)
+    flat = features.ravel()
+
+    def normal(w):
+        pred = w[:n_weights][features].sum(axis=1) + mobility * w[n_weights]
+        out = np.empty_like(w)
+        out[:n_weights] = np.bincount(flat, weights=np.repeat(pred, features.shape[1]), minlength=n_weights)
+        out[n_weights] = mobility @ pred
+        return out + l2 * w
+
+    rhs = np.empty(n_weights + 1)
+    rhs[:n_weights] = np.bincount(flat, weights=np.repeat(targets, features.shape[1]), minlength=n_weights)
+    rhs[n_weights] = mobility @ targets
+    w = np.zeros(n_weights + 1)
+    r = rhs.copy()
+    d = r.copy()
+    rr = r @ r
+    for _ in range(iterations):
+        q = normal(d)
+        alpha = rr / (d @ q)
+        w += alpha * d
+        r -= alpha * q
+        rr_new = r @ r
+        if rr_new < 1e-10 * (rhs @ rhs):
+            break
+        d = r + (rr_new / rr) * d
+        rr = rr_new
+    pred = w[:n_weights][features].sum(axis=1) + mobility * w[n_weights]
+    return w, float(np.sqrt(np.mean((pred - targets) ** 2))) if n else 0.0
+
+
+# Fit semua fase. Tiap fase juga memakai posisi dari `overlap` bidak di luar rentangnya
+# agar bobot antar fase tidak melompat. Mengembalikan (PatternEvaluator, error RMS per fase).
+def fit_evaluator(positions, l2=100.0, iterations=200, overlap=3, progress=None):
+    if np is None:
+        raise RuntimeError("Fit bobot pola butuh NumPy")
+    features, mobility, discs, targets, n_weights = _features(positions)
+    canonical = _canonical_indices()
+    tables = []
+    weights = []
+    errors = []
+    for stage in range(N_STAGES):
+        low = 4 + stage * STAGE_DISCS - overlap
+        high = 4 + (stage + 1) * STAGE_DISCS + overlap
+        rows = (discs >= low) & (discs < high)
+        w, error = _fit_stage(features[rows], mobility[rows], targets[rows], n_weights, l2, iterations)
+        w[:n_weights] = w[canonical] # Indeks cermin memakai bobot kanoniknya
+        w = np.clip(np.rint(w * EVAL_SCALE), -32767, 32767).astype(np.int16)
+        tables.append([array('h', w[start:end].tobytes())
+                       for start, end in zip(PATTERN_OFFSETS, PATTERN_OFFSETS[1:])])
+        weights.append(int(w[n_weights]))
+        errors.append((int(rows.sum()), error))
+        if progress:
+            progress(stage + 1, N_STAGES)
+    return PatternEvaluator(tables, weights), errors
@@ -0,0 +1,131 @@
+import json
+import os
+import random
+
+from game.board import Board
+
+# --- MULTI-PROBCUT ---
+# Skor pencarian dalam (depth d) diprediksi dari pencarian dangkal (depth s) lewat regresi
+#   skor_d ~= a * skor_s + b, dengan simpangan residu sigma
+# Jika pencarian dangkal memprediksi skor_d >= beta (atau <= alpha) dengan selisih
+# PROBCUT_THRESHOLD x sigma, node dipotong tanpa pencarian dalam.
+# Parameter per depth: daftar (s, a, b, sigma), dicoba berurutan (Multi-ProbCut).
+# Regresi hanya berlaku untuk skala skor evaluator tempat ia difit, jadi parameter disimpan
+# per kunci evaluator (BaseAI._evaluator_key); tanpa parameter untuk evaluator aktif,
+# ProbCut dilewati.
+
+PROBCUT_THRESHOLD = 1.5
+# Skor di sekitar menang/kalah pasti (+-1000000) tidak cocok dengan regresi
+PROBCUT_MAX_SCORE = 100000
+# Folder data/ di root repo (sama dengan riwayat game), tidak bergantung direktori kerja
+PROBCUT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data', 'probcut.json')
+
+# Pasangan (depth dalam -> depth dangkal) yang difit; paritas sama agar bias ganjil/genap
+# evaluasi tidak ikut masuk regresi
+PROBCUT_PAIRS = {3: (1,), 4: (2,), 5: (1, 3), 6: (2, 4), 7: (3,), 8: (4,)}
+
+# Hasil `python benchmark.py probcut-fit` (12 game self-play acak 8x8, posisi empties 20..50)
+# untuk evaluator pola bawaan (data/pattern_weights.bin)
+DEFAULT_PARAMS = {
+    'pattern-3faddad1': {
+        3: [(1, 0.9024, -28.5, 485.86)],
+        4: [(2, 0.963, 33.32, 426.29)],
+        5: [(1, 0.8822, -80.47, 629.97), (3, 0.9926, -63.56, 362.03)],
+        6: [(2, 0.9519, 66.6, 566.84), (4, 1.005, 31.52, 310.6)],
+        7: [(3, 0.9994, -126.03, 487.54)],
+        8: [(4, 1.0353, 51.01, 423.44)],
+    },
+}
+
+
+# Parameter {kunci evaluator: {depth: [(s, a, b, sigma), ...]}} dari file hasil fit,
+# ditambah DEFAULT_PARAMS untuk evaluator yang tidak ada di file
+def load_params(path=PROBCUT_FILE):
+    params = dict(DEFAULT_PARAMS)
+    if path and os.path.exists(path):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        for key, depths in data.items():
+            params[key] = {int(depth): [tuple(check) for check in checks] for depth, checks in depths.items()}
+    return params
+
+
+# Tulis parameter; evaluator lain yang sudah ada di file tetap dipertahankan
+def save_params(params, path=PROBCUT_FILE):
+    data = {}
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            data = json.load(f)
+    for key, depths in params.items():
+        data[key] = {str(depth): [list(check) for check in checks] for depth, checks in depths.items()}
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+# Regresi linear kuadrat terkecil: (a, b, sigma) untuk pasangan (skor dangkal, skor dalam)
+def fit_pairs(pairs):
+    n = len(pairs)
+    mean_x = sum(x for x, _ in pairs) / n
+    mean_y = sum(y for _, y in pairs) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in pairs)
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in pairs)
+    a = cov / var_x if var_x else 1.0
+    b = mean_y - a * mean_x
+    sigma = (sum((y - a * x - b) ** 2 for x, y in pairs) / n) ** 0.5
+    return a, b, sigma
+
+
+# Skor negamax jendela penuh dari sudut pandang player (tanpa ProbCut/LMR).
+# TT dikosongkan tiap sampel: entri EXACT dari pencarian lebih dalam di posisi sebelumnya
+# (induk posisi ini) bisa menjawab pencarian dangkal, sehingga pasangan (dangkal, dalam)
+# tercatat identik dan regresi bias ke a = 1 dengan sigma terlalu kecil.
+def _search_score(ai, board, player, depth):
+    board = board.copy()
+    board.current_player = player
+    if ai.tt is not None:
+        ai.tt.clear()
+    ai._reset_ordering(board)
+    ai.deadline = None
+    ai._reset_counters()
+    return ai._alphabeta(board, depth, float('-inf'), float('inf'), player, 0)
+
+
+# Kumpulkan pasangan skor dari posisi self-play acak 8x8 lalu fit semua PROBCUT_PAIRS.
+# max_depth membatasi depth dalam (biaya fit naik cepat terhadap depth).
+# Mengembalikan {kunci evaluator aktif: {depth: [(s, a, b, sigma), ...]}}.
+def fit_params(games=20, max_depth=6, min_empties=20, max_empties=50, seed=1, progress=None):
+    from game.alphabetaAI import AlphaBetaAI
+
+    rng = random.Random(seed)
+    ai = AlphaBetaAI(pvs=True, endgame_empties=0)
+    pairs = {(deep, shallow): [] for deep, shallows in PROBCUT_PAIRS.items() if deep <= max_depth
+             for shallow in shallows}
+    for game in range(games):
+        board = Board()
+        ai.new_game()
+        while not board.is_game_over():
+            player = board.current_player
+            moves = board.get_valid_moves(player)
+            if not moves:
+                board.pass_turn()
+                continue
+            if min_empties <= board.empty_count <= max_empties:
+                scores = {}
+                for depth in sorted({d for key in pairs for d in key}):
+                    scores[depth] = _search_score(ai, board, player, depth)
+                if all(abs(score) < PROBCUT_MAX_SCORE for score in scores.values()):
+                    for deep, shallow in pairs:
+                        pairs[(deep, shallow)].append((scores[shallow], scores[deep]))
+            # Langkah acak agar posisi sampel beragam
+            board.make_move(*rng.choice(moves), player)
+            board.pass_turn()
+        if progress:
+            progress(game + 1, games)
+
+    params = {}
+    for (deep, shallow), samples in sorted(pairs.items()):
+        if len(samples) > 2:
+            a, b, sigma = fit_pairs(samples)
+            params.setdefault(deep, []).append((shallow, round(a, 4), round(b, 2), round(sigma, 2)))
+    return {ai._evaluator_key(Board()): params}
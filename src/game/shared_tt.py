@@ -0,0 +1,137 @@
+import os
+from multiprocessing import shared_memory
+
+from game.transposition import ENTRY_BYTES
+
+# --- TRANSPOSITION TABLE DI SHARED MEMORY ---
+# Satu tabel untuk semua proses worker (multiprocessing.shared_memory), tanpa lock.
+# Slot = 2 kata uint64: [key ^ data, data]. Saat probe, entri hanya dipakai jika
+# word0 ^ word1 == key; tulisan yang terpotong (race antar proses) atau entri milik
+# posisi lain otomatis gagal dicek dan dianggap miss.
+# Layout bucket & kebijakan replace sama dengan game.transposition.TranspositionTable.
+#
+# data (64 bit):
+#   bit  0..31  score + 2^31
+#   bit 32..39  depth
+#   bit 40..41  flag (EXACT/LOWER/UPPER)
+#   bit 42..50  indeks petak best move + 1 (0 = tidak ada)
+#   bit 51..58  generation
+
+SLOT_BYTES = 16
+_SCORE_OFFSET = 1 << 31
+
+
+class SharedTranspositionTable:
+    def __init__(self, size_mb=16, board_size=8, name=None):
+        self.size_mb = size_mb
+        self.board_size = board_size
+        # Jumlah entri sama dengan TT lokal dengan budget yang sama
+        buckets = max(1, int(size_mb * 1024 * 1024) // (2 * ENTRY_BYTES))
+        buckets = 1 << (buckets.bit_length() - 1)
+        self.mask = buckets - 1
+        # Pemilik = proses pembuat; salinan hasil fork di worker tidak ikut unlink
+        self.owner_pid = os.getpid() if name is None else None
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=2 * buckets * SLOT_BYTES)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.words = self.shm.buf.cast('Q')
+        self.generation = 0
+        self.reset_stats()
+
+    # Dikirim ke proses lain (spawn) sebagai nama segmen, lalu di-attach ulang
+    def __getstate__(self):
+        return {'size_mb': self.size_mb, 'board_size': self.board_size, 'name': self.shm.name}
+
+    def __setstate__(self, state):
+        self.__init__(state['size_mb'], state['board_size'], state['name'])
+
+    def __len__(self):
+        return len(self.words) // 2
+
+    def clear(self):
+        self.shm.buf[:] = bytes(len(self.shm.buf))
+        self.generation = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+        self.overwrites = 0
+        self.collisions = 0
+
+    def new_search(self):
+        self.generation = (self.generation + 1) & 0xFF
+        self.reset_stats()
+
+    def _unpack(self, key, data):
+        move_code = (data >> 42) & 0x1FF
+        move = divmod(move_code - 1, self.board_size) if move_code else None
+        return (key, (data >> 32) & 0xFF, (data >> 40) & 0x3,
+                (data & 0xFFFFFFFF) - _SCORE_OFFSET, move, (data >> 51) & 0xFF)
+
+    def probe(self, key):
+        self.probes += 1
+        words = self.words
+        i = (key & self.mask) << 2
+        occupied = False
+        for j in (i, i + 2):
+            data = words[j + 1]
+            check = words[j]
+            if check ^ data == key:
+                self.hits += 1
+                return self._unpack(key, data)
+            occupied = occupied or data
+        # Miss pada bucket yang terisi posisi lain (atau tulisan yang terpotong)
+        if occupied:
+            self.collisions += 1
+        return None
+
+    def store(self, key, depth, flag, score, move):
+        self.stores += 1
+        words = self.words
+        i = (key & self.mask) << 2
+        move_code = move[0] * self.board_size + move[1] + 1 if move is not None else 0
+        data = ((int(score) + _SCORE_OFFSET) & 0xFFFFFFFF) | (min(depth, 0xFF) << 32) | (flag << 40) \
+            | (move_code << 42) | (self.generation << 51)
+
+        data_deep = words[i + 1]
+        deep_key = words[i] ^ data_deep
+        if not data_deep or deep_key == key or depth >= (data_deep >> 32) & 0xFF \
+                or (data_deep >> 51) & 0xFF != self.generation:
+            j = i
+            old = data_deep
+            old_key = deep_key
+        else:
+            j = i + 2
+            old = words[j + 1]
+            old_key = words[j] ^ old
+        if old and old_key != key:
+            self.overwrites += 1
+        # Dua kata ditulis terpisah tanpa lock; pembaca yang melihat setengah tulisan gagal di cek XOR
+        words[j + 1] = data
+        words[j] = key ^ data
+
+    def stats(self):
+        probes = self.probes or 1
+        return {
+            'tt_hit_rate': self.hits / probes,
+            'tt_cutoff_rate': self.cutoffs / probes,
+            'tt_collisions': self.collisions,
+            'tt_overwrites': self.overwrites,
+        }
+
+    # Lepas view & segmen; pemilik (proses yang membuat) juga menghapus segmennya
+    def close(self):
+        if getattr(self, 'words', None) is None:
+            return
+        self.words.release()
+        self.words = None
+        self.shm.close()
+        if self.owner_pid == os.getpid():
+            self.shm.unlink()
+
+    def __del__(self):
+        self.close()
@@ -0,0 +1,223 @@
+# --- BIDAK STABIL ---
+# Bidak stabil = bidak yang tidak mungkin dibalik lagi sampai game selesai.
+# Model: petak kosong boleh diisi warna apa pun dengan urutan apa pun (superset dari
+# langkah legal), jadi bidak yang stabil di model ini pasti stabil di permainan asli.
+#
+# 1. Tepi: bidak di baris/kolom tepi hanya bisa dibalik sepanjang tepi itu sendiri, jadi
+#    stabilitasnya cukup dihitung dari konfigurasi satu garis (3^size kemungkinan).
+#    Tabel ini eksak dan dihitung sekali per ukuran papan (8x8: semua 3^8 konfigurasi).
+#    Papan lebih besar (tepi > EDGE_TABLE_MAX) di-memo saat dipakai; di sana garis dengan
+#    lebih dari EDGE_EXACT_EMPTIES petak kosong memakai run sewarna dari pojok (aman, tidak
+#    eksak). Kolom tepi di-memo per bit kolom apa adanya (tanpa transpos papan).
+# 2. Garis penuh: bidak yang keempat garisnya (horizontal, vertikal, dua diagonal) sudah
+#    penuh tidak bisa dibalik. Dihitung dengan menyebarkan petak kosong sepanjang tiap sumbu
+#    (shift 1, 2, 4, ... petak): petak yang tidak terjangkau ada di garis penuh.
+# 3. Propagasi: bidak stabil jika pada setiap sumbu garisnya penuh ATAU salah satu
+#    tetangganya di sumbu itu bidak stabil sewarna. Diulang sampai tidak bertambah.
+# Hasilnya eksak di tepi dan batas bawah (tidak pernah berlebih) di petak dalam.
+
+EDGE_TABLE_MAX = 10 # Tepi sampai panjang ini: tabel lengkap 3^size dibuat di awal (10x10: ~0.5s)
+EDGE_EXACT_EMPTIES = 6 # Biaya memo satu garis ~3^(petak kosong)
+
+
+class StabilityTable:
+    def __init__(self, geometry):
+        size = self.size = geometry.size
+        self.geometry = geometry
+        self.full_mask = geometry.full_mask
+        self.row_mask = (1 << size) - 1
+        self.last_row_shift = (size - 1) * size
+        col_first = self.col_first = sum(1 << (r * size) for r in range(size))
+        self.col_last = col_first << (size - 1)
+        self.not_col_first = self.full_mask ^ col_first
+        self.not_col_last = self.full_mask ^ self.col_last
+        self.edges = self.row_mask | self.row_mask << self.last_row_shift | col_first | self.col_last
+
+        # Penyebaran per sumbu: (shift, mask sumber shift kiri, mask sumber shift kanan) untuk
+        # k = 1, 2, 4, ... petak sepanjang sumbu; mask membuang petak yang akan melewati tepi
+        def columns(low, high):
+            return sum(1 << (r * size + c) for r in range(size) for c in range(low, high))
+        self.spread = []
+        for step, dc in ((1, 1), (size, 0), (size + 1, 1), (size - 1, -1)):
+            shifts = []
+            k = 1
+            while k < size:
+                # Shift kiri k langkah = kolom + dc * k; shift kanan = kolom - dc * k
+                if dc > 0:
+                    left, right = columns(0, size - k), columns(k, size)
+                elif dc < 0:
+                    left, right = columns(k, size), columns(0, size - k)
+                else:
+                    left = right = self.full_mask
+                shifts.append((k * step, left, right))
+                k *= 2
+            self.spread.append(tuple(shifts))
+        self.spread = tuple(self.spread)
+
+        # columns[(own << cells) | opp] (bit kolom tepi apa adanya) = mask bidak stabil kolom itu
+        self.columns = {}
+        self.cells = geometry.cells
+
+        # edge[(own << size) | opp] = mask bidak (kedua warna) yang stabil pada garis tepi itu
+        self.edge = {}
+        self.lazy = size > EDGE_TABLE_MAX
+        if not self.lazy:
+            for own in range(1 << size):
+                rest = self.row_mask ^ own
+                opp = rest
+                while True:
+                    self._line(own, opp)
+                    if not opp: break
+                    opp = (opp - 1) & rest
+
+    # Stabilitas satu garis tepi (bit 0..size-1), di-memo. Bidak stabil jika tidak terbalik
+    # oleh pengisian petak kosong mana pun dengan warna mana pun, dan tetap stabil setelahnya.
+    def _line(self, own, opp):
+        key = own << self.size | opp
+        stable = self.edge.get(key)
+        if stable is not None:
+            return stable
+        stable = own | opp
+        empty = self.row_mask ^ stable
+        if self.lazy and empty.bit_count() > EDGE_EXACT_EMPTIES:
+            return _corner_runs(own, self.size) | _corner_runs(opp, self.size)
+        while empty and stable:
+            bit = empty & -empty
+            empty ^= bit
+            for mine, theirs, placed in ((own, opp, True), (opp, own, False)):
+                flips = _line_flips(mine, theirs, bit, self.size)
+                if placed:
+                    child = self._line(own | bit | flips, opp ^ flips)
+                else:
+                    child = self._line(own ^ flips, opp | bit | flips)
+                stable &= child & ~flips
+        self.edge[key] = stable
+        return stable
+
+    # Bidak stabil di baris teratas dan terbawah (kedua warna)
+    def _rows(self, own, opp):
+        mask = self.row_mask
+        shift = self.last_row_shift
+        line = self._line
+        return line(own & mask, opp & mask) | line(own >> shift & mask, opp >> shift & mask) << shift
+
+    # Bidak stabil di kolom tepi col (own/opp sudah di-mask ke kolom itu), di-memo
+    def _column(self, own, opp, col):
+        key = own << self.cells | opp
+        stable = self.columns.get(key)
+        if stable is None:
+            size = self.size
+            squares = [r * size + col for r in range(size)]
+            line = self._line(sum((own >> sq & 1) << r for r, sq in enumerate(squares)),
+                              sum((opp >> sq & 1) << r for r, sq in enumerate(squares)))
+            stable = self.columns[key] = sum((line >> r & 1) << sq for r, sq in enumerate(squares))
+        return stable
+
+    # Bidak stabil di keempat tepi (kedua warna)
+    def edge_stable(self, own, opp):
+        first = self.col_first
+        last = self.col_last
+        return self._rows(own, opp) | self._column(own & first, opp & first, 0) \
+            | self._column(own & last, opp & last, self.size - 1)
+
+    # Mask petak yang garisnya penuh, per sumbu (horizontal, vertikal, diagonal, anti-diagonal)
+    def full_lines(self, occupied):
+        full_mask = self.full_mask
+        empty = full_mask ^ occupied
+        full = []
+        for shifts in self.spread:
+            reach = empty
+            for shift, left, right in shifts:
+                reach |= (reach & left) << shift & full_mask | (reach & right) >> shift
+            full.append(full_mask ^ reach)
+        return full
+
+    # Mask bidak own yang stabil
+    def stable_discs(self, own, opp):
+        size = self.size
+        full_h, full_v, full_d, full_a = self.full_lines(own | opp)
+        stable = (self.edge_stable(own, opp) | (full_h & full_v & full_d & full_a)) & own
+        candidates = own ^ stable
+        if not candidates:
+            return stable
+        left = self.not_col_first
+        right = self.not_col_last
+        full_mask = self.full_mask
+        while True:
+            new = candidates \
+                & (full_h | (stable << 1 & left) | (stable >> 1 & right)) \
+                & (full_v | (stable << size & full_mask) | stable >> size) \
+                & (full_d | (stable << (size + 1) & left & full_mask) | (stable >> (size + 1) & right)) \
+                & (full_a | (stable << (size - 1) & right & full_mask) | (stable >> (size - 1) & left))
+            if not new:
+                return stable
+            stable |= new
+            candidates ^= new
+
+    def count_stable(self, own, opp):
+        return self.stable_discs(own, opp).bit_count()
+
+
+# Bidak lawan yang terbalik pada satu garis jika `own` menaruh bidak di bit
+def _line_flips(own, opp, bit, size):
+    flips = 0
+    f = 0
+    x = bit << 1
+    while x >> size == 0 and x & opp:
+        f |= x
+        x <<= 1
+    if x & own:
+        flips |= f
+    f = 0
+    x = bit >> 1
+    while x & opp:
+        f |= x
+        x >>= 1
+    if x & own:
+        flips |= f
+    return flips
+
+
+# Run bidak sewarna yang menempel di ujung garis: tidak bisa diapit sepanjang garis
+def _corner_runs(discs, size):
+    run = (discs ^ (discs + 1)) >> 1 # Bit 0, 1, ... selama menyala
+    top = 1 << (size - 1)
+    x = top
+    while x & discs:
+        run |= x
+        x >>= 1
+    return run
+
+
+_TABLES = {}
+
+# Tabel stabilitas bersama per ukuran papan (dibuat sekali per proses)
+def get_stability(geometry):
+    table = _TABLES.get(geometry.size)
+    if table is None:
+        table = _TABLES[geometry.size] = StabilityTable(geometry)
+    return table
+
+
+# --- REFERENSI BRUTE FORCE (untuk verifikasi, eksponensial terhadap petak kosong) ---
+# Coba semua urutan pengisian petak kosong dengan kedua warna di papan penuh; bidak stabil
+# jika tidak pernah terbalik. Hanya praktis untuk posisi dengan sedikit petak kosong.
+def reference_stable(geometry, own, opp, memo=None):
+    if memo is None:
+        memo = {}
+    key = (own, opp)
+    stable = memo.get(key)
+    if stable is not None:
+        return stable
+    stable = own | opp
+    empty = geometry.full_mask ^ stable
+    flip_mask = geometry.flip_mask
+    while empty and stable:
+        bit = empty & -empty
+        empty ^= bit
+        flips = flip_mask(own, opp, bit)
+        stable &= reference_stable(geometry, own | bit | flips, opp ^ flips, memo) & ~flips
+        flips = flip_mask(opp, own, bit)
+        stable &= reference_stable(geometry, own ^ flips, opp | bit | flips, memo) & ~flips
+    memo[key] = stable
+    return stable
@@ -0,0 +1,118 @@
+from utils.constants import BOARD_SIZE
+
+# --- SIMETRI D4 PADA BITBOARD ---
+# Transform t (0..7) = komposisi: transpose jika bit 2, flip vertikal jika bit 1,
+# mirror horizontal jika bit 0 (diterapkan berurutan: transpose -> vertikal -> horizontal).
+# Setiap komponen adalah involusi, jadi invers-nya menerapkan urutan sebaliknya.
+# Papan 8x8 memakai delta swap; ukuran lain memakai tabel permutasi per bit.
+TRANSFORMS = tuple(range(8))
+IDENTITY = 0
+
+_M1 = 0x5555555555555555
+_M2 = 0x3333333333333333
+_M4 = 0x0F0F0F0F0F0F0F0F
+_K1 = 0x5500550055005500
+_K2 = 0x3333000033330000
+_K4 = 0x0F0F0F0F00000000
+
+
+def flip_vertical(x):
+    # Baris r -> 7 - r (tukar urutan byte)
+    return int.from_bytes(x.to_bytes(8, 'little'), 'big')
+
+
+def mirror_horizontal(x):
+    # Kolom c -> 7 - c (balik bit di dalam tiap byte)
+    x = ((x >> 1) & _M1) | ((x & _M1) << 1)
+    x = ((x >> 2) & _M2) | ((x & _M2) << 2)
+    return ((x >> 4) & _M4) | ((x & _M4) << 4)
+
+
+def transpose(x):
+    # (r, c) -> (c, r)
+    t = _K4 & (x ^ (x << 28))
+    x ^= t ^ (t >> 28)
+    t = _K2 & (x ^ (x << 14))
+    x ^= t ^ (t >> 14)
+    t = _K1 & (x ^ (x << 7))
+    return x ^ t ^ (t >> 7)
+
+
+_PERMUTATIONS = {}
+
+def _permutation(size, t):
+    table = _PERMUTATIONS.get((size, t))
+    if table is None:
+        table = []
+        for idx in range(size * size):
+            r, c = transform_square(idx // size, idx % size, t, size)
+            table.append(1 << (r * size + c))
+        table = _PERMUTATIONS[(size, t)] = tuple(table)
+    return table
+
+
+def transform_bits(x, t, size=BOARD_SIZE):
+    if size == 8:
+        if t & 4: x = transpose(x)
+        if t & 2: x = flip_vertical(x)
+        if t & 1: x = mirror_horizontal(x)
+        return x
+    # Ukuran lain: petakan bit satu per satu (biaya sebanding jumlah bidak)
+    table = _permutation(size, t)
+    out = 0
+    while x:
+        low = x & -x
+        out |= table[low.bit_length() - 1]
+        x ^= low
+    return out
+
+
+def transform_square(row, col, t, size=BOARD_SIZE):
+    if t & 4: row, col = col, row
+    if t & 2: row = size - 1 - row
+    if t & 1: col = size - 1 - col
+    return row, col
+
+
+def inverse_transform_square(row, col, t, size=BOARD_SIZE):
+    if t & 1: col = size - 1 - col
+    if t & 2: row = size - 1 - row
+    if t & 4: row, col = col, row
+    return row, col
+
+
+# Bentuk kanonik: (black, white) minimal dari 8 posisi simetris + transform penghasilnya
+def canonical(black, white, size=BOARD_SIZE):
+    best = (black, white)
+    best_t = IDENTITY
+    for t in range(1, 8):
+        cand = (transform_bits(black, t, size), transform_bits(white, t, size))
+        if cand < best:
+            best = cand
+            best_t = t
+    return best, best_t
+
+
+# Transform (selain identitas) yang memetakan posisi ke dirinya sendiri
+def stabilizer(black, white, size=BOARD_SIZE):
+    return [t for t in range(1, 8)
+            if transform_bits(black, t, size) == black and transform_bits(white, t, size) == white]
+
+
+# Buang langkah yang simetris dengan langkah lain pada posisi simetris.
+# `moves` bisa berisi (row, col) atau ((row, col), flips); urutan asli dipertahankan.
+def unique_moves(black, white, moves, size=BOARD_SIZE):
+    symmetries = stabilizer(black, white, size)
+    if not symmetries:
+        return moves
+    seen = set()
+    unique = []
+    for entry in moves:
+        square = entry[0] if isinstance(entry[0], tuple) else entry
+        if square in seen:
+            continue
+        unique.append(entry)
+        seen.add(square)
+        for t in symmetries:
+            seen.add(transform_square(square[0], square[1], t, size))
+    return unique
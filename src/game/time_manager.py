@@ -0,0 +1,85 @@
+import time
+
+# --- TIME MANAGER ---
+# Mengatur waktu berpikir per langkah untuk engine iterative deepening (Minimax/AlphaBeta).
+#   - total_time: jam per game (detik untuk satu pemain); sisa jam dibagi ke perkiraan
+#     sisa langkah, dibobot fase permainan dan jumlah langkah legal
+#   - move_time: budget datar per langkah (ai_time_limit lama) sebagai batas keras
+# Per langkah ada dua batas:
+#   - soft: target; iterasi baru hanya dimulai sebelum soft dan jika prediksinya
+#     (waktu iterasi terakhir x effective branching factor) selesai sebelum hard
+#   - hard: batas mutlak; pencarian diputus (TimeoutError) jika terlewati
+
+# Bobot waktu per fase (midgame paling menentukan, endgame dibantu solver eksak)
+PHASE_WEIGHTS = {'early': 0.7, 'mid': 1.3, 'late': 1.0}
+# Pencarian berhenti lebih awal jika langkah terbaik sama selama sekian iterasi
+STABLE_ITERATIONS = 3
+STABLE_FRACTION = 0.5 # ... dan waktu terpakai sudah >= porsi soft ini
+DEFAULT_EBF = 4.0
+MIN_MOVES_LEFT = 4
+RESERVE = 0.05 # Porsi jam yang disisakan sebagai cadangan
+
+
+class TimeManager:
+    def __init__(self, total_time=None, move_time=None):
+        if not total_time and not move_time:
+            raise ValueError("TimeManager butuh total_time atau move_time")
+        self.total_time = total_time
+        self.move_time = move_time
+        self.new_game()
+
+    def new_game(self):
+        self.remaining = self.total_time
+        self.log = [] # Satu entri per langkah (lihat end_move)
+        self.soft = self.hard = 0
+        self._start = 0
+
+    # Hitung budget (soft, hard) dalam detik untuk posisi ini dan mulai jam langkah
+    def start_move(self, board, legal_count, phase):
+        self._start = time.monotonic()
+        scale = PHASE_WEIGHTS[phase] * min(1.5, max(0.5, legal_count / 8))
+        if self.total_time:
+            # Perkiraan sisa langkah pemain ini: setengah petak kosong
+            moves_left = max(MIN_MOVES_LEFT, board.empty_count // 2)
+            usable = max(0.0, self.remaining * (1 - RESERVE))
+            soft = usable / moves_left * scale
+            hard = min(soft * 3, usable * 0.5)
+            if self.move_time:
+                hard = min(hard, self.move_time)
+        else:
+            hard = self.move_time
+            soft = min(hard, hard * 0.6 * scale)
+        self.soft = min(soft, hard)
+        self.hard = hard
+        self.empties = board.empty_count
+        self.legal_count = legal_count
+        self.phase = phase
+        return self.soft, self.hard
+
+    # Dipanggil setelah setiap iterasi selesai: mulai iterasi berikutnya?
+    def continue_search(self, elapsed, last_iteration_time, ebf, stable_iterations):
+        if elapsed >= self.soft:
+            return False
+        if stable_iterations >= STABLE_ITERATIONS and elapsed >= self.soft * STABLE_FRACTION:
+            return False
+        predicted = last_iteration_time * (ebf or DEFAULT_EBF)
+        return elapsed + predicted <= self.hard
+
+    # Catat pemakaian waktu langkah ini dan kurangi jam game
+    def end_move(self, depth):
+        used = time.monotonic() - self._start
+        if self.total_time:
+            self.remaining = max(0.0, self.remaining - used)
+        entry = {
+            'move': len(self.log) + 1,
+            'empties': self.empties,
+            'legal_moves': self.legal_count,
+            'phase': self.phase,
+            'soft': self.soft,
+            'hard': self.hard,
+            'used': used,
+            'depth': depth,
+            'remaining': self.remaining,
+        }
+        self.log.append(entry)
+        return entry
@@ -0,0 +1,85 @@
+# --- TRANSPOSITION TABLE ---
+# Tabel ukuran tetap yang di-key dengan Zobrist hash (board.hash).
+# Setiap bucket punya 2 slot:
+#   - slot 0 "depth-preferred": hanya diganti oleh pencarian yang sama/lebih dalam,
+#     atau jika entri lama berasal dari get_move sebelumnya (generasi lama)
+#   - slot 1 "always-replace": selalu ditimpa entri yang tidak masuk slot 0
+# Entri: (key, depth, flag, score, best_move, generation)
+
+EXACT = 0
+LOWER = 1 # Fail-high: nilai sebenarnya >= score
+UPPER = 2 # Fail-low: nilai sebenarnya <= score
+
+# Perkiraan memori satu entri di CPython: tuple 6 elemen (88) + key 64-bit (36)
+# + score (~28) + pointer slot list (8)
+ENTRY_BYTES = 160
+
+
+class TranspositionTable:
+    def __init__(self, size_mb=16):
+        self.size_mb = size_mb
+        # Jumlah bucket dibulatkan ke bawah ke pangkat 2 agar indeks cukup `key & mask`
+        buckets = max(1, int(size_mb * 1024 * 1024) // (2 * ENTRY_BYTES))
+        buckets = 1 << (buckets.bit_length() - 1)
+        self.mask = buckets - 1
+        self.slots = [None] * (2 * buckets)
+        self.generation = 0
+        self.reset_stats()
+
+    def __len__(self):
+        return len(self.slots)
+
+    def clear(self):
+        self.slots = [None] * len(self.slots)
+        self.generation = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    # Dipanggil di awal setiap get_move: entri lama tetap bisa dipakai,
+    # tapi slot depth-preferred-nya boleh ditimpa pencarian baru
+    def new_search(self):
+        self.generation = (self.generation + 1) & 0xFF
+        self.reset_stats()
+
+    def probe(self, key):
+        self.probes += 1
+        slots = self.slots
+        i = (key & self.mask) << 1
+        entry = slots[i]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        entry = slots[i + 1]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key, depth, flag, score, move):
+        self.stores += 1
+        slots = self.slots
+        i = (key & self.mask) << 1
+        entry = (key, depth, flag, score, move, self.generation)
+        deep = slots[i]
+        if deep is None or deep[0] == key or depth >= deep[1] or deep[5] != self.generation:
+            if deep is not None and deep[0] != key:
+                self.overwrites += 1
+            slots[i] = entry
+        else:
+            old = slots[i + 1]
+            if old is not None and old[0] != key:
+                self.overwrites += 1
+            slots[i + 1] = entry
+
+    def stats(self):
+        probes = self.probes or 1
+        return {
+            'tt_hit_rate': self.hits / probes,
+            'tt_cutoff_rate': self.cutoffs / probes,
+        }
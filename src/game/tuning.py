@@ -0,0 +1,309 @@
+import json
+import os
+import random
+import zlib
+
+try:
+    import numpy as np
+except ImportError: # Hanya fit bobot yang butuh NumPy; evaluasi tidak
+    np = None
+
+from game.board import Board, get_geometry
+from game.endgame import EndgameSolver
+from game.pattern_eval import EVAL_SCALE
+from game.stability import get_stability
+from game.symmetry import transform_square
+from utils.constants import BOARD_SIZE
+
+# --- TUNING BOBOT HEURISTIK ---
+# Model linear per fase ('early' / 'mid' / 'late', batas sama dengan BaseAI._get_game_phase),
+# dari sudut pandang pemain:
+#   skor = sum_k squares[k] * (bidak own - bidak opp di kelas petak k)
+#        + mobility * (langkah own - langkah opp)
+#        + stability * (bidak stabil own - bidak stabil opp)
+# Kelas petak = orbit simetri D4 (10 kelas untuk 8x8), jadi tabel hasil fit simetris seperti
+# BOARD_WEIGHTS. Coin parity tidak perlu suku sendiri: selisih bidak = jumlah semua kelas.
+# Label = selisih bidak (x EVAL_SCALE, skala yang sama dengan evaluasi pola), jadi skor
+# heuristik hasil tuning bisa dibaca sebagai "unggul berapa bidak".
+
+PHASES = ('early', 'mid', 'late')
+# Folder data/ di root repo (sama dengan bobot pola & parameter ProbCut)
+_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data')
+TUNING_FILE = os.path.join(_DATA_DIR, 'eval_weights.json')
+HISTORY_FILE = os.path.join(_DATA_DIR, 'game_history.json')
+
+
+# Fase dari jumlah bidak (sama dengan BaseAI._get_game_phase): 0 early, 1 mid, 2 late
+def phase_index(discs, cells):
+    if discs < cells * 20 // 64: return 0
+    if discs < cells * 45 // 64: return 1
+    return 2
+
+
+# Mask per kelas petak (orbit D4), urut dari petak terkecil tiap kelas
+def square_classes(size):
+    classes = {}
+    for idx in range(size * size):
+        r, c = divmod(idx, size)
+        rep = min(row * size + col for row, col in (transform_square(r, c, t, size) for t in range(8)))
+        classes[rep] = classes.get(rep, 0) | 1 << idx
+    return tuple(classes[rep] for rep in sorted(classes))
+
+
+class HeuristicWeights:
+    # phases[fase] = (bobot per kelas petak, mobility, stability)
+    def __init__(self, size, phases):
+        self.size = size
+        self.phases = phases
+        self.masks = square_classes(size)
+        self.stability = get_stability(get_geometry(size))
+        # Identitas bobot (lihat BaseAI._evaluator_key)
+        self.key = f'tuned{size}-{zlib.crc32(json.dumps(self.to_json(), sort_keys=True).encode()):08x}'
+
+    # Skor dari sudut pandang player (posisi belum game over)
+    def evaluate(self, board, player, phase):
+        squares, mobility, stability = self.phases[phase]
+        opponent = 'W' if player == 'B' else 'B'
+        own, opp = board.get_discs(player)
+        score = mobility * (board.count_moves(player) - board.count_moves(opponent))
+        score += stability * (self.stability.count_stable(own, opp) - self.stability.count_stable(opp, own))
+        for mask, weight in zip(self.masks, squares):
+            score += weight * ((own & mask).bit_count() - (opp & mask).bit_count())
+        return score
+
+    # Tabel bobot size x size (format file, mudah dibandingkan dengan BOARD_WEIGHTS)
+    def table(self, phase):
+        squares = self.phases[phase][0]
+        grid = [0] * (self.size * self.size)
+        for mask, weight in zip(self.masks, squares):
+            for idx in range(self.size * self.size):
+                if mask >> idx & 1:
+                    grid[idx] = weight
+        return [grid[r * self.size:(r + 1) * self.size] for r in range(self.size)]
+
+    def to_json(self):
+        return {phase: {'squares': self.table(phase), 'mobility': self.phases[phase][1],
+                        'stability': self.phases[phase][2]} for phase in PHASES}
+
+    @classmethod
+    def from_json(cls, size, data):
+        masks = square_classes(size)
+        phases = {}
+        for phase in PHASES:
+            entry = data[phase]
+            grid = [w for row in entry['squares'] for w in row]
+            squares = tuple(grid[(mask & -mask).bit_length() - 1] for mask in masks)
+            phases[phase] = (squares, entry['mobility'], entry['stability'])
+        return cls(size, phases)
+
+
+# --- FILE BOBOT ---
+# JSON: {"<size>": {"early": {"squares": [[...]], "mobility": m, "stability": s}, ...}, ...}
+def load_weights(path=TUNING_FILE):
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        data = json.load(f)
+    return {int(size): HeuristicWeights.from_json(int(size), entry) for size, entry in data.items()}
+
+
+# Tulis bobot untuk satu ukuran papan; ukuran lain di file tetap dipertahankan
+def save_weights(weights, path=TUNING_FILE):
+    data = {}
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            data = json.load(f)
+    data[str(weights.size)] = weights.to_json()
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(dict(sorted(data.items(), key=lambda item: int(item[0]))), f, indent=2)
+
+
+_WEIGHTS = None
+
+# Bobot hasil tuning untuk ukuran papan ini (lazy, sekali per proses); None jika tidak ada
+def get_heuristic_weights(size):
+    global _WEIGHTS
+    if _WEIGHTS is None:
+        _WEIGHTS = load_weights(TUNING_FILE)
+    return _WEIGHTS.get(size)
+
+
+# --- SUMBER POSISI ---
+# Semua sumber menghasilkan (black, white, player, score): score = selisih bidak akhir
+# (sudut pandang hitam) dengan permainan sempurna mulai solve_empties petak kosong.
+
+# Self-play: random_plies langkah acak di awal (variasi), lalu AlphaBetaAI dangkal, lalu
+# main sempurna (EndgameSolver). Label setiap posisi = hasil akhir game tersebut, jadi label
+# posisi di bawah solve_empties eksak. Langkah acak setelah pembukaan (epsilon) membuat
+# label jauh lebih bising, jadi default-nya 0.
+def selfplay_positions(games=1000, size=BOARD_SIZE, depth=2, random_plies=8, epsilon=0.0, solve_empties=10,
+                       seed=1, progress=None):
+    from game.alphabetaAI import AlphaBetaAI
+
+    rng = random.Random(seed)
+    ai = AlphaBetaAI(depth=depth, endgame_empties=0)
+    ai.collect_stats = False
+    positions = []
+    for game in range(games):
+        board = Board(size)
+        ai.new_game()
+        solver = EndgameSolver(board.geometry)
+        start_empties = board.empty_count
+        seen = []
+        while not board.is_game_over():
+            player = board.current_player
+            moves = board.get_valid_moves(player)
+            if not moves:
+                board.pass_turn()
+                continue
+            seen.append((board.black, board.white, player))
+            ply = start_empties - board.empty_count
+            if board.empty_count <= solve_empties:
+                own, opp = board.get_discs(player)
+                move, _ = solver.solve_root(own, opp)
+            elif ply < random_plies or rng.random() < epsilon:
+                move = rng.choice(moves)
+            else:
+                move = ai.get_move(board.copy(), player)
+            board.make_move(move[0], move[1], player)
+            board.pass_turn()
+        black_score, white_score = board.get_score()
+        score = black_score - white_score
+        positions.extend((black, white, player, score) for black, white, player in seen)
+        if progress:
+            progress(game + 1, games)
+    return positions
+
+
+# Game tersimpan (riwayat bot vs bot, langkah hex dari game.codec). Langkahnya belum tentu
+# sempurna, jadi setiap posisi dengan <= solve_empties petak kosong diselesaikan eksak, dan
+# posisi sebelumnya diberi label hasil eksak posisi pertama yang bisa diselesaikan.
+def history_positions(path=HISTORY_FILE, size=BOARD_SIZE, solve_empties=10, progress=None):
+    from game.codec import replay_game
+
+    with open(path, 'r') as f:
+        history = json.load(f)
+    games = [game['moves'] for entry in history
+             if entry.get('ai_config', {}).get('board_size', BOARD_SIZE) == size
+             for game in entry.get('games', []) if game.get('moves')]
+    solver = EndgameSolver(get_geometry(size))
+    positions = []
+    for number, moves in enumerate(games):
+        seen = []
+        solved = None
+        boards = replay_game(bytes.fromhex(moves), size)
+        for board in boards[:-1]:
+            player = board.current_player
+            if not board.legal_moves_mask(player):
+                continue
+            if board.empty_count <= solve_empties:
+                own, opp = board.get_discs(player)
+                _, score = solver.solve_root(own, opp)
+                score = score if player == 'B' else -score
+                if solved is None:
+                    solved = score
+                positions.append((board.black, board.white, player, score))
+            else:
+                seen.append((board.black, board.white, player))
+        if solved is None:
+            # Game selesai sebelum solve_empties: hasil akhir game itu sendiri
+            black_score, white_score = boards[-1].get_score()
+            solved = black_score - white_score
+        positions.extend((black, white, player, solved) for black, white, player in seen)
+        if progress:
+            progress(number + 1, len(games))
+    return positions
+
+
+# Ganti label posisi dengan > solve_empties petak kosong dengan skor pencarian depth ini
+# (AlphaBetaAI memakai evaluasi pola / bobot tuning yang ada, keduanya berskala bidak).
+def search_labels(positions, size=BOARD_SIZE, depth=4, solve_empties=10, progress=None):
+    from game.alphabetaAI import AlphaBetaAI
+    from game.probcut import _search_score
+
+    ai = AlphaBetaAI(endgame_empties=0)
+    ai.collect_stats = False
+    probe = Board(size)
+    if ai._pattern_evaluator(probe) is None and ai._heuristic_weights(probe) is None:
+        raise RuntimeError("Label pencarian butuh evaluasi berskala bidak (bobot pola atau bobot tuning)")
+    cells = get_geometry(size).cells
+    labeled = []
+    for i, (black, white, player, score) in enumerate(positions):
+        if cells - (black | white).bit_count() > solve_empties:
+            board = Board.from_bitboards(black, white, player, size)
+            searched = _search_score(ai, board, player, depth) / EVAL_SCALE
+            score = searched if player == 'B' else -searched
+        labeled.append((black, white, player, score))
+        if progress:
+            progress(i + 1, len(positions))
+    return labeled
+
+
+# Simpan / muat posisi berlabel (.npz), agar fit bisa diulang tanpa self-play ulang. Papan 8x8.
+def save_positions(path, positions):
+    np.savez_compressed(path,
+                        black=np.array([p[0] for p in positions], dtype=np.uint64),
+                        white=np.array([p[1] for p in positions], dtype=np.uint64),
+                        white_to_move=np.array([p[2] == 'W' for p in positions]),
+                        score=np.array([p[3] for p in positions], dtype=np.float32))
+
+
+def load_positions(path):
+    data = np.load(path)
+    return [(int(black), int(white), 'W' if side else 'B', float(score))
+            for black, white, side, score in zip(data['black'], data['white'], data['white_to_move'], data['score'])]
+
+
+# --- FIT ---
+# Fitur sudut pandang hitam: selisih bidak per kelas petak, selisih mobility, selisih stabil.
+# Papan 8x8: kelas & mobility dihitung vektor (NumPy, batch engine); stabilitas per posisi.
+def features(positions, size=BOARD_SIZE):
+    geometry = get_geometry(size)
+    masks = square_classes(size)
+    stability = get_stability(geometry)
+    n = len(positions)
+    X = np.zeros((n, len(masks) + 2))
+    if geometry.cells == 64 and size == BOARD_SIZE:
+        from game.batch_board import legal_masks, popcount
+
+        black = np.array([p[0] for p in positions], dtype=np.uint64)
+        white = np.array([p[1] for p in positions], dtype=np.uint64)
+        bits = lambda x: np.unpackbits(x.view(np.uint8).reshape(n, 8), axis=1, bitorder='little')
+        classes = np.zeros((64, len(masks)))
+        for k, mask in enumerate(masks):
+            classes[[i for i in range(64) if mask >> i & 1], k] = 1
+        X[:, :len(masks)] = (bits(black).astype(np.int8) - bits(white)) @ classes
+        X[:, -2] = popcount(legal_masks(black, white)) - popcount(legal_masks(white, black))
+    else:
+        legal_mask = geometry.legal_mask
+        for i, (black, white, _, _) in enumerate(positions):
+            X[i, :len(masks)] = [(black & m).bit_count() - (white & m).bit_count() for m in masks]
+            X[i, -2] = legal_mask(black, white).bit_count() - legal_mask(white, black).bit_count()
+    count = stability.count_stable
+    X[:, -1] = [count(black, white) - count(white, black) for black, white, _, _ in positions]
+    y = np.array([p[3] for p in positions], dtype=np.float64) * EVAL_SCALE
+    phases = np.array([phase_index((p[0] | p[1]).bit_count(), geometry.cells) for p in positions])
+    return X, y, phases
+
+
+# Ridge regression per fase, persamaan normal (X^T X + l2 n I) w = X^T y diselesaikan langsung
+# (l2 relatif terhadap jumlah posisi n, jadi tidak bergantung ukuran data).
+# Mengembalikan (HeuristicWeights, [(jumlah posisi, RMS error dalam bidak)] per fase).
+def fit_weights(positions, size=BOARD_SIZE, l2=1.0):
+    if np is None:
+        raise RuntimeError("Tuning bobot butuh NumPy")
+    X, y, phase_of = features(positions, size)
+    k = X.shape[1] - 2
+    phases = {}
+    errors = []
+    for index, phase in enumerate(PHASES):
+        rows = phase_of == index
+        A = X[rows]
+        b = y[rows]
+        w = np.linalg.solve(A.T @ A + l2 * len(b) * np.eye(A.shape[1]), A.T @ b) if len(b) else np.zeros(k + 2)
+        error = float(np.sqrt(np.mean((A @ w - b) ** 2)) / EVAL_SCALE) if len(b) else 0.0
+        w = np.rint(w).astype(int)
+        phases[phase] = (tuple(int(v) for v in w[:k]), int(w[k]), int(w[k + 1]))
+        errors.append((int(rows.sum()), error))
+    return HeuristicWeights(size, phases), errors
@@ -13,8 +13,12 @@ class GameRenderer:
         self.table_font = pygame.font.SysFont('Consolas', 16)
         self.summary_font = pygame.font.SysFont("Arial", 20, bold=True)
         
+        # Ukuran sel menyesuaikan ukuran papan agar luas papan tetap (8 x CELL_SIZE)
+        self.board_size = game_logic.board.size
+        self.cell_size = (BOARD_SIZE * CELL_SIZE) // self.board_size
+        
         # Hitung posisi papan agar di tengah
-        board_pixel_size = BOARD_SIZE * CELL_SIZE
+        board_pixel_size = self.board_size * self.cell_size
         self.board_x = (screen.get_width() - board_pixel_size) // 2
         self.board_y = (screen.get_height() - board_pixel_size) // 2
 
@@ -49,27 +53,34 @@ class GameRenderer:
         pygame.display.flip()
 
     def draw_board(self, game_over):
-        pygame.draw.rect(self.screen, DARK_GREEN, (self.board_x - 5, self.board_y - 5, BOARD_SIZE * CELL_SIZE + 10, BOARD_SIZE * CELL_SIZE + 10))
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                cell_rect = pygame.Rect(self.board_x + col * CELL_SIZE, self.board_y + row * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+        cell = self.cell_size
+        board_px = self.board_size * cell
+        pygame.draw.rect(self.screen, DARK_GREEN, (self.board_x - 5, self.board_y - 5, board_px + 10, board_px + 10))
+        
+        # Langkah valid (Hints) dihitung sekali per frame, bukan 64x is_valid_move
+        hints = set()
+        if not game_over and (self.game_logic.game_mode == 'pvp' or (self.game_logic.game_mode == 'pvb' and self.game_logic.board.current_player == 'B')):
+            hints = {move for move, _ in self.game_logic.board.generate_moves(self.game_logic.board.current_player)}
+        
+        for row in range(self.board_size):
+            for col in range(self.board_size):
+                cell_rect = pygame.Rect(self.board_x + col * cell, self.board_y + row * cell, cell, cell)
                 pygame.draw.rect(self.screen, GREEN, cell_rect)
                 pygame.draw.rect(self.screen, BLACK, cell_rect, 1)
                 
                 piece = self.game_logic.board.board[row][col]
                 if piece:
                     color = BLACK if piece == 'B' else WHITE
-                    pygame.draw.circle(self.screen, color, (cell_rect.centerx, cell_rect.centery), CELL_SIZE // 2 - 5)
+                    pygame.draw.circle(self.screen, color, (cell_rect.centerx, cell_rect.centery), cell // 2 - 5)
                 
                 # Highlight langkah valid (Hints)
-                if not game_over and (self.game_logic.game_mode == 'pvp' or (self.game_logic.game_mode == 'pvb' and self.game_logic.board.current_player == 'B')):
-                    if self.game_logic.board.is_valid_move(row, col, self.game_logic.board.current_player):
-                        pygame.draw.circle(self.screen, RED, (cell_rect.centerx, cell_rect.centery), 5)
+                if (row, col) in hints:
+                    pygame.draw.circle(self.screen, RED, (cell_rect.centerx, cell_rect.centery), 5)
 
     def draw_player_info(self):
         cp = "Black (B)" if self.game_logic.board.current_player == 'B' else "White (W)"
         bs, ws = self.game_logic.board.get_score()
-        info_y = self.board_y + BOARD_SIZE * CELL_SIZE + 20
+        info_y = self.board_y + self.board_size * self.cell_size + 20
         
         self.screen.blit(self.font.render(f"Giliran: {cp}", True, WHITE), (self.board_x, info_y))
         self.screen.blit(self.font.render(f"Black: {bs}  -  White: {ws}", True, WHITE), (self.board_x, info_y + 30))
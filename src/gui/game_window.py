@@ -7,10 +7,10 @@ from gui.game_renderer import GameRenderer
 
 class GameWindow:
     # --- UPDATE DI SINI: Tambahkan parameter mcts_iterations=1000 ---
-    def __init__(self, screen, game_mode='pvp', ai_difficulty='medium', num_games=1, ai_depth=3, ai_time_limit=None, bot_config=None, mcts_iterations=1000):
+    def __init__(self, screen, game_mode='pvp', ai_difficulty='medium', num_games=1, ai_depth=3, ai_time_limit=None, bot_config=None, mcts_iterations=1000, board_size=BOARD_SIZE):
         self.screen = screen
-        # Pass parameter mcts_iterations ke GameLogic
-        self.game_logic = GameLogic(game_mode, ai_difficulty, num_games, ai_depth, ai_time_limit, bot_config, mcts_iterations)
+        # Pass parameter mcts_iterations & ukuran papan ke GameLogic
+        self.game_logic = GameLogic(game_mode, ai_difficulty, num_games, ai_depth, ai_time_limit, bot_config, mcts_iterations, board_size)
         self.clock = pygame.time.Clock()
         
         self.renderer = GameRenderer(screen, self.game_logic)
@@ -28,6 +28,7 @@ class GameWindow:
         
         self.renderer.draw()
         self.handle_pass_condition()
+        self.game_logic.start_pondering()
 
         while running:
             current_time = time.time()
@@ -50,6 +51,9 @@ class GameWindow:
             mouse_pos = pygame.mouse.get_pos()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT: running = False
+                # Spasi: paksa AI langsung memakai langkah terbaik sementaranya
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                    self.game_logic.force_ai_move()
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     if self.renderer.back_button_rect.collidepoint(mouse_pos): running = False
                     
@@ -72,20 +76,26 @@ class GameWindow:
                                     self._set_game_over()
                                 else: self.handle_pass_condition()
 
+            # AI berpikir di thread latar (anytime API); loop GUI tetap jalan tiap frame
             if (not self.game_over and self.game_logic.game_mode in ['pvb', 'bvb', 'bvb_compare'] and current_time - last_ai_move_time > ai_move_delay):
                 cp = self.game_logic.board.current_player
                 is_ai = (self.game_logic.game_mode == 'pvb' and cp == 'W') or (self.game_logic.game_mode in ['bvb', 'bvb_compare'])
-                if is_ai:
-                    if self.game_logic.ai_move():
-                        last_ai_move_time = current_time
-                        self.renderer.draw(self.game_over, self.game_over_time)
-                        if self.game_logic.check_game_over():
-                            self._set_game_over()
-                        else: self.handle_pass_condition()
+                if is_ai and not self.game_logic.is_ai_thinking():
+                    self.game_logic.start_ai_move()
+
+            if self.game_logic.poll_ai_move():
+                last_ai_move_time = current_time
+                self.renderer.draw(self.game_over, self.game_over_time)
+                if self.game_logic.check_game_over():
+                    self._set_game_over()
+                else: self.handle_pass_condition()
             
             self.renderer.draw(self.game_over, self.game_over_time)
             self.clock.tick(60)
 
+        self.game_logic.cancel_ai_move()
+        self.game_logic.stop_pondering()
+
     def _set_game_over(self):
         self.game_logic.record_game_result()
         self.game_over = True
@@ -118,16 +128,9 @@ class GameWindow:
                 "winner": "Black" if res['winner'] == 'B' else ("White" if res['winner'] == 'W' else "Draw"),
                 "score_black": res['b_score'],
                 "score_white": res['w_score'],
-                "black_stats": {
-                    "avg_depth": round(res['b_stats']['avg_depth'], 2),
-                    "avg_time": round(res['b_stats']['avg_time'], 4),
-                    "max_depth": res['b_stats']['max_depth']
-                },
-                "white_stats": {
-                    "avg_depth": round(res['w_stats']['avg_depth'], 2),
-                    "avg_time": round(res['w_stats']['avg_time'], 4),
-                    "max_depth": res['w_stats']['max_depth']
-                }
+                "black_stats": self._round_stats(res['b_stats']),
+                "white_stats": self._round_stats(res['w_stats']),
+                "moves": res['moves'] # Hex, 1 byte per langkah (game.codec.decode_game)
             }
             detailed_games.append(game_detail)
 
@@ -140,18 +143,33 @@ class GameWindow:
             "ai_config": {
                 "black": black_n, 
                 "white": white_n, 
-                "time_limit": self.game_logic.ai_time_limit
+                "time_limit": self.game_logic.ai_time_limit,
+                "board_size": self.game_logic.board_size
             },
             "winner": "Black" if b_wins > w_wins else ("White" if w_wins > b_wins else "Seri"),
             "games": detailed_games 
         }
         save_game_history(data)
         
+    # Ringkasan statistik per pemain (GameLogic.get_match_stats) untuk JSON riwayat
+    def _round_stats(self, stats):
+        rounded = {
+            "avg_depth": round(stats['avg_depth'], 2),
+            "avg_time": round(stats['avg_time'], 4),
+            "max_depth": stats['max_depth']
+        }
+        for key, value in stats.items():
+            if key not in rounded:
+                rounded[key] = round(value, 4) if isinstance(value, float) else value
+        return rounded
+
     def get_board_position(self, mouse_pos):
         bx, by = self.renderer.board_x, self.renderer.board_y
+        cell = self.renderer.cell_size
+        board_px = self.renderer.board_size * cell
         mx, my = mouse_pos
-        if bx <= mx < bx + BOARD_SIZE * CELL_SIZE and by <= my < by + BOARD_SIZE * CELL_SIZE:
-            return (my - by) // CELL_SIZE, (mx - bx) // CELL_SIZE
+        if bx <= mx < bx + board_px and by <= my < by + board_px:
+            return (my - by) // cell, (mx - bx) // cell
         return None, None
 
     def handle_pass_condition(self):
@@ -161,4 +179,4 @@ class GameWindow:
             self.renderer.draw_pass_message(cp) # Panggil pesan PASS
             pygame.display.flip()
             time.sleep(1.5)
-            self.game_logic.board.current_player = 'W' if cp == 'B' else 'B'
\ No newline at end of file
+            self.game_logic.pass_turn()
\ No newline at end of file
@@ -14,6 +14,7 @@ class MainMenu:
         
         self.selected_depth = 3
         self.selected_time = None
+        self.selected_board_size = BOARD_SIZE
         self.temp_game_mode = None
         self.temp_ai_difficulty = None
         
@@ -31,7 +32,8 @@ class MainMenu:
             Button(center_x, start_y + gap, button_width, button_height, "Player vs Bot"),
             Button(center_x, start_y + gap*2, button_width, button_height, "Bot vs Bot (Custom)"),
             Button(center_x, start_y + gap*3, button_width, button_height, "Riwayat BvB"),
-            Button(center_x, start_y + gap*4, button_width, button_height, "Keluar Game")
+            Button(center_x, start_y + gap*4, button_width, button_height, self._board_size_label()),
+            Button(center_x, start_y + gap*5, button_width, button_height, "Keluar Game")
         ]
         
         self.difficulty_buttons = [
@@ -62,6 +64,9 @@ class MainMenu:
 
         self.current_menu = "main"  
     
+    def _board_size_label(self):
+        return f"Papan: {self.selected_board_size}x{self.selected_board_size}"
+
     def run(self):
         running = True
         while running:
@@ -84,7 +89,7 @@ class MainMenu:
         for i, button in enumerate(self.buttons):
             button.check_hover(mouse_pos)
             if button.is_clicked(mouse_pos, event):
-                if i == 0: GameWindow(self.screen, 'pvp').run()
+                if i == 0: GameWindow(self.screen, 'pvp', board_size=self.selected_board_size).run()
                 elif i == 1: self.temp_game_mode = 'pvb'; self.current_menu = "pvb_difficulty"
                 elif i == 2: 
                     self.temp_game_mode = 'bvb_compare'
@@ -95,7 +100,12 @@ class MainMenu:
                     self.btn_white_algo.text = "White: AlphaBeta"
                     self.current_menu = "settings"
                 elif i == 3: HistoryWindow(self.screen).run()
-                elif i == 4: self.current_menu = "exit"
+                elif i == 4:
+                    # Siklus ukuran papan (6x6, 8x8, 10x10, 16x16)
+                    idx = SUPPORTED_BOARD_SIZES.index(self.selected_board_size)
+                    self.selected_board_size = SUPPORTED_BOARD_SIZES[(idx + 1) % len(SUPPORTED_BOARD_SIZES)]
+                    button.text = self._board_size_label()
+                elif i == 5: self.current_menu = "exit"
 
     def handle_pvb_difficulty_menu(self, event, mouse_pos):
         for i, button in enumerate(self.difficulty_buttons):
@@ -147,7 +157,7 @@ class MainMenu:
                     'white': self.white_choice
                 }
             
-            GameWindow(self.screen, self.temp_game_mode, self.temp_ai_difficulty, num, self.selected_depth, final_time, bot_config, final_iter).run()
+            GameWindow(self.screen, self.temp_game_mode, self.temp_ai_difficulty, num, self.selected_depth, final_time, bot_config, final_iter, self.selected_board_size).run()
             self.current_menu = "main"
             
         if self.btn_settings_back.is_clicked(mouse_pos, event):
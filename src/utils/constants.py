@@ -26,4 +26,32 @@ BOARD_WEIGHTS = [
     [ 20,  -5,  15,   3,   3,  15,  -5,  20],
     [-20, -40,  -5,  -5,  -5,  -5, -40, -20],
     [120, -20,  20,   5,   5,  20, -20, 120],
-]
\ No newline at end of file
+]
+
+# Ukuran papan yang didukung (genap, posisi awal di tengah)
+SUPPORTED_BOARD_SIZES = (6, 8, 10, 16)
+
+# Bobot posisi untuk ukuran papan apa pun, dengan kelas petak yang sama seperti BOARD_WEIGHTS:
+# pojok, C (sebelah pojok di tepi), X (diagonal pojok), A (tepi 2 petak dari pojok), tepi lain,
+# ring kedua, "sweet 16" (diagonal dalam) dan tengah. Untuk 8x8 hasilnya sama dengan BOARD_WEIGHTS.
+def generate_board_weights(size):
+    if size == 8:
+        return [row[:] for row in BOARD_WEIGHTS]
+    last = size - 1
+    weights = []
+    for r in range(size):
+        row = []
+        for c in range(size):
+            dr = min(r, last - r)
+            dc = min(c, last - c)
+            if dr == 0 and dc == 0: w = 120
+            elif (dr, dc) in ((0, 1), (1, 0)): w = -20
+            elif dr == 1 and dc == 1: w = -40
+            elif (dr, dc) in ((0, 2), (2, 0)): w = 20
+            elif dr == 0 or dc == 0: w = 5
+            elif dr == 1 or dc == 1: w = -5
+            elif dr == 2 and dc == 2: w = 15
+            else: w = 3
+            row.append(w)
+        weights.append(row)
+    return weights